@@ -34,11 +34,32 @@ CONNECTIONS = {
         'options': {
             'charset': 'utf8mb4',
         },
+        'pool': {
+            'min': 1,
+            'max': 10,
+            'timeout': 30,
+            'recycle': 3600,
+            'idle_timeout': 600,
+            'ping_interval': 30,
+        },
+        # Off by default. When enabled, queries with bindings run as server side
+        # prepared statements and connections allow multi statement queries so the
+        # PREPARE, SET and EXECUTE of a query are sent in a single round trip.
+        'prepared_statements': {
+            'enabled': False,
+            'max': 256,
+        },
     },
     'sqlite': {
         'driver': 'sqlite',
         'database': 'orm.db',
-        'prefix': ''
+        'prefix': '',
+        'pragmas': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -64000,
+            'mmap_size': 268435456,
+        },
     }
 }
 
@@ -32,7 +32,8 @@ setup(
     # requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=[
-        'inflection==0.3.1'
+        'inflection==0.3.1',
+        'contextvars;python_version<"3.7"',
     ],
 
     # See https://pypi.python.org/pypi?%3Aaction=list_classifiers
@@ -75,9 +76,11 @@ setup(
         'masonite.orm',
         'masonite.orm.blueprint',
         'masonite.orm.builder',
+        'masonite.orm.cache',
         'masonite.orm.collection',
         'masonite.orm.commands',
         'masonite.orm.connections',
+        'masonite.orm.events',
         'masonite.orm.expressions',
         'masonite.orm.factories',
         'masonite.orm.grammar',
@@ -0,0 +1,372 @@
+import asyncio
+
+from ..connections.AsyncConnection import AsyncConnection
+from .QueryBuilder import CACHE_MISS, QueryBuilder
+
+
+class AsyncQueryBuilder(QueryBuilder):
+    """A query builder whose terminal methods are coroutines.
+
+    Queries are built and compiled exactly like the QueryBuilder class. Only the
+    database round trips are awaited, on the worker threads of an AsyncConnection.
+    Results can also be streamed with 'async for'.
+    """
+
+    def get_async_connection(self):
+        """Gets the awaitable connection of the connection class.
+
+        Returns:
+            masonite.orm.connections.AsyncConnection
+        """
+        return AsyncConnection(self.connection)
+
+    async def get(self):
+        """Runs the select query built from the query builder.
+
+        Returns:
+            Collection
+        """
+        self.set_action("select")
+        eagers = self._eager_loads
+        compact = self._compact
+        result = await self._fetch("query_tuples" if compact else "query")
+        models = self._hydrate_results(result, compact)
+        if eagers:
+            await self._run_in_executor(self._load_eagers, models, eagers)
+
+        return models
+
+    async def first(self, query=False):
+        """Gets the first record.
+
+        Returns:
+            Model|None
+        """
+        self.set_action("select")
+        if query:
+            return self.limit(1)
+
+        if self._compact:
+            return (await self.limit(1).get()).first()
+
+        eagers = self._eager_loads
+        result = await self.limit(1)._fetch(results=1)
+        model = self._hydrate_first(result)
+        if eagers and result:
+            await self._run_in_executor(self._load_eagers, [model], eagers)
+
+        return model
+
+    async def all(self):
+        """Returns all records from the table.
+
+        Returns:
+            Collection
+        """
+        return await self.get()
+
+    async def values(self, *columns):
+        """Runs the select query and returns the rows as dictionaries without hydrating models.
+
+        Arguments:
+            columns {string} -- The columns to select. Selects the columns already on the query when empty.
+
+        Returns:
+            list -- A list of dictionaries.
+        """
+        names, rows = await self._select_tuples(columns)
+        return [dict(zip(names, row)) for row in rows]
+
+    async def values_list(self, *columns, flat=False):
+        """Runs the select query and returns the rows as tuples without hydrating models.
+
+        Arguments:
+            columns {string} -- The columns to select. Selects the columns already on the query when empty.
+
+        Keyword Arguments:
+            flat {bool} -- Returns a list of values instead of tuples when selecting a single column. (default: {False})
+
+        Returns:
+            list -- A list of tuples or values.
+        """
+        if flat and len(columns) != 1:
+            raise ValueError("'flat' can only be used when selecting a single column")
+
+        _, rows = await self._select_tuples(columns)
+        if flat:
+            return [row[0] for row in rows]
+
+        return list(rows)
+
+    async def pluck_column(self, column):
+        """Runs the select query and returns the values of a single column.
+
+        Arguments:
+            column {string} -- The column to select.
+
+        Returns:
+            list -- A list of values.
+        """
+        return await self.values_list(column, flat=True)
+
+    async def chunk(self, size, callback, column="id"):
+        """Runs the select query in chunks and passes each chunk of models to a callback.
+
+        The callback may be a coroutine function.
+
+        Arguments:
+            size {int} -- The number of models in each chunk.
+            callback {callable} -- Called with a collection of models. Returning False stops the chunking.
+
+        Keyword Arguments:
+            column {string} -- A unique, ordered column used to page through the table. (default: {"id"})
+
+        Returns:
+            bool -- False if the callback stopped the chunking, otherwise True.
+        """
+        async for models in self.chunk_by_id(size, column=column):
+            result = callback(models)
+            if asyncio.iscoroutine(result):
+                result = await result
+            if result is False:
+                return False
+
+        return True
+
+    async def _chunk_pages(self, size, key, page, next_page, eagers):
+        connection = self.get_async_connection()
+        query, bindings = page
+        while True:
+            result = await connection.query(query, bindings) or []
+            if not result:
+                return
+
+            models = self.owner.new_collection(result).map_into(self.owner, "hydrate")
+            if eagers:
+                await self._run_in_executor(self._load_eagers, models, eagers)
+
+            yield models
+
+            if len(result) < size:
+                return
+
+            query, bindings, index = next_page
+            bindings = bindings[:index] + (result[-1][key],) + bindings[index + 1 :]
+
+    async def create(self, creates={}, query=False, **kwargs):
+        """Inserts a record, or many records when given a list of dictionaries.
+
+        Arguments:
+            creates {dict|list} -- A dictionary of columns and values or a list of dictionaries.
+
+        Returns:
+            mixed
+        """
+        if not creates:
+            creates = kwargs
+        if isinstance(creates, (list, tuple)):
+            return await self.insert_many(creates, query=query)
+
+        super().create(creates, query=True)
+        if query:
+            return self
+
+        result = await self.get_async_connection().query(
+            self.to_qmark(), self._bindings
+        )
+        self._forget_cached_results()
+        return result
+
+    async def insert_many(self, rows, chunk_size=None, query=False):
+        """Inserts a list of dictionaries using multi row insert statements.
+
+        Arguments:
+            rows {list} -- A list of dictionaries which all have the same columns.
+
+        Keyword Arguments:
+            chunk_size {int} -- The maximum number of rows per statement. (default: {None})
+            query {bool} -- Whether to return the builder instead of executing. (default: {False})
+
+        Returns:
+            int|self -- The number of rows inserted or the builder when query is True.
+        """
+        super().insert_many(rows, query=True)
+        if query:
+            return self
+
+        return await self._execute_rows(chunk_size)
+
+    async def upsert(
+        self, rows, unique_by, update_columns=None, chunk_size=None, query=False
+    ):
+        """Inserts a list of dictionaries, updating the existing rows that have the same unique keys.
+
+        Arguments:
+            rows {list} -- A list of dictionaries which all have the same columns.
+            unique_by {string|list} -- The column or columns of the unique index the rows conflict on.
+
+        Keyword Arguments:
+            update_columns {list} -- The columns updated on existing rows. (default: {None})
+            chunk_size {int} -- The maximum number of rows per statement. (default: {None})
+            query {bool} -- Whether to return the builder instead of executing. (default: {False})
+
+        Returns:
+            int|self -- The number of rows upserted or the builder when query is True.
+        """
+        super().upsert(rows, unique_by, update_columns, query=True)
+        if query:
+            return self
+
+        return await self._execute_rows(chunk_size)
+
+    async def bulk_update(
+        self, rows, key="id", columns=None, chunk_size=None, query=False
+    ):
+        """Updates many rows with different values using CASE expressions on a key.
+
+        Arguments:
+            rows {list} -- A list of dictionaries or models. Each one must contain the key.
+
+        Keyword Arguments:
+            key {string} -- The column the rows are matched on. (default: {"id"})
+            columns {list} -- The columns to update. (default: {None})
+            chunk_size {int} -- The maximum number of rows per statement. (default: {None})
+            query {bool} -- Whether to return the builder instead of executing. (default: {False})
+
+        Returns:
+            int|self -- The number of rows given or the builder when query is True.
+        """
+        super().bulk_update(rows, key, columns, query=True)
+        if query:
+            return self
+
+        return await self._execute_rows(chunk_size)
+
+    async def _execute_rows(self, chunk_size=None):
+        rows = self._creates
+        if not rows:
+            self.boot()
+            return 0
+
+        connection = self.get_async_connection()
+        for statement, bindings in self._compile_insert_chunks(chunk_size):
+            await connection.query(statement, bindings)
+
+        self._forget_cached_results()
+        return len(rows)
+
+    async def update(self, updates: dict, dry=False):
+        """Updates the records matching the query.
+
+        Arguments:
+            updates {dictionary} -- A dictionary of columns and values to update.
+
+        Keyword Arguments:
+            dry {bool} -- Whether the query should be executed. (default: {False})
+
+        Returns:
+            mixed
+        """
+        super().update(updates, dry=True)
+        if dry:
+            return self
+
+        query = self.to_qmark()
+        result = await self.get_async_connection().query(query, self._bindings)
+        self._forget_cached_results()
+        return result
+
+    async def delete(self, column=None, value=None, query=False):
+        """Deletes the records matching the query.
+
+        Keyword Arguments:
+            column {string} -- The name of the column (default: {None})
+            value {string|int} -- The value of the column (default: {None})
+
+        Returns:
+            mixed
+        """
+        super().delete(column, value, query=True)
+        if query:
+            return self
+
+        query = self.to_qmark()
+        result = await self.get_async_connection().query(query, self._bindings)
+        self._forget_cached_results()
+        return result
+
+    def lazy(self, chunk_size=1000):
+        """Runs the select query and yields hydrated models while streaming the rows.
+
+        Rows are hydrated like the results of 'get'.
+
+        Keyword Arguments:
+            chunk_size {int} -- The number of rows fetched at a time. (default: {1000})
+
+        Returns:
+            async generator -- Yields a model for each row.
+        """
+        self.set_action("select")
+        eagers = self._eager_loads
+        compact = self._compact
+        query = self.to_qmark()
+
+        return self._stream_models(query, self._bindings, chunk_size, eagers, compact)
+
+    def cursor(self):
+        """Runs the select query and yields hydrated models one at a time.
+
+        Returns:
+            async generator -- Yields a model for each row.
+        """
+        return self.lazy()
+
+    async def _stream_models(self, query, bindings, chunk_size, eagers, compact=False):
+        stream = self.get_async_connection().stream(
+            query, bindings, chunk_size=chunk_size
+        )
+        if not eagers:
+            async for row in stream:
+                yield self._hydrate_stream_chunk([row], None, compact)[0]
+            return
+
+        rows = []
+        async for row in stream:
+            rows.append(row)
+            if len(rows) == chunk_size:
+                for model in await self._hydrate_async_chunk(rows, eagers, compact):
+                    yield model
+                rows = []
+
+        if rows:
+            for model in await self._hydrate_async_chunk(rows, eagers, compact):
+                yield model
+
+    async def _hydrate_async_chunk(self, rows, eagers, compact):
+        models = self._hydrate_stream_chunk(rows, None, compact)
+        if eagers:
+            await self._run_in_executor(self._load_eagers, models, eagers)
+
+        return models
+
+    def __aiter__(self):
+        return self.cursor()
+
+    async def _fetch(self, method="query", **options):
+        query, bindings, remember = self._compile_fetch(method, options)
+        if remember is not None:
+            result = self.result_cache.get(remember[0], CACHE_MISS)
+            if result is not CACHE_MISS:
+                return result
+
+        result = await self.get_async_connection().run(
+            method, query, bindings, **options
+        )
+        self._remember_result(remember, result)
+        return result
+
+    async def _run_in_executor(self, fn, *args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.get_async_connection().get_executor(), lambda: fn(*args)
+        )
@@ -1,5 +1,9 @@
+import contextvars
+import functools
+import hashlib
 import inspect
 
+from ..cache import IdentityMap, MemoryCache
 from ..collection.Collection import Collection
 from ..expressions.expressions import (
     SubGroupExpression,
@@ -10,7 +14,11 @@ from ..expressions.expressions import (
     UpdateQueryExpression,
     JoinExpression,
     HavingExpression,
+    Param,
 )
+from .QueryTemplate import QueryTemplate
+
+CACHE_MISS = object()
 
 
 class QueryBuilder:
@@ -19,6 +27,20 @@ class QueryBuilder:
 
     _action = "select"
 
+    """The clauses are appended to lists while the query is built and are only frozen
+    into tuples when the query is compiled."""
+    _clauses = (
+        "_columns",
+        "_wheres",
+        "_order_by",
+        "_group_by",
+        "_joins",
+        "_having",
+        "_aggregates",
+    )
+
+    result_cache = MemoryCache(maxsize=1024)
+
     def __init__(
         self,
         grammar=None,
@@ -147,7 +169,11 @@ class QueryBuilder:
             self
         """
         if attribute in self._scopes:
-            return getattr(self._scopes[attribute], attribute)
+            scope = getattr(self._scopes[attribute], attribute)
+            if hasattr(scope, "apply"):
+                return functools.partial(scope.apply, self)
+
+            return scope
 
         raise AttributeError(
             "'QueryBuilder' object has no attribute '{}'".format(attribute)
@@ -156,7 +182,7 @@ class QueryBuilder:
     def boot(self):
         """Sets various attributes on the query builder class.
         """
-        self._columns = ()
+        self._columns = []
         self._creates = {}
 
         self._sql = ""
@@ -165,16 +191,21 @@ class QueryBuilder:
 
         self._updates = {}
 
-        self._wheres = ()
-        self._order_by = ()
-        self._group_by = ()
-        self._joins = ()
-        self._having = ()
+        self._wheres = []
+        self._order_by = []
+        self._group_by = []
+        self._joins = []
+        self._having = []
 
-        self._aggregates = ()
+        self._aggregates = []
 
         self._limit = False
         self._offset = False
+        self._keys = ()
+        self._update_columns = ()
+        self._eager_loads = ()
+        self._compact = False
+        self._remember = None
         self.set_action("select")
 
     def select(self, *args):
@@ -184,7 +215,7 @@ class QueryBuilder:
             self
         """
         for column in args:
-            self._columns += (SelectExpression(column),)
+            self._columns.append(SelectExpression(column))
         return self
 
     def select_raw(self, string):
@@ -193,26 +224,272 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._columns += (SelectExpression(string, raw=True),)
+        self._columns.append(SelectExpression(string, raw=True))
         return self
 
     def create(self, creates={}, query=False, **kwargs):
         """Specifies a dictionary that should be used to create new values.
 
         Arguments:
-            creates {dict} -- A dictionary of columns and values.
+            creates {dict|list} -- A dictionary of columns and values or a list of dictionaries.
 
         Returns:
             self
         """
         if not creates:
             creates = kwargs
+        if isinstance(creates, (list, tuple)):
+            return self.insert_many(creates, query=query)
+
         self.set_action("insert")
         self._creates.update(creates)
         if query:
             return self
 
-        return self.connection().make_connection().query(self.to_sql(), self._bindings)
+        result = (
+            self.connection().make_connection().query(self.to_qmark(), self._bindings)
+        )
+        self._forget_cached_results()
+        return result
+
+    def insert_many(self, rows, chunk_size=None, query=False):
+        """Inserts a list of dictionaries using multi row insert statements.
+
+        The rows are split into chunks so each statement stays under the
+        parameter limit of the grammar.
+
+        Arguments:
+            rows {list} -- A list of dictionaries which all have the same columns.
+
+        Keyword Arguments:
+            chunk_size {int} -- The maximum number of rows per statement. (default: {None})
+            query {bool} -- Whether to return the builder instead of executing. (default: {False})
+
+        Raises:
+            ValueError: Raised when the rows do not all have the same columns.
+
+        Returns:
+            int|self -- The number of rows inserted or the builder when query is True.
+        """
+        rows = self._get_rows(rows, "insert_many")
+
+        self.set_action("insert")
+        self._creates = rows
+        if query:
+            return self
+
+        return self._execute_rows(chunk_size)
+
+    def upsert(
+        self, rows, unique_by, update_columns=None, chunk_size=None, query=False
+    ):
+        """Inserts a list of dictionaries, updating the existing rows that have the same unique keys.
+
+        Compiles to 'INSERT ... ON DUPLICATE KEY UPDATE' on MySQL, 'INSERT ... ON CONFLICT'
+        on SQLite and 'MERGE' on MSSQL.
+
+        Arguments:
+            rows {list} -- A list of dictionaries which all have the same columns.
+            unique_by {string|list} -- The column or columns of the unique index the rows conflict on.
+
+        Keyword Arguments:
+            update_columns {list} -- The columns updated on existing rows. Every column
+                    that is not part of the unique keys when omitted. (default: {None})
+            chunk_size {int} -- The maximum number of rows per statement. (default: {None})
+            query {bool} -- Whether to return the builder instead of executing. (default: {False})
+
+        Raises:
+            ValueError: Raised when the rows do not all have the same columns or there is nothing to update.
+
+        Returns:
+            int|self -- The number of rows upserted or the builder when query is True.
+        """
+        rows = self._get_rows(rows, "upsert")
+        keys = (unique_by,) if isinstance(unique_by, str) else tuple(unique_by)
+        columns = list(rows[0]) if rows else []
+        if update_columns is None:
+            update_columns = [column for column in columns if column not in keys]
+
+        if rows and (not update_columns or not set(keys).issubset(columns)):
+            raise ValueError(
+                "The rows passed to 'upsert' must contain the unique keys and at least one column to update"
+            )
+
+        self.set_action("upsert")
+        self._creates = rows
+        self._keys = keys
+        self._update_columns = tuple(update_columns)
+        if query:
+            return self
+
+        return self._execute_rows(chunk_size)
+
+    def bulk_update(self, rows, key="id", columns=None, chunk_size=None, query=False):
+        """Updates many rows with different values using CASE expressions on a key.
+
+        The updated columns of the models are no longer dirty once the update succeeds.
+
+        Arguments:
+            rows {list} -- A list of dictionaries or models. Each one must contain the key.
+
+        Keyword Arguments:
+            key {string} -- The column the rows are matched on. (default: {"id"})
+            columns {list} -- The columns to update. Every column of the dictionaries
+                    or the dirty attributes of the models when omitted. (default: {None})
+            chunk_size {int} -- The maximum number of rows per statement. (default: {None})
+            query {bool} -- Whether to return the builder instead of executing. (default: {False})
+
+        Raises:
+            ValueError: Raised when a row is missing the key or one of the columns.
+
+        Returns:
+            int|self -- The number of rows given or the builder when query is True.
+        """
+        rows = list(rows)
+        if columns is None:
+            columns = []
+            for row in rows:
+                names = row if isinstance(row, dict) else row.__dirty_attributes__
+                for name in names:
+                    if name != key and name not in columns:
+                        columns.append(name)
+
+        names = [key] + [column for column in columns if column != key]
+        records = []
+        for row in rows:
+            if not isinstance(row, dict):
+                row = self._get_model_values(row)
+            try:
+                records.append({name: row[name] for name in names})
+            except KeyError:
+                raise ValueError(
+                    "Every row passed to 'bulk_update' must contain the key and the updated columns"
+                )
+
+        models = [row for row in rows if not isinstance(row, dict)]
+        rows = records
+        if rows and len(names) == 1:
+            raise ValueError("'bulk_update' needs at least one column to update")
+
+        self.set_action("bulk_update")
+        self._creates = rows
+        self._keys = (key,)
+        self._update_columns = tuple(names[1:])
+        if query:
+            return self
+
+        count = self._execute_rows(chunk_size)
+        for model in models:
+            model._sync_attributes(names[1:])
+
+        return count
+
+    @staticmethod
+    def _get_model_values(model):
+        """Gets the attributes of a model with its dirty attributes applied.
+
+        Arguments:
+            model {masonite.orm.models.Model} -- A model instance.
+
+        Returns:
+            dict
+        """
+        values = dict(model.__attributes__)
+        values.update(model.__dirty_attributes__)
+        return values
+
+    @staticmethod
+    def _get_rows(rows, method):
+        """Copies a list of rows, making sure they all have the same columns.
+
+        Arguments:
+            rows {list} -- A list of dictionaries.
+            method {string} -- The name of the method the rows were passed to.
+
+        Raises:
+            ValueError: Raised when the rows do not all have the same columns.
+
+        Returns:
+            list
+        """
+        rows = [dict(row) for row in rows]
+        columns = set(rows[0]) if rows else set()
+        for row in rows:
+            if set(row) != columns:
+                raise ValueError(
+                    "Every row passed to '{}' must have the same columns".format(method)
+                )
+
+        return rows
+
+    def _execute_rows(self, chunk_size=None):
+        """Runs the statements compiled for the rows of an insert, upsert or bulk update.
+
+        Keyword Arguments:
+            chunk_size {int} -- The maximum number of rows per statement. (default: {None})
+
+        Returns:
+            int -- The number of rows.
+        """
+        rows = self._creates
+        if not rows:
+            self.boot()
+            return 0
+
+        for statement, bindings in self._compile_insert_chunks(chunk_size):
+            self.connection().make_connection().query(statement, bindings)
+
+        self._forget_cached_results()
+        return len(rows)
+
+    def _compile_insert_chunks(self, chunk_size=None):
+        """Compiles the rows of an insert, upsert or bulk update into statements
+        that each stay under the parameter limit.
+
+        Keyword Arguments:
+            chunk_size {int} -- The maximum number of rows per statement. (default: {None})
+
+        Returns:
+            list -- A list of (query, bindings) tuples.
+        """
+        self._apply_global_scopes()
+        rows = self._creates
+        action = self._action
+
+        if action == "bulk_update":
+            parameters = 2 * len(self._update_columns) + 1
+        else:
+            parameters = len(rows[0])
+
+        statements = []
+        size = self._get_insert_chunk_size(parameters, chunk_size)
+        for index in range(0, len(rows), size):
+            self._creates = rows[index : index + size]
+            grammar = self.get_grammar().compile(action, qmark=True)
+            statements.append((grammar.to_qmark(), grammar._bindings))
+
+        self.boot()
+        return statements
+
+    def _get_insert_chunk_size(self, columns, chunk_size=None):
+        """Gets the number of rows that fit in one insert statement.
+
+        Arguments:
+            columns {int} -- The number of bindings for each row.
+
+        Keyword Arguments:
+            chunk_size {int} -- A requested maximum number of rows. (default: {None})
+
+        Returns:
+            int
+        """
+        size = max(1, self.grammar.parameter_limit // max(1, columns))
+        if self.grammar.insert_row_limit:
+            size = min(size, self.grammar.insert_row_limit)
+        if chunk_size:
+            size = min(size, chunk_size)
+
+        return size
 
     def delete(self, column=None, value=None, query=False):
         """Specify the column and value to delete
@@ -235,7 +512,10 @@ class QueryBuilder:
         if query:
             return self
 
-        return self.connection().make_connection().query(self.to_sql(), self._bindings)
+        query = self.to_qmark()
+        result = self.connection().make_connection().query(query, self._bindings)
+        self._forget_cached_results()
+        return result
 
     def where(self, column, *args):
         """Specifies a where expression.
@@ -254,22 +534,22 @@ class QueryBuilder:
 
         if inspect.isfunction(column):
             builder = column(self.new())
-            self._wheres += (
-                (QueryExpression(None, operator, SubGroupExpression(builder))),
+            self._wheres.append(
+                QueryExpression(None, operator, SubGroupExpression(builder))
             )
         elif isinstance(value, QueryBuilder):
-            self._wheres += (
-                (QueryExpression(column, operator, SubSelectExpression(value))),
+            self._wheres.append(
+                QueryExpression(column, operator, SubSelectExpression(value))
             )
         else:
-            self._wheres += ((QueryExpression(column, operator, value, "value")),)
+            self._wheres.append(QueryExpression(column, operator, value, "value"))
         return self
 
     def where_raw(self, query: str, bindings=()):
         """Specifies raw SQL that should be injected into the where expression.
 
         Arguments:
-            query {string} -- The raw query string.
+            query {string} -- The raw query string. Values are marked with '?'.
 
         Keyword Arguments:
             bindings {tuple} -- query bindings that should be added to the connection. (default: {()})
@@ -277,7 +557,11 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._wheres += ((QueryExpression(query, "=", None, "value", raw=True)),)
+        self._wheres.append(
+            QueryExpression(
+                query, "=", None, "value", raw=True, bindings=tuple(bindings)
+            )
+        )
         return self
 
     def or_where(self, column: [str, int], *args) -> "self":
@@ -292,12 +576,12 @@ class QueryBuilder:
         """
         operator, value = self._extract_operator_value(*args)
         if isinstance(value, QueryBuilder):
-            self._wheres += (
-                (QueryExpression(column, operator, SubSelectExpression(value))),
+            self._wheres.append(
+                QueryExpression(column, operator, SubSelectExpression(value))
             )
         else:
-            self._wheres += (
-                (QueryExpression(column, operator, value, "value", keyword="or")),
+            self._wheres.append(
+                QueryExpression(column, operator, value, "value", keyword="or")
             )
         return self
 
@@ -311,11 +595,11 @@ class QueryBuilder:
             self
         """
         if isinstance(value, QueryBuilder):
-            self._wheres += (
-                (QueryExpression(None, "EXISTS", SubSelectExpression(value))),
+            self._wheres.append(
+                QueryExpression(None, "EXISTS", SubSelectExpression(value))
             )
         else:
-            self._wheres += ((QueryExpression(None, "EXISTS", value, "value")),)
+            self._wheres.append(QueryExpression(None, "EXISTS", value, "value"))
 
         return self
 
@@ -332,7 +616,7 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._having += ((HavingExpression(column, equality, value)),)
+        self._having.append(HavingExpression(column, equality, value))
         return self
 
     def where_null(self, column):
@@ -370,7 +654,7 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._wheres += (BetweenExpression(column, low, high),)
+        self._wheres.append(BetweenExpression(column, low, high))
         return self
 
     def not_between(self, column: str, low: [str, int], high: [str, int]):
@@ -384,7 +668,9 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._wheres += (BetweenExpression(column, low, high, equality="NOT BETWEEN"),)
+        self._wheres.append(
+            BetweenExpression(column, low, high, equality="NOT BETWEEN")
+        )
         return self
 
     def where_in(self, column, wheres=[]):
@@ -394,18 +680,22 @@ class QueryBuilder:
             column {string} -- The name of the column.
 
         Keyword Arguments:
-            wheres {list} -- A list of values (default: {[]})
+            wheres {list|Param} -- A list of values, or a template parameter that is given the list. (default: {[]})
 
         Returns:
             self
         """
         if isinstance(wheres, QueryBuilder):
-            self._wheres += (
-                (QueryExpression(column, "IN", SubSelectExpression(wheres))),
+            self._wheres.append(
+                QueryExpression(column, "IN", SubSelectExpression(wheres))
+            )
+        elif isinstance(wheres, Param):
+            self._wheres.append(
+                QueryExpression(column, "IN", [Param(wheres.name, expand=True)])
             )
         else:
-            wheres = [str(x) for x in wheres]
-            self._wheres += ((QueryExpression(column, "IN", wheres)),)
+            wheres = [x if isinstance(x, Param) else str(x) for x in wheres]
+            self._wheres.append(QueryExpression(column, "IN", wheres))
         return self
 
     def has(self, *args, **kwargs):
@@ -421,18 +711,22 @@ class QueryBuilder:
             column {string} -- The name of the column.
 
         Keyword Arguments:
-            wheres {list} -- A list of values (default: {[]})
+            wheres {list|Param} -- A list of values, or a template parameter that is given the list. (default: {[]})
 
         Returns:
             self
         """
         if isinstance(wheres, QueryBuilder):
-            self._wheres += (
-                (QueryExpression(column, "NOT IN", SubSelectExpression(wheres))),
+            self._wheres.append(
+                QueryExpression(column, "NOT IN", SubSelectExpression(wheres))
+            )
+        elif isinstance(wheres, Param):
+            self._wheres.append(
+                QueryExpression(column, "NOT IN", [Param(wheres.name, expand=True)])
             )
         else:
-            wheres = [str(x) for x in wheres]
-            self._wheres += ((QueryExpression(column, "NOT IN", wheres)),)
+            wheres = [x if isinstance(x, Param) else str(x) for x in wheres]
+            self._wheres.append(QueryExpression(column, "NOT IN", wheres))
         return self
 
     def join(
@@ -457,8 +751,8 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._joins += (
-            JoinExpression(foreign_table, column1, equality, column2, clause=clause),
+        self._joins.append(
+            JoinExpression(foreign_table, column1, equality, column2, clause=clause)
         )
         return self
 
@@ -474,8 +768,8 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._joins += (
-            JoinExpression(foreign_table, column1, equality, column2, "left"),
+        self._joins.append(
+            JoinExpression(foreign_table, column1, equality, column2, "left")
         )
         return self
 
@@ -491,8 +785,8 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._joins += (
-            JoinExpression(foreign_table, column1, equality, column2, "right"),
+        self._joins.append(
+            JoinExpression(foreign_table, column1, equality, column2, "right")
         )
         return self
 
@@ -506,7 +800,7 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._wheres += ((QueryExpression(column1, "=", column2, "column")),)
+        self._wheres.append(QueryExpression(column1, "=", column2, "column"))
         return self
 
     def limit(self, amount):
@@ -550,7 +844,10 @@ class QueryBuilder:
         if dry:
             return self
 
-        return self.connection().make_connection().query(self.to_sql(), self._bindings)
+        query = self.to_qmark()
+        result = self.connection().make_connection().query(query, self._bindings)
+        self._forget_cached_results()
+        return result
 
     def increment(self, column, value=1):
         """Increments a column's value.
@@ -632,7 +929,7 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._order_by += ((column, direction),)
+        self._order_by.append((column, direction))
         return self
 
     def group_by(self, column):
@@ -644,7 +941,7 @@ class QueryBuilder:
         Returns:
             self
         """
-        self._group_by += (column,)
+        self._group_by.append(column)
         return self
 
     def aggregate(self, aggregate, column):
@@ -654,7 +951,7 @@ class QueryBuilder:
             aggregate {string} -- The name of the aggregation.
             column {string} -- The name of the column to aggregate.
         """
-        self._aggregates += ((aggregate, column),)
+        self._aggregates.append((aggregate, column))
 
     def first(self, query=False):
         """Gets the first record.
@@ -666,11 +963,31 @@ class QueryBuilder:
         if query:
             return self.limit(1)
 
-        return self.owner.hydrate(
-            self.connection()
-            .make_connection()
-            .query(self.limit(1).to_qmark(), self._bindings, results=1)
-        )
+        if self._compact:
+            return self.limit(1).get().first()
+
+        eagers = self._eager_loads
+        result = self.limit(1)._fetch(results=1)
+        model = self._hydrate_first(result)
+        if eagers and result:
+            self._load_eagers([model], eagers)
+
+        return model
+
+    def _hydrate_first(self, result):
+        """Hydrates the result of a query for a single record.
+
+        Arguments:
+            result {dict|None} -- The record.
+
+        Returns:
+            Model|None
+        """
+        model = self.owner.hydrate(result)
+        if result:
+            model = self._add_to_identity_map([model])[0]
+
+        return model
 
     def all(self):
         """Returns all records from the table.
@@ -689,18 +1006,493 @@ class QueryBuilder:
             self
         """
         self.set_action("select")
-        result = (
-            self.connection().make_connection().query(self.to_qmark(), self._bindings)
+        eagers = self._eager_loads
+        compact = self._compact
+        models = self._hydrate_results(
+            self._fetch("query_tuples" if compact else "query"), compact
         )
-        if self.owner._eager_load:
-            for eager in self.owner._eager_load:
-                relationship_result = (
-                    getattr(self.owner, eager)()
-                    .where_in("id", Collection(result).pluck("id"))
-                    .get()
-                )
-                self.owner._relationships[eager] = relationship_result
-        return self.owner.new_collection(result).map_into(self.owner, "hydrate")
+        if eagers:
+            self._load_eagers(models, eagers)
+
+        return models
+
+    def _hydrate_results(self, result, compact=False):
+        """Hydrates the result of a select query into a collection of models.
+
+        Arguments:
+            result {list|tuple} -- A list of dictionaries, or the columns and rows in compact mode.
+
+        Keyword Arguments:
+            compact {bool} -- Whether the result is from a compact query. (default: {False})
+
+        Returns:
+            Collection
+        """
+        if compact:
+            columns, rows = result
+            models = self.owner.hydrate_compact(columns, rows)
+        else:
+            hydrate = self.owner.hydrate
+            models = self.owner.new_collection([hydrate(row) for row in result])
+
+        return self._add_to_identity_map(models)
+
+    def _add_to_identity_map(self, models):
+        """Adds loaded models to the identity map active on this thread, if any.
+
+        Models whose primary key is already in the map are replaced by the instance
+        in the map so there is a single instance per primary key.
+
+        Arguments:
+            models {list|Collection} -- Hydrated models.
+
+        Returns:
+            list|Collection -- The given models, or a collection of the models kept in the identity map.
+        """
+        identity_map = IdentityMap.current()
+        if identity_map is None:
+            return models
+
+        return self.owner.new_collection(identity_map.add_many(self.owner, models))
+
+    def remember(self, ttl, key=None):
+        """Caches the results of the select query in the result cache.
+
+        Results are cached by the compiled query and its bindings and tagged with the
+        tables the query reads from. Creating, updating or deleting records through the
+        query builder removes the cached results of that table.
+
+        Arguments:
+            ttl {int|float} -- Seconds the results stay cached.
+
+        Keyword Arguments:
+            key {string} -- A key to cache the results under instead of the query. (default: {None})
+
+        Returns:
+            self
+        """
+        self._remember = (ttl, key)
+        return self
+
+    def _fetch(self, method="query", **options):
+        """Compiles the select query and runs it with a method of the connection.
+
+        Remembered queries are read from the result cache when possible.
+
+        Keyword Arguments:
+            method {string} -- The connection method that runs the query. (default: {"query"})
+
+        Returns:
+            mixed -- The result of the connection method.
+        """
+        query, bindings, remember = self._compile_fetch(method, options)
+        return self._run_fetch(method, query, bindings, remember, options)
+
+    def _run_fetch(self, method, query, bindings, remember, options):
+        """Runs a compiled select query with a method of the connection.
+
+        Arguments:
+            method {string} -- The connection method that runs the query.
+            query {string} -- The qmark query.
+            bindings {tuple} -- The bindings of the query.
+            remember {tuple|None} -- A (key, ttl, tags) tuple or None when not remembered.
+            options {dict} -- Keyword arguments for the connection method.
+
+        Returns:
+            mixed -- The result of the connection method.
+        """
+        if remember is not None:
+            result = self.result_cache.get(remember[0], CACHE_MISS)
+            if result is not CACHE_MISS:
+                return result
+
+        result = getattr(self.connection().make_connection(), method)(
+            query, bindings, **options
+        )
+        self._remember_result(remember, result)
+        return result
+
+    def _compile_fetch(self, method, options):
+        """Compiles the select query and gets how its result should be cached.
+
+        Arguments:
+            method {string} -- The connection method that runs the query.
+            options {dict} -- Keyword arguments for the connection method.
+
+        Returns:
+            tuple -- The query, its bindings and a (key, ttl, tags) tuple or None when not remembered.
+        """
+        remember = self._remember
+        tags = self._get_cache_tags()
+        query = self.to_qmark()
+        bindings = self._bindings
+
+        return (
+            query,
+            bindings,
+            self._get_remember(remember, method, query, bindings, options, tags),
+        )
+
+    def _get_remember(self, remember, method, query, bindings, options, tags):
+        if remember is None:
+            return None
+
+        ttl, key = remember
+        if key is None:
+            key = self._get_cache_key(method, query, bindings, options)
+
+        return key, ttl, tags
+
+    def _remember_result(self, remember, result):
+        if remember is not None:
+            key, ttl, tags = remember
+            self.result_cache.put(key, result, ttl=ttl, tags=tags)
+
+    def _get_cache_key(self, method, query, bindings, options):
+        fingerprint = repr((method, query, bindings, sorted(options.items())))
+        return "query:" + hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+
+    def _get_cache_tags(self):
+        """Gets the names of the tables the query reads from, including the tables
+        of its joins, subqueries and grouped wheres.
+
+        Returns:
+            tuple
+        """
+        tables = [self._table]
+        tables.extend(join.foreign_table for join in self._joins)
+        for where in self._wheres:
+            if isinstance(where.value, (SubSelectExpression, SubGroupExpression)):
+                tables.extend(where.value.builder._get_cache_tags())
+
+        return tuple(dict.fromkeys(tables))
+
+    def _forget_cached_results(self):
+        """Removes the cached results of the table after a write.
+        """
+        self.result_cache.forget_tags((self._table,))
+
+    def values(self, *columns):
+        """Runs the select query and returns the rows as dictionaries without hydrating models.
+
+        Arguments:
+            columns {string} -- The columns to select. Selects the columns already on the query when empty.
+
+        Returns:
+            list -- A list of dictionaries.
+        """
+        names, rows = self._select_tuples(columns)
+        return [dict(zip(names, row)) for row in rows]
+
+    def values_list(self, *columns, flat=False):
+        """Runs the select query and returns the rows as tuples without hydrating models.
+
+        Arguments:
+            columns {string} -- The columns to select. Selects the columns already on the query when empty.
+
+        Keyword Arguments:
+            flat {bool} -- Returns a list of values instead of tuples when selecting a single column. (default: {False})
+
+        Raises:
+            ValueError: Raised when 'flat' is used with more than one column.
+
+        Returns:
+            list -- A list of tuples or values.
+        """
+        if flat and len(columns) != 1:
+            raise ValueError("'flat' can only be used when selecting a single column")
+
+        _, rows = self._select_tuples(columns)
+        if flat:
+            return [row[0] for row in rows]
+
+        return list(rows)
+
+    def pluck_column(self, column):
+        """Runs the select query and returns the values of a single column.
+
+        Arguments:
+            column {string} -- The column to select.
+
+        Returns:
+            list -- A list of values.
+        """
+        return self.values_list(column, flat=True)
+
+    def _select_tuples(self, columns):
+        self.set_action("select")
+        if columns:
+            self.select(*columns)
+
+        return self._fetch("query_tuples")
+
+    def compact(self):
+        """Hydrates the results into compact row models instead of regular models.
+
+        Compact rows keep the values in the tuple returned by the cursor and read them
+        through slotted descriptors. Dirty attributes are only tracked after a write.
+
+        Returns:
+            self
+        """
+        self._compact = True
+        return self
+
+    def cursor(self):
+        """Runs the select query and yields hydrated models one at a time.
+
+        Rows are streamed from the database instead of being fetched all at once so
+        memory stays constant no matter how many records the query returns.
+
+        Returns:
+            generator -- Yields a model for each row.
+        """
+        return self.lazy()
+
+    def lazy(self, chunk_size=1000):
+        """Runs the select query and yields hydrated models while streaming the rows.
+
+        Rows are fetched 'chunk_size' at a time and hydrated like the results of 'get',
+        so compact rows and the identity map are used the same way. Eager loaded
+        relationships are loaded once per chunk.
+
+        Keyword Arguments:
+            chunk_size {int} -- The number of rows fetched and hydrated at a time. (default: {1000})
+
+        Returns:
+            generator -- Yields a model for each row.
+        """
+        self.set_action("select")
+        eagers = self._eager_loads
+        compact = self._compact
+        query = self.to_qmark()
+
+        return self._stream_models(query, self._bindings, chunk_size, eagers, compact)
+
+    def _stream_models(self, query, bindings, chunk_size, eagers, compact=False):
+        stream = self.connection().stream(query, bindings, chunk_size=chunk_size)
+        if not eagers:
+            for row in stream:
+                yield self._hydrate_stream_chunk([row], None, compact)[0]
+            return
+
+        rows = []
+        for row in stream:
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield from self._hydrate_stream_chunk(rows, eagers, compact)
+                rows = []
+
+        if rows:
+            yield from self._hydrate_stream_chunk(rows, eagers, compact)
+
+    def _hydrate_stream_chunk(self, rows, eagers, compact):
+        """Hydrates a chunk of streamed rows through the same path as 'get'.
+
+        Arguments:
+            rows {list} -- A list of dictionaries.
+            eagers {dict} -- The relationships to eager load.
+            compact {bool} -- Whether to hydrate compact rows.
+
+        Returns:
+            Collection
+        """
+        if compact:
+            columns = tuple(rows[0])
+            rows = (columns, [tuple(row.values()) for row in rows])
+
+        models = self._hydrate_results(rows, compact)
+        if eagers:
+            self._load_eagers(models, eagers)
+
+        return models
+
+    def chunk(self, size, callback, column="id"):
+        """Runs the select query in chunks and passes each chunk of models to a callback.
+
+        Arguments:
+            size {int} -- The number of models in each chunk.
+            callback {callable} -- Called with a collection of models. Returning False stops the chunking.
+
+        Keyword Arguments:
+            column {string} -- A unique, ordered column used to page through the table. (default: {"id"})
+
+        Returns:
+            bool -- False if the callback stopped the chunking, otherwise True.
+        """
+        for models in self.chunk_by_id(size, column=column):
+            if callback(models) is False:
+                return False
+
+        return True
+
+    def chunk_by_id(self, size, column="id"):
+        """Runs the select query in chunks, paging by a column instead of an offset.
+
+        Each page after the first selects the rows where the column is greater than
+        the last value of the previous page so every page costs the same no matter how
+        deep into the table it is. Both statements are compiled once and reused for
+        every page. Any order on the query is replaced by the order of the column.
+
+        Arguments:
+            size {int} -- The number of models in each chunk.
+
+        Keyword Arguments:
+            column {string} -- A unique, ordered column used to page through the table. (default: {"id"})
+
+        Returns:
+            generator -- Yields a collection of models for each page.
+        """
+        self.set_action("select")
+        eagers = self._eager_loads
+        self._order_by = []
+        self.order_by(column).limit(size)
+
+        next_page = self.clone()
+        if next_page._wheres:
+            # Groups the wheres so an 'or' in them cannot bypass the key predicate.
+            group = next_page.new()
+            group._wheres = next_page._wheres
+            next_page._wheres = [QueryExpression(None, "=", SubGroupExpression(group))]
+
+        last_key = Param(column)
+        next_page.where(column, ">", last_key)
+
+        query = self.to_qmark()
+        bindings = self._bindings
+        next_query = next_page.to_qmark()
+        next_bindings = next_page._bindings
+        index = next(
+            index for index, binding in enumerate(next_bindings) if binding is last_key
+        )
+
+        return self._chunk_pages(
+            size,
+            column.split(".")[-1],
+            (query, bindings),
+            (next_query, next_bindings, index),
+            eagers,
+        )
+
+    def _chunk_pages(self, size, key, page, next_page, eagers):
+        query, bindings = page
+        while True:
+            result = self.connection().make_connection().query(query, bindings) or []
+            if not result:
+                return
+
+            models = self.owner.new_collection(result).map_into(self.owner, "hydrate")
+            if eagers:
+                self._load_eagers(models, eagers)
+
+            yield models
+
+            if len(result) < size:
+                return
+
+            query, bindings, index = next_page
+            bindings = bindings[:index] + (result[-1][key],) + bindings[index + 1 :]
+
+    def submit(self, method="get", *args, **kwargs):
+        """Runs the query on a worker thread of the connection and returns a future.
+
+        The query built so far is copied so this builder can be used for the next query
+        right away. The worker runs in the context of the caller, so it uses the
+        transaction open in it when the connection class shares transactions.
+        Otherwise queries cannot be submitted inside a transaction.
+
+        Keyword Arguments:
+            method {string} -- The method that runs the query, like 'get' or 'first'. (default: {"get"})
+
+        Raises:
+            ValueError: Raised when a transaction that cannot be shared is open in the current context.
+
+        Returns:
+            concurrent.futures.Future -- A future of the result of the method.
+        """
+        if (
+            not self.connection.shares_transactions
+            and self.connection().transaction_level()
+        ):
+            raise ValueError(
+                "Queries cannot be submitted inside a transaction. "
+                "Run the queries of the transaction synchronously."
+            )
+
+        builder = self.clone()
+        self.boot()
+        return self.connection.get_executor().submit(
+            contextvars.copy_context().run, getattr(builder, method), *args, **kwargs
+        )
+
+    def template(self, method="get", *args, **kwargs):
+        """Compiles the query into a template that can be run many times.
+
+        Values marked with 'param' are given as keyword arguments when the template is
+        called, for example User.where("email", param("email")).template("first").
+        Building, scoping and compiling the query only happen once.
+
+        Keyword Arguments:
+            method {string} -- The method that runs the query, like 'get' or 'first'. (default: {"get"})
+
+        Returns:
+            masonite.orm.builder.QueryTemplate
+        """
+        template = QueryTemplate(self, method, *args, **kwargs)
+        self.boot()
+        return template
+
+    @staticmethod
+    def gather(*builders, method="get"):
+        """Runs independent queries concurrently and waits for all of them.
+
+        Arguments:
+            builders {QueryBuilder} -- The queries to run.
+
+        Keyword Arguments:
+            method {string} -- The method that runs each query, like 'get' or 'first'. (default: {"get"})
+
+        Raises:
+            ValueError: Raised when a transaction that cannot be shared is open in the current context.
+
+        Returns:
+            list -- The results in the order of the builders.
+        """
+        futures = [builder.submit(method) for builder in builders]
+        return [future.result() for future in futures]
+
+    def with_(self, *eagers):
+        """Specifies relationships that should be eager loaded with the results.
+
+        Arguments:
+            eagers {string} -- The names of relationships on the model.
+                Nested relationships can be loaded with dotted paths like 'posts.comments'.
+
+        Returns:
+            self
+        """
+        self._eager_loads += eagers
+        return self
+
+    def _load_eagers(self, models, eagers):
+        """Loads each eager relationship with a single query and attaches it to the models.
+
+        Dotted paths like 'posts.comments' are grouped by their first relationship
+        and the rest of the path is eager loaded on the related models.
+
+        Arguments:
+            models {list|Collection} -- The hydrated models the relationships belong to.
+            eagers {tuple} -- The names of the relationships to load.
+        """
+        relationships = {}
+        for eager in eagers:
+            name, _, nested = eager.partition(".")
+            relationships.setdefault(name, [])
+            if nested:
+                relationships[name].append(nested)
+
+        for name, nested in relationships.items():
+            self.owner.get_relationship(name).eager_load(models, nested)
 
     def set_action(self, action):
         """Sets the action that the query builder should take when the query is built.
@@ -714,6 +1506,19 @@ class QueryBuilder:
         self._action = action
         return self
 
+    def get_subquery_grammar(self):
+        """Initializes the grammar of this query so it can be compiled inside another query.
+
+        The global scopes are applied to a copy of the query so the builder is left
+        as it is and can be compiled again.
+
+        Returns:
+            masonite.orm.grammar.Grammar -- An ORM grammar class.
+        """
+        builder = self.clone()
+        builder._apply_global_scopes()
+        return builder.get_grammar()
+
     def get_grammar(self):
         """Initializes and returns the grammar class.
 
@@ -722,20 +1527,22 @@ class QueryBuilder:
         """
 
         # Either _creates when creating, otherwise use columns
-        columns = self._creates or self._columns
+        columns = self._creates or tuple(self._columns)
 
         return self.grammar(
             columns=columns,
             table=self._table,
-            wheres=self._wheres,
+            wheres=tuple(self._wheres),
             limit=self._limit,
             offset=self._offset,
             updates=self._updates,
-            aggregates=self._aggregates,
-            order_by=self._order_by,
-            group_by=self._group_by,
-            joins=self._joins,
-            having=self._having,
+            aggregates=tuple(self._aggregates),
+            order_by=tuple(self._order_by),
+            group_by=tuple(self._group_by),
+            joins=tuple(self._joins),
+            having=tuple(self._having),
+            keys=self._keys,
+            update_columns=self._update_columns,
             connection_details=self.connection.connection_details
             if self.connection
             else self.connection_details,
@@ -751,16 +1558,11 @@ class QueryBuilder:
         if not self._action:
             self.set_action("select")
 
-        for scope in self._global_scopes.get(self.owner, {}).get(self._action, []):
-            if not scope:
-                continue
-            scope(self.owner, self)
+        self._apply_global_scopes()
 
         grammar = self.get_grammar()
 
-        sql = getattr(
-            grammar, "_compile_{action}".format(action=self._action)
-        )().to_sql()
+        sql = grammar.compile(self._action).to_sql()
         self.boot()
         return sql
 
@@ -774,17 +1576,11 @@ class QueryBuilder:
         if not self._action:
             self.set_action("select")
 
-        for scope in self._global_scopes.get(self.owner, {}).get(self._action, []):
-            if not scope:
-                continue
-
-            scope(self.owner, self)
+        self._apply_global_scopes()
 
         grammar = self.get_grammar()
 
-        qmark = getattr(grammar, "_compile_{action}".format(action=self._action))(
-            qmark=True
-        ).to_qmark()
+        qmark = grammar.compile(self._action, qmark=True).to_qmark()
 
         self.boot()
 
@@ -792,6 +1588,15 @@ class QueryBuilder:
 
         return qmark
 
+    def _apply_global_scopes(self):
+        """Applies the global scopes registered for the current action.
+        """
+        for scope in self._global_scopes.get(self.owner, {}).get(self._action, []):
+            if not scope:
+                continue
+
+            scope(self.owner, self)
+
     def new(self):
         """Creates a new QueryBuilder class.
 
@@ -804,6 +1609,27 @@ class QueryBuilder:
 
         return builder
 
+    def clone(self):
+        """Copies the QueryBuilder class along with the query built so far.
+
+        Changing the copy does not change the query of this builder.
+
+        Returns:
+            QueryBuilder -- The ORM QueryBuilder class.
+        """
+        builder = self.__class__.__new__(self.__class__)
+        builder.__dict__.update(self.__dict__)
+        for clause in self._clauses:
+            setattr(builder, clause, list(getattr(self, clause)))
+
+        builder._scopes = dict(self._scopes)
+        if isinstance(self._creates, dict):
+            builder._creates = dict(self._creates)
+        if isinstance(self._updates, dict):
+            builder._updates = dict(self._updates)
+
+        return builder
+
     def avg(self, column):
         """Aggregates a columns values.
 
@@ -0,0 +1,220 @@
+from ..expressions.expressions import Param
+
+
+def param(name):
+    """Marks a where value that is given when a query template is called.
+
+    Arguments:
+        name {string} -- The name of the keyword argument the value is given with.
+
+    Returns:
+        masonite.orm.expressions.Param
+    """
+    return Param(name)
+
+
+class QueryTemplate:
+    """A select query compiled once and run many times with different parameters.
+
+    The query is built, scoped and compiled to qmark SQL when the template is made.
+    Calling the template only binds the parameters into the compiled bindings, runs the
+    query and hydrates the result the same way the terminal method of the builder does.
+    Templates hold no per call state so they can be shared between threads.
+    """
+
+    methods = ("get", "first", "values", "values_list", "pluck_column")
+
+    def __init__(self, builder, method="get", *args, **kwargs):
+        """QueryTemplate initializer
+
+        Arguments:
+            builder {masonite.orm.builder.QueryBuilder} -- The query to compile. It is not changed.
+
+        Keyword Arguments:
+            method {string} -- The terminal method the template runs, like 'get' or 'first'. (default: {"get"})
+
+        Raises:
+            ValueError: Raised when the method or its arguments are not supported.
+        """
+        if method not in self.methods:
+            raise ValueError(
+                "Query templates can only run one of: {}".format(
+                    ", ".join(self.methods)
+                )
+            )
+
+        builder = builder.clone().set_action("select")
+
+        self.method = method
+        self.eagers = builder._eager_loads
+        self.compact = builder._compact
+        self.flat = False
+        self.options = {}
+
+        if method == "first":
+            builder.limit(1)
+            if not self.compact:
+                self.options = {"results": 1}
+        elif method in ("values", "values_list", "pluck_column"):
+            if method == "pluck_column":
+                args, kwargs = args[:1], {"flat": True}
+
+            self.flat = kwargs.get("flat", False)
+            if self.flat and len(args) != 1:
+                raise ValueError(
+                    "'flat' can only be used when selecting a single column"
+                )
+
+            if args:
+                builder.select(*args)
+
+        if method in ("get", "first") and not self.compact:
+            self.fetch_method = "query"
+        else:
+            self.fetch_method = "query_tuples"
+
+        remember = builder._remember
+        tags = builder._get_cache_tags()
+        self.sql = builder.to_qmark()
+        self.bindings = builder._bindings
+        self.remember = remember
+        self.tags = tags
+        self.parameters = frozenset(
+            binding.name for binding in self.bindings if isinstance(binding, Param)
+        )
+        self.expands = any(
+            isinstance(binding, Param) and binding.expand for binding in self.bindings
+        )
+        self.parts = self.sql.split("'?'") if self.expands else None
+        if self.expands and len(self.parts) != len(self.bindings) + 1:
+            raise ValueError(
+                "Query templates with list parameters cannot contain other '?' marks"
+            )
+
+        self.builder = builder
+
+    def bind(self, **params):
+        """Binds parameters into the compiled bindings.
+
+        The values of a parameter that expands are each bound on their own.
+
+        Raises:
+            TypeError: Raised when a parameter is missing or unknown.
+            ValueError: Raised when a parameter that expands is not given a list of values.
+
+        Returns:
+            tuple
+        """
+        unknown = params.keys() - self.parameters
+        if unknown:
+            raise TypeError(
+                "Unknown query parameters: {}".format(", ".join(sorted(unknown)))
+            )
+
+        try:
+            if not self.expands:
+                return tuple(
+                    params[binding.name] if isinstance(binding, Param) else binding
+                    for binding in self.bindings
+                )
+
+            bindings = []
+            for binding in self.bindings:
+                if not isinstance(binding, Param):
+                    bindings.append(binding)
+                elif binding.expand:
+                    bindings.extend(self._get_values(binding.name, params))
+                else:
+                    bindings.append(params[binding.name])
+        except KeyError as e:
+            raise TypeError("Missing query parameter '{}'".format(e.args[0]))
+
+        return tuple(bindings)
+
+    def expand(self, **params):
+        """Gets the qmark SQL with a placeholder for each value of the parameters that expand.
+
+        Returns:
+            string
+        """
+        if not self.expands:
+            return self.sql
+
+        sql = [self.parts[0]]
+        for binding, part in zip(self.bindings, self.parts[1:]):
+            if isinstance(binding, Param) and binding.expand:
+                sql.append(", ".join(["'?'"] * len(params[binding.name])))
+            else:
+                sql.append("'?'")
+            sql.append(part)
+
+        return "".join(sql)
+
+    @staticmethod
+    def _get_values(name, params):
+        values = params[name]
+        if not isinstance(values, (list, tuple)) or not values:
+            raise ValueError(
+                "The '{}' query parameter must be a list of values".format(name)
+            )
+
+        return values
+
+    def __call__(self, **params):
+        """Runs the query with the given parameters.
+
+        Returns:
+            mixed -- The result of the terminal method of the template.
+        """
+        builder = self.builder
+        bindings = self.bind(**params)
+        sql = self.expand(**params)
+        result = builder._run_fetch(
+            self.fetch_method,
+            sql,
+            bindings,
+            builder._get_remember(
+                self.remember,
+                self.fetch_method,
+                sql,
+                bindings,
+                self.options,
+                self.tags,
+            ),
+            self.options,
+        )
+
+        method = self.method
+        if method in ("get", "first"):
+            if method == "first" and not self.compact:
+                models = builder._hydrate_first(result)
+                if self.eagers and result:
+                    builder._load_eagers([models], self.eagers)
+
+                return models
+
+            models = builder._hydrate_results(result, self.compact)
+            if self.eagers:
+                builder._load_eagers(models, self.eagers)
+
+            if method == "first":
+                return models.first()
+
+            return models
+
+        names, rows = result
+        if method == "values":
+            return [dict(zip(names, row)) for row in rows]
+
+        if self.flat:
+            return [row[0] for row in rows]
+
+        return list(rows)
+
+    def to_qmark(self):
+        """Gets the compiled qmark SQL of the template.
+
+        Returns:
+            string
+        """
+        return self.sql
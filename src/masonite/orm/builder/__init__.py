@@ -1 +1,3 @@
 from .QueryBuilder import QueryBuilder
+from .AsyncQueryBuilder import AsyncQueryBuilder
+from .QueryTemplate import QueryTemplate, param
@@ -0,0 +1,54 @@
+class BaseCache:
+    """The interface query result cache backends implement.
+
+    Entries are tagged with the names of the tables a query read from so writes to
+    a table can remove every entry that may be stale.
+    """
+
+    def get(self, key, default=None):
+        """Gets a cached value.
+
+        Arguments:
+            key {string} -- The key of the entry.
+
+        Keyword Arguments:
+            default {mixed} -- The value returned on a miss or when the entry expired. (default: {None})
+
+        Returns:
+            mixed
+        """
+        raise NotImplementedError
+
+    def put(self, key, value, ttl=None, tags=()):
+        """Stores a value.
+
+        Arguments:
+            key {string} -- The key of the entry.
+            value {mixed} -- The value to store.
+
+        Keyword Arguments:
+            ttl {int|float} -- Seconds until the entry expires. Never expires when None. (default: {None})
+            tags {tuple} -- The table names the entry depends on. (default: {()})
+        """
+        raise NotImplementedError
+
+    def forget(self, key):
+        """Removes a single entry.
+
+        Arguments:
+            key {string} -- The key of the entry.
+        """
+        raise NotImplementedError
+
+    def forget_tags(self, tags):
+        """Removes every entry tagged with any of the tags.
+
+        Arguments:
+            tags {tuple} -- Table names.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Removes every entry.
+        """
+        raise NotImplementedError
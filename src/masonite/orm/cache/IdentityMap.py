@@ -0,0 +1,104 @@
+import threading
+
+SCOPES = threading.local()
+
+
+class IdentityMap:
+    """Keeps a single hydrated instance per model and primary key for the length of a scope.
+
+    While an identity map is active on the current thread, models found by primary key
+    are returned from the map instead of being queried again and models loaded by
+    the query builder are added to it. Use it as a context manager around a request
+    or unit of work:
+
+        with IdentityMap():
+            User.find(1)
+            User.find(1)  # No query
+    """
+
+    def __init__(self):
+        self._models = {}
+
+    @classmethod
+    def current(cls):
+        """Gets the identity map active on the current thread.
+
+        Returns:
+            IdentityMap|None
+        """
+        stack = getattr(SCOPES, "stack", None)
+        if stack:
+            return stack[-1]
+
+        return None
+
+    def get(self, model, key):
+        """Gets the instance of a model with a primary key.
+
+        Arguments:
+            model {masonite.orm.models.Model} -- The model class.
+            key {mixed} -- The primary key value.
+
+        Returns:
+            Model|None
+        """
+        return self._models.get((model, str(key)))
+
+    def add(self, model, instance):
+        """Adds an instance unless the map already has one with the same primary key.
+
+        Arguments:
+            model {masonite.orm.models.Model} -- The model class.
+            instance {masonite.orm.models.Model} -- A hydrated model.
+
+        Returns:
+            Model -- The instance kept in the map.
+        """
+        key = instance.__attributes__.get(model.__primary_key__)
+        if key is None:
+            return instance
+
+        return self._models.setdefault((model, str(key)), instance)
+
+    def add_many(self, model, instances):
+        """Adds hydrated instances of a model.
+
+        Arguments:
+            model {masonite.orm.models.Model} -- The model class.
+            instances {list|Collection} -- Hydrated models.
+
+        Returns:
+            list -- The instances kept in the map, in the order of the given instances.
+        """
+        return [self.add(model, instance) for instance in instances]
+
+    def missing(self, model, keys):
+        """Gets the primary keys that are not in the map.
+
+        Arguments:
+            model {masonite.orm.models.Model} -- The model class.
+            keys {list} -- Primary key values.
+
+        Returns:
+            list
+        """
+        return [key for key in keys if (model, str(key)) not in self._models]
+
+    def clear(self):
+        """Removes every instance from the map.
+        """
+        self._models.clear()
+
+    def __enter__(self):
+        if not hasattr(SCOPES, "stack"):
+            SCOPES.stack = []
+
+        SCOPES.stack.append(self)
+        return self
+
+    def __exit__(self, *args):
+        SCOPES.stack.remove(self)
+        self.clear()
+
+    def __len__(self):
+        return len(self._models)
@@ -0,0 +1,104 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """A thread safe least recently used cache with hit and miss counters.
+    """
+
+    def __init__(self, maxsize=1024):
+        """LRUCache initializer
+
+        Keyword Arguments:
+            maxsize {int} -- The maximum number of entries to keep. (default: {1024})
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Gets a value and marks it as the most recently used.
+
+        Arguments:
+            key {hashable} -- The key of the entry.
+
+        Keyword Arguments:
+            default {mixed} -- The value returned on a miss. (default: {None})
+
+        Returns:
+            mixed
+        """
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Stores a value, evicting the least recently used entry when the cache is full.
+
+        Arguments:
+            key {hashable} -- The key of the entry.
+            value {mixed} -- The value to store.
+
+        Returns:
+            list -- The (key, value) pairs that were evicted.
+        """
+        evicted = []
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                evicted.append(self._items.popitem(last=False))
+
+        return evicted
+
+    def pop(self, key, default=None):
+        """Removes an entry from the cache.
+
+        Arguments:
+            key {hashable} -- The key of the entry.
+
+        Keyword Arguments:
+            default {mixed} -- The value returned when the key is not cached. (default: {None})
+
+        Returns:
+            mixed
+        """
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def clear(self):
+        """Removes every entry and resets the counters.
+        """
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Returns the cache counters.
+
+        Returns:
+            dict
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+            }
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
@@ -0,0 +1,85 @@
+import threading
+import time
+
+from .BaseCache import BaseCache
+from .LRUCache import LRUCache
+
+
+class MemoryCache(BaseCache):
+    """An in process query result cache backed by an LRU with expiring entries.
+    """
+
+    def __init__(self, maxsize=1024, clock=time.monotonic):
+        """MemoryCache initializer
+
+        Keyword Arguments:
+            maxsize {int} -- The maximum number of entries to keep. (default: {1024})
+            clock {callable} -- Returns the current time in seconds. (default: {time.monotonic})
+        """
+        self.clock = clock
+        self._entries = LRUCache(maxsize=maxsize)
+        self._tags = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value, _ = entry
+        if expires_at is not None and self.clock() >= expires_at:
+            self.forget(key)
+            return default
+
+        return value
+
+    def put(self, key, value, ttl=None, tags=()):
+        expires_at = None if ttl is None else self.clock() + ttl
+        with self._lock:
+            self._remove(key)
+            evicted = self._entries.put(key, (expires_at, value, tuple(tags)))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            for evicted_key, (_, _, evicted_tags) in evicted:
+                self._untag(evicted_key, evicted_tags)
+
+    def forget(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def forget_tags(self, tags):
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, ()):
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self):
+        """Returns the cache counters.
+
+        Returns:
+            dict
+        """
+        return self._entries.stats()
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        if entry is not None:
+            self._untag(key, entry[2])
+
+    def _untag(self, key, tags):
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is None:
+                continue
+
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    def __len__(self):
+        return len(self._entries)
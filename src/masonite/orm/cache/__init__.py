@@ -0,0 +1,4 @@
+from .BaseCache import BaseCache
+from .IdentityMap import IdentityMap
+from .LRUCache import LRUCache
+from .MemoryCache import MemoryCache
@@ -2,6 +2,17 @@ import json
 import operator
 from functools import reduce
 
+MISSING = object()
+
+OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
 
 class Collection:
     """Wraps various data types to make working with them easier.
@@ -9,6 +20,7 @@ class Collection:
 
     def __init__(self, items=[]):
         self._items = items
+        self._indexes = {}
 
     def take(self, number: int):
         """Takes a specific number of results from the items.
@@ -148,6 +160,7 @@ class Collection:
     def each(self, callback):
         self._check_is_callable(callback)
 
+        self._indexes = {}
         for k, v in enumerate(self):
             result = callback(v)
             if not result:
@@ -229,36 +242,95 @@ class Collection:
             items = items.all()
 
         self._items += items
+        self._indexes = {}
         return self
 
     def pluck(self, value, key=None):
+        """Gets the values of a key from every item.
+
+        Models are read through their raw attributes instead of being serialized.
+        Items that do not have the key are skipped.
+
+        Arguments:
+            value {string} -- The key of the values.
+
+        Keyword Arguments:
+            key {string} -- Returns a dictionary keyed by the values of this key instead of a list. (default: {None})
+
+        Returns:
+            list|dict
+        """
         if key:
             attributes = {}
         else:
             attributes = []
+
         for item in self:
-            if isinstance(item, dict):
-                iterable = item.items()
-            else:
-                iterable = item.serialize().items()
+            plucked = self._raw_get(item, value)
+            if plucked is MISSING:
+                continue
 
-            for k, v in iterable:
-                if k == value:
-                    if key:
-                        attributes[self._data_get(item, key)] = self._data_get(
-                            item, value
-                        )
-                    else:
-                        attributes.append(v)
+            if key:
+                attributes[self._data_get(item, key)] = plucked
+            else:
+                attributes.append(plucked)
 
         return attributes
 
+    def key_by(self, key):
+        """Keys the items by the value of a key. Later items replace earlier items with the same value.
+
+        Arguments:
+            key {string|callable} -- The key, or a callable returning the value for an item.
+
+        Returns:
+            dict
+        """
+        return {self._key_value(item, key): item for item in self}
+
+    def group_by(self, key):
+        """Groups the items by the value of a key.
+
+        Arguments:
+            key {string|callable} -- The key, or a callable returning the value for an item.
+
+        Returns:
+            dict -- A collection of items for each value.
+        """
+        groups = {}
+        for item in self:
+            groups.setdefault(self._key_value(item, key), []).append(item)
+
+        return {value: self.__class__(items) for value, items in groups.items()}
+
+    def index(self, key):
+        """Builds an index of the items by the value of a key.
+
+        The index is kept on the collection so every following 'where' on the key
+        with an equality looks the items up instead of scanning them. The index is
+        dropped when the collection is changed.
+
+        Arguments:
+            key {string} -- The key to index.
+
+        Returns:
+            self
+        """
+        index = {}
+        for item in self:
+            index.setdefault(self._data_get(item, key), []).append(item)
+
+        self._indexes[key] = index
+        return self
+
     def pop(self):
         last = self._items.pop()
+        self._indexes = {}
         return last
 
     def prepend(self, value):
         self._items.insert(0, value)
+        self._indexes = {}
         return self
 
     def pull(self, key):
@@ -268,6 +340,7 @@ class Collection:
 
     def push(self, value):
         self._items.append(value)
+        self._indexes = {}
 
     def put(self, key, value):
         self[key] = value
@@ -281,9 +354,11 @@ class Collection:
 
         items = self._get_value(callback) or self._items
         self._items = items
+        self._indexes = {}
 
     def reverse(self):
-        self._items = self[::-1]
+        self._items = self._items[::-1]
+        self._indexes = {}
 
     def serialize(self):
         def _serialize(item):
@@ -300,6 +375,7 @@ class Collection:
 
     def sort(self):
         self._items = sorted(self)
+        self._indexes = {}
 
     def sum(self, key=None):
         result = 0
@@ -316,21 +392,17 @@ class Collection:
     def transform(self, callback):
         self._check_is_callable(callback)
         self._items = self._get_value(callback)
+        self._indexes = {}
 
     def unique(self, key=None):
         if not key:
-            items = list(set(self._items))
-            return self.__class__(items)
-
-        keys = set()
-        items = []
+            return self.__class__(list(dict.fromkeys(self._items)))
 
+        keyed = {}
         for item in self:
-            if not item[key] in keys:
-                items.append(item)
-                keys.add(item[key])
+            keyed.setdefault(self._key_value(item, key), item)
 
-        return self.__class__(items)
+        return self.__class__(list(keyed.values()))
 
     def where(self, key, *args):
         op = "=="
@@ -340,13 +412,17 @@ class Collection:
             op = args[0]
             value = args[1]
 
-        attributes = []
-
-        for item in self._items:
-            if self._make_comparison(item.get(key), value, op):
-                attributes.append(item)
+        index = self._indexes.get(key)
+        if index is not None and op == "==":
+            try:
+                return self.__class__(list(index.get(value, ())))
+            except TypeError:
+                pass
 
-        return self.__class__(attributes)
+        compare = self._get_operator(op)
+        return self.__class__(
+            [item for item in self._items if compare(self._data_get(item, key), value)]
+        )
 
     def zip(self, items):
         if isinstance(items, Collection):
@@ -374,6 +450,26 @@ class Collection:
                     items.append(result)
         return items
 
+    def _raw_get(self, item, key):
+        """Gets the value of a key from an item without casting or serializing it.
+
+        Returns MISSING when the item does not have the key.
+        """
+        if isinstance(item, dict):
+            return item.get(key, MISSING)
+
+        get_raw_attribute = getattr(item, "get_raw_attribute", None)
+        if get_raw_attribute is not None:
+            return get_raw_attribute(key, MISSING)
+
+        return self._data_get(item, key, MISSING)
+
+    def _key_value(self, item, key):
+        if callable(key):
+            return key(item)
+
+        return self._data_get(item, key)
+
     def _data_get(self, item, key, default=None):
         try:
             if isinstance(item, (list, tuple)):
@@ -400,15 +496,11 @@ class Collection:
         return True
 
     def _make_comparison(self, a, b, op):
-        operators = {
-            "<": operator.lt,
-            "<=": operator.le,
-            "==": operator.eq,
-            "!=": operator.ne,
-            ">": operator.gt,
-            ">=": operator.ge,
-        }
-        return operators[op](a, b)
+        return self._get_operator(op)(a, b)
+
+    @staticmethod
+    def _get_operator(op):
+        return OPERATORS[op]
 
     def __iter__(self):
         for item in self._items:
@@ -427,9 +519,11 @@ class Collection:
 
     def __setitem__(self, key, value):
         self._items[key] = value
+        self._indexes = {}
 
     def __delitem__(self, key):
         del self._items[key]
+        self._indexes = {}
 
     def __ne__(self, other):
         if isinstance(other, Collection):
@@ -0,0 +1,141 @@
+import asyncio
+import contextvars
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncConnection:
+    """Makes the queries of a connection class awaitable.
+
+    Queries run on the worker threads of the connection class so the event loop is
+    never blocked by a database round trip. The workers run in the context of the
+    caller, so they use the transaction open in it when the connection class shares
+    transactions. Otherwise queries cannot be awaited inside a transaction.
+    """
+
+    def __init__(self, connection):
+        """AsyncConnection initializer
+
+        Arguments:
+            connection {masonite.orm.connections.BaseConnection} -- A connection class.
+        """
+        self.connection = connection
+
+    def get_executor(self):
+        """Gets the worker threads of the connection class.
+
+        Returns:
+            concurrent.futures.ThreadPoolExecutor
+        """
+        return self.connection.get_executor()
+
+    async def query(self, query, bindings=(), results="*"):
+        """Make the query on a worker thread.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Keyword Arguments:
+            results {str|1} -- If the results is equal to an asterisks it will call 'fetchAll'
+                    else it will return 'fetchOne' and return a single record. (default: {"*"})
+
+        Returns:
+            dict|None -- Returns a dictionary of results or None
+        """
+        return await self.run("query", query, bindings, results=results)
+
+    async def query_tuples(self, query, bindings=()):
+        """Make the query on a worker thread and return the rows as tuples.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Returns:
+            tuple -- A tuple of the column names and the rows.
+        """
+        return await self.run("query_tuples", query, bindings)
+
+    async def run(self, method, *args, **kwargs):
+        """Calls a method of a new connection on a worker thread.
+
+        Arguments:
+            method {string} -- The name of the connection method.
+
+        Raises:
+            ValueError: Raised when a transaction that cannot be shared is open in the current context.
+
+        Returns:
+            mixed -- The result of the method.
+        """
+        self._check_transaction()
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.get_executor(),
+            functools.partial(
+                contextvars.copy_context().run, self._call, method, *args, **kwargs
+            ),
+        )
+
+    def _call(self, method, *args, **kwargs):
+        return getattr(self.connection().make_connection(), method)(*args, **kwargs)
+
+    def _check_transaction(self):
+        """Refuses to run a query outside of the transaction open in the current context.
+
+        When the connection class does not share transactions with worker threads the
+        query would run on a worker connection, so it would be committed even when the
+        transaction is rolled back.
+
+        Raises:
+            ValueError: Raised when a transaction that cannot be shared is open in the current context.
+        """
+        if (
+            not self.connection.shares_transactions
+            and self.connection().transaction_level()
+        ):
+            raise ValueError(
+                "Async queries cannot be run inside a transaction. "
+                "Run the queries of the transaction synchronously."
+            )
+
+    async def stream(self, query, bindings=(), chunk_size=1000):
+        """Make the query and yield the results one row at a time.
+
+        The rows are streamed on a dedicated worker thread because a cursor can only be
+        used from the thread that opened it.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Keyword Arguments:
+            chunk_size {int} -- The number of rows fetched at a time. (default: {1000})
+
+        Raises:
+            ValueError: Raised when a transaction that cannot be shared is open in the current context.
+
+        Returns:
+            async generator -- Yields a dictionary for each row.
+        """
+        self._check_transaction()
+        loop = asyncio.get_event_loop()
+        executor = ThreadPoolExecutor(max_workers=1)
+        context = contextvars.copy_context()
+        rows = self.connection().stream(query, bindings, chunk_size=chunk_size)
+        try:
+            while True:
+                chunk = await loop.run_in_executor(
+                    executor,
+                    lambda: context.run(list, itertools.islice(rows, chunk_size)),
+                )
+                if not chunk:
+                    return
+
+                for row in chunk:
+                    yield row
+        finally:
+            await loop.run_in_executor(executor, context.run, rows.close)
+            executor.shutdown(wait=False)
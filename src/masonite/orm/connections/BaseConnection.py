@@ -1,11 +1,23 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.database import CONNECTIONS
+
 from ..grammar import GrammarFactory
 
+EXECUTORS = {}
+EXECUTORS_LOCK = threading.Lock()
+
 
 class BaseConnection:
 
     _connection = None
     _cursor = None
 
+    """Whether queries on worker threads can use the connection of a transaction open
+    in the context they were started from."""
+    shares_transactions = False
+
     @classmethod
     def get_grammer(cls):
         """Gets a grammar using the connection details.
@@ -34,3 +46,63 @@ class BaseConnection:
         cls.connection_details = dictionary
         if "options" not in cls.connection_details:
             cls.connection_details.setdefault("options", {})
+
+    @classmethod
+    def get_connection_name(cls):
+        """Gets the name of the connection in 'config/database.py'.
+
+        Falls back to the driver when the connection details were not loaded from the config.
+
+        Returns:
+            string
+        """
+        for name, details in CONNECTIONS.items():
+            if details is cls.connection_details:
+                return name
+
+        return cls.connection_details.get("driver")
+
+    def transaction_level(self):
+        """Gets the number of open transaction levels in the current context.
+
+        Returns:
+            int
+        """
+        return 0
+
+    @staticmethod
+    def get_savepoint_name(level):
+        """Gets the name of the savepoint used for a nested transaction level.
+
+        Arguments:
+            level {int} -- The transaction level the savepoint is created at.
+
+        Returns:
+            string
+        """
+        return "masonite_savepoint_{}".format(level)
+
+    @classmethod
+    def get_executor(cls):
+        """Gets the worker threads used to run queries of these connection details concurrently.
+
+        The workers are created on first use. Their number is the 'max' size of the
+        'pool' dictionary of the connection in 'config/database.py'.
+
+        Returns:
+            concurrent.futures.ThreadPoolExecutor
+        """
+        key = (cls, str(sorted(cls.connection_details.items())))
+
+        executor = EXECUTORS.get(key)
+        if executor is not None:
+            return executor
+
+        with EXECUTORS_LOCK:
+            if key not in EXECUTORS:
+                pool = cls.connection_details.get("pool") or {}
+                EXECUTORS[key] = ThreadPoolExecutor(
+                    max_workers=int(pool.get("max", 10))
+                )
+
+            return EXECUTORS[key]
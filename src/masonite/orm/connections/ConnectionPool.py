@@ -0,0 +1,272 @@
+import threading
+import time
+from collections import deque
+
+
+class ConnectionPool:
+    """A bounded, thread safe pool of database connections.
+
+    Connections are checked out by a single caller at a time and must be checked
+    back in when the caller is done with them. When every connection is in use
+    callers block until one is returned or the timeout is reached.
+    """
+
+    def __init__(
+        self,
+        creator,
+        min_size=1,
+        max_size=10,
+        timeout=30,
+        recycle=3600,
+        idle_timeout=600,
+        ping_interval=30,
+        ping=None,
+        close=None,
+    ):
+        """ConnectionPool initializer
+
+        Arguments:
+            creator {callable} -- A callable that opens and returns a new connection.
+
+        Keyword Arguments:
+            min_size {int} -- The number of connections to keep open when idle. (default: {1})
+            max_size {int} -- The maximum number of open connections. (default: {10})
+            timeout {int|float} -- Seconds to wait for a free connection. (default: {30})
+            recycle {int|float} -- Seconds after which a connection is closed and replaced. (default: {3600})
+            idle_timeout {int|float} -- Seconds a connection above the minimum may stay idle. (default: {600})
+            ping_interval {int|float} -- Idle seconds after which a connection is health checked. (default: {30})
+            ping {callable} -- A callable returning whether a connection is still alive. (default: {None})
+            close {callable} -- A callable used to close a connection. (default: {None})
+        """
+        if max_size < 1:
+            raise ValueError("The pool 'max' size must be at least 1")
+
+        self.creator = creator
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self._ping = ping
+        self._close = close
+
+        self._idle = deque()
+        self._created_at = {}
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+
+    @classmethod
+    def from_config(cls, creator, config, **kwargs):
+        """Creates a pool from the 'pool' dictionary of a connection in 'config/database.py'.
+
+        Arguments:
+            creator {callable} -- A callable that opens and returns a new connection.
+            config {dict} -- A dictionary of pool settings.
+
+        Returns:
+            ConnectionPool
+        """
+        config = config or {}
+        return cls(
+            creator,
+            min_size=int(config.get("min", 1)),
+            max_size=int(config.get("max", 10)),
+            timeout=float(config.get("timeout", 30)),
+            recycle=float(config.get("recycle", 3600)),
+            idle_timeout=float(config.get("idle_timeout", 600)),
+            ping_interval=float(config.get("ping_interval", 30)),
+            **kwargs
+        )
+
+    def fill(self):
+        """Opens connections until the minimum size of the pool is reached.
+
+        Returns:
+            self
+        """
+        while True:
+            with self._condition:
+                if self._closed or self._size >= self.min_size:
+                    return self
+                self._size += 1
+
+            try:
+                connection = self._create()
+            except Exception:
+                self._forget()
+                raise
+
+            self.checkin(connection)
+
+    def checkout(self, timeout=None):
+        """Takes a connection out of the pool, opening a new one if the pool is not full.
+
+        Keyword Arguments:
+            timeout {int|float} -- Seconds to wait for a connection. Defaults to the pool timeout. (default: {None})
+
+        Raises:
+            TimeoutError: Raised when no connection was returned to the pool in time.
+
+        Returns:
+            object -- A connection created by the creator callable.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            connection, idle_since, create = None, None, False
+
+            with self._condition:
+                if self._closed:
+                    raise ValueError("Cannot checkout a connection from a closed pool")
+
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            "Timed out after {} seconds waiting for a database connection".format(
+                                timeout
+                            )
+                        )
+                    self._condition.wait(remaining)
+
+                if self._idle:
+                    connection, idle_since = self._idle.pop()
+                else:
+                    self._size += 1
+                    create = True
+
+            if create:
+                try:
+                    return self._create()
+                except Exception:
+                    self._forget()
+                    raise
+
+            if self._is_expired(connection) or not self._is_healthy(
+                connection, idle_since
+            ):
+                self.discard(connection)
+                continue
+
+            return connection
+
+    def checkin(self, connection):
+        """Returns a connection to the pool so it can be used by another caller.
+
+        Arguments:
+            connection {object} -- A connection that was checked out of this pool.
+        """
+        if self._closed or self._is_expired(connection):
+            self.discard(connection)
+            return
+
+        with self._condition:
+            self._idle.append((connection, time.monotonic()))
+            stale = self._reap_idle()
+            self._condition.notify()
+
+        for connection in stale:
+            self._close_connection(connection)
+
+    def discard(self, connection):
+        """Closes a connection and removes it from the pool.
+
+        This should be used for connections that errored and can no longer be trusted.
+
+        Arguments:
+            connection {object} -- A connection that was checked out of this pool.
+        """
+        self._created_at.pop(id(connection), None)
+        self._close_connection(connection)
+        self._forget()
+
+    def close(self):
+        """Closes every idle connection and stops the pool from handing out new ones.
+        """
+        with self._condition:
+            self._closed = True
+            connections = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(connections)
+            self._condition.notify_all()
+
+        for connection in connections:
+            self._created_at.pop(id(connection), None)
+            self._close_connection(connection)
+
+    def stats(self):
+        """Returns the current size of the pool.
+
+        Returns:
+            dict -- A dictionary with the number of open, idle and checked out connections.
+        """
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+            }
+
+    def _create(self):
+        connection = self.creator()
+        self._created_at[id(connection)] = time.monotonic()
+        return connection
+
+    def _forget(self):
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _reap_idle(self):
+        """Removes connections that sat idle for too long while keeping the minimum size.
+
+        The idle deque is used as a stack so the oldest connections are on the left.
+        Must be called while holding the pool lock.
+
+        Returns:
+            list -- The connections that should be closed.
+        """
+        stale = []
+        now = time.monotonic()
+        while (
+            self._idle
+            and self._size > self.min_size
+            and now - self._idle[0][1] > self.idle_timeout
+        ):
+            connection, _ = self._idle.popleft()
+            self._created_at.pop(id(connection), None)
+            self._size -= 1
+            stale.append(connection)
+
+        return stale
+
+    def _is_expired(self, connection):
+        created_at = self._created_at.get(id(connection))
+        if created_at is None:
+            return True
+
+        return time.monotonic() - created_at > self.recycle
+
+    def _is_healthy(self, connection, idle_since):
+        if not self._ping or time.monotonic() - idle_since < self.ping_interval:
+            return True
+
+        try:
+            return self._ping(connection) is not False
+        except Exception:
+            return False
+
+    def _close_connection(self, connection):
+        if not self._close:
+            return
+
+        try:
+            self._close(connection)
+        except Exception:
+            pass
+
+    def __len__(self):
+        return self._size
@@ -1,33 +1,127 @@
+import contextvars
+import functools
+import itertools
+import threading
+import weakref
+
 import pymysql
+from pymysql.constants import CLIENT
 
+from ..cache import LRUCache
+from ..events.QueryEvents import instrumented, instrumented_stream
 from .BaseConnection import BaseConnection
+from .ConnectionPool import ConnectionPool
+
+CONNECTION_POOLS = {}
+CONNECTION_POOLS_LOCK = threading.Lock()
+TRANSACTIONS = contextvars.ContextVar("masonite_mysql_transactions", default={})
+STATEMENT_CACHES = weakref.WeakKeyDictionary()
+STATEMENT_STATS = {"hits": 0, "prepares": 0, "evictions": 0}
+STATEMENT_LOCK = threading.Lock()
+STATEMENT_NAMES = itertools.count(1)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_placeholders(query):
+    """Converts the qmark placeholders of a query once per distinct query string.
 
-import random
+    Arguments:
+        query {string} -- A string query. This could be a qmarked string or a regular query.
 
-CONNECTION_POOL = []
+    Returns:
+        tuple -- The query with pymysql placeholders, the query with server side
+                placeholders and the number of placeholders.
+    """
+    return (
+        query.replace("'?'", "%s"),
+        query.replace("'?'", "?"),
+        query.count("'?'"),
+    )
 
 
 class MySQLConnection(BaseConnection):
     """MYSQL Connection class.
     """
 
+    _pool = None
+    _transaction = None
+    shares_transactions = True
+
     def make_connection(self):
-        """This sets the connection on the connection class
+        """This checks a connection out of the pool and sets it on the connection class
+
+        Raises:
+            ValueError: Raised when the connection of the open transaction is running another query.
         """
-        if len(CONNECTION_POOL) < 10:
-            self._connection = pymysql.connect(
-                cursorclass=pymysql.cursors.DictCursor,
-                autocommit=True,
-                **self.get_connection_details(),
-            )
-            CONNECTION_POOL.append(self._connection)
-        else:
-            self._connection = CONNECTION_POOL[
-                random.randint(0, len(CONNECTION_POOL) - 1)
-            ]
+        if self._connection is None:
+            transaction = self._get_transaction()
+            if transaction is not None:
+                if not transaction["lock"].acquire(blocking=False):
+                    raise ValueError(
+                        "The queries of a transaction cannot run concurrently."
+                    )
+
+                self._transaction = transaction
+                self._connection = transaction["connection"]
+                return self
+
+            self._pool = self.get_pool()
+            self._connection = self._pool.checkout()
 
         return self
 
+    def get_pool(self):
+        """Gets the connection pool for these connection details, creating it on first use.
+
+        The pool is configured with the 'pool' dictionary of the connection in 'config/database.py'
+        and opens its 'min' connections when it is created.
+
+        Returns:
+            masonite.orm.connections.ConnectionPool -- The pool shared by every connection with the same details.
+        """
+        connection_details = self.get_connection_details()
+        key = self._get_pool_key()
+
+        pool = CONNECTION_POOLS.get(key)
+        if pool is not None:
+            return pool
+
+        with CONNECTION_POOLS_LOCK:
+            pool = CONNECTION_POOLS.get(key)
+            if pool is not None:
+                return pool
+
+            pool = CONNECTION_POOLS[key] = ConnectionPool.from_config(
+                lambda: pymysql.connect(
+                    cursorclass=pymysql.cursors.DictCursor,
+                    autocommit=True,
+                    **connection_details,
+                ),
+                self.connection_details.get("pool"),
+                ping=lambda connection: connection.ping(reconnect=False),
+                close=lambda connection: connection.close(),
+            )
+
+        return pool.fill()
+
+    def _get_pool_key(self):
+        return str(sorted(self.get_connection_details().items()))
+
+    def release(self):
+        """Returns the connection to the pool it was checked out from.
+
+        Connections pinned by a transaction stay with the transaction.
+        """
+        if self._connection is not None and self._pool is not None:
+            self._pool.checkin(self._connection)
+
+        if self._transaction is not None:
+            self._transaction["lock"].release()
+
+        self._connection = None
+        self._pool = None
+        self._transaction = None
+
     def get_connection_details(self):
         """This is responsible for standardizing the normal connection
         details and passing it into the connection.
@@ -44,6 +138,10 @@ class MySQLConnection(BaseConnection):
         connection_details.setdefault("port", int(self.connection_details.get("port")))
         connection_details.setdefault("db", self.connection_details.get("database"))
         connection_details.update(self.connection_details.get("options", {}))
+        if self.prepares_statements():
+            connection_details["client_flag"] = (
+                connection_details.get("client_flag", 0) | CLIENT.MULTI_STATEMENTS
+            )
 
         return connection_details
 
@@ -52,28 +150,246 @@ class MySQLConnection(BaseConnection):
         return self().get_connection_details().get("db")
 
     def reconnect(self):
-        pass
+        """Throws away the current connection and checks out a healthy one.
+        """
+        if self._connection is not None and self._pool is not None:
+            self._pool.discard(self._connection)
 
-    def commit(self):
-        """Transaction
+        self._connection = None
+        self._pool = None
+        return self.make_connection()
+
+    def _get_transaction(self):
+        """Gets the transaction open in the current context for these connection details.
+
+        Returns:
+            dict|None
         """
-        pass
+        transactions = TRANSACTIONS.get()
+        if not transactions:
+            return None
+
+        return transactions.get(self._get_pool_key())
 
     def begin_transaction(self):
-        """Transaction
+        """Starts a transaction, or a savepoint when a transaction is already open.
+
+        The first level checks a connection out of the pool and pins it to the current
+        context, the thread or asyncio task, so every query of the context runs inside
+        the transaction until it ends.
         """
-        pass
+        transaction = self._get_transaction()
+        if transaction is not None:
+            self._execute_on(
+                transaction["connection"],
+                "SAVEPOINT {}".format(self.get_savepoint_name(transaction["level"])),
+            )
+            transaction["level"] += 1
+            return
+
+        pool = self.get_pool()
+        connection = pool.checkout()
+        try:
+            connection.begin()
+        except Exception:
+            pool.discard(connection)
+            raise
+
+        transactions = dict(TRANSACTIONS.get())
+        transactions[self._get_pool_key()] = {
+            "connection": connection,
+            "pool": pool,
+            "level": 1,
+            "lock": threading.Lock(),
+        }
+        TRANSACTIONS.set(transactions)
+
+    def commit(self):
+        """Commits the transaction, or releases the last savepoint of a nested transaction.
+        """
+        transaction = self._get_open_transaction()
+        if transaction["level"] > 1:
+            transaction["level"] -= 1
+            self._execute_on(
+                transaction["connection"],
+                "RELEASE SAVEPOINT {}".format(
+                    self.get_savepoint_name(transaction["level"])
+                ),
+            )
+            return
+
+        self._end_transaction(transaction, transaction["connection"].commit)
 
     def rollback(self):
-        """Transaction
+        """Rolls back the transaction, or only the last savepoint of a nested transaction.
         """
-        pass
+        transaction = self._get_open_transaction()
+        if transaction["level"] > 1:
+            transaction["level"] -= 1
+            savepoint = self.get_savepoint_name(transaction["level"])
+            self._execute_on(
+                transaction["connection"], "ROLLBACK TO SAVEPOINT {}".format(savepoint)
+            )
+            self._execute_on(
+                transaction["connection"], "RELEASE SAVEPOINT {}".format(savepoint)
+            )
+            return
+
+        self._end_transaction(transaction, transaction["connection"].rollback)
 
     def transaction_level(self):
-        """Transaction
+        """Gets the number of open transaction levels in the current context.
+
+        Returns:
+            int
+        """
+        transaction = self._get_transaction()
+        return transaction["level"] if transaction else 0
+
+    def _get_open_transaction(self):
+        transaction = self._get_transaction()
+        if transaction is None:
+            raise ValueError("There is no open transaction on this connection")
+
+        return transaction
+
+    def _end_transaction(self, transaction, finish):
+        """Unpins the transaction connection and returns it to the pool.
+
+        Arguments:
+            transaction {dict} -- The open transaction.
+            finish {callable} -- Commits or rolls back the transaction.
         """
-        pass
+        transactions = dict(TRANSACTIONS.get())
+        del transactions[self._get_pool_key()]
+        TRANSACTIONS.set(transactions)
+        self.release()
+        try:
+            finish()
+        except Exception:
+            transaction["pool"].discard(transaction["connection"])
+            raise
+
+        transaction["pool"].checkin(transaction["connection"])
+
+    @staticmethod
+    def _execute_on(connection, query):
+        with connection.cursor() as cursor:
+            cursor.execute(query)
+
+    def _execute(self, cursor, query, bindings):
+        """Executes a query on a cursor, as a prepared statement when they are enabled.
 
+        Arguments:
+            cursor {pymysql.cursors.Cursor} -- A cursor of the checked out connection.
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+        """
+        query, statement, placeholders = compile_placeholders(query)
+        if bindings and placeholders == len(bindings) and self.prepares_statements():
+            self._execute_prepared(cursor, statement, bindings)
+        else:
+            cursor.execute(query, bindings)
+
+    def prepares_statements(self):
+        """Checks if queries with bindings run as server side prepared statements.
+
+        Enabled with the 'prepared_statements' dictionary of the connection in 'config/database.py'.
+        Connections are then opened with multi statement queries enabled so each query
+        still takes a single round trip.
+
+        Returns:
+            bool
+        """
+        options = self.connection_details.get("prepared_statements") or {}
+        return bool(options.get("enabled"))
+
+    def get_statement_cache(self):
+        """Gets the prepared statements of the checked out connection.
+
+        Statements are prepared once per connection and kept in a least recently used
+        cache. Evicted statements are deallocated on the server.
+
+        Returns:
+            masonite.orm.cache.LRUCache -- The statement names keyed by query.
+        """
+        statements = STATEMENT_CACHES.get(self._connection)
+        if statements is None:
+            options = self.connection_details.get("prepared_statements") or {}
+            statements = LRUCache(maxsize=options.get("max", 256))
+            STATEMENT_CACHES[self._connection] = statements
+
+        return statements
+
+    @classmethod
+    def get_statement_stats(cls):
+        """Returns the prepared statement counters of every connection.
+
+        Returns:
+            dict
+        """
+        with STATEMENT_LOCK:
+            stats = dict(STATEMENT_STATS)
+
+        stats["statements"] = sum(len(cache) for cache in STATEMENT_CACHES.values())
+        return stats
+
+    def _execute_prepared(self, cursor, statement, bindings):
+        """Executes a query as a prepared statement in a single round trip.
+
+        The statement is prepared the first time it runs on the checked out connection.
+        Preparing it, setting its variables and executing it are sent as one multi
+        statement query and the cursor is moved on to the results of the 'EXECUTE'.
+        The name of the statement is only kept when the server prepared it.
+
+        Arguments:
+            cursor {pymysql.cursors.Cursor} -- A cursor of the checked out connection.
+            statement {string} -- The query with server side placeholders.
+            bindings {tuple} -- A tuple of bindings
+        """
+        statements = self.get_statement_cache()
+        queries, arguments = [], []
+        prepare = None
+        name = statements.get(statement)
+        if name is None:
+            name = "masonite_statement_{}".format(next(STATEMENT_NAMES))
+            evicted = statements.put(statement, name)
+            for _, old_name in evicted:
+                queries.append("DEALLOCATE PREPARE {}".format(old_name))
+            prepare = len(queries)
+            queries.append("PREPARE {} FROM %s".format(name))
+            arguments.append(statement)
+            self._count_statement("prepares", evictions=len(evicted))
+        else:
+            self._count_statement("hits")
+
+        variables = ["@masonite_{}".format(index) for index in range(len(bindings))]
+        queries.append(
+            "SET " + ", ".join("{} = %s".format(variable) for variable in variables)
+        )
+        queries.append("EXECUTE {} USING {}".format(name, ", ".join(variables)))
+        arguments.extend(bindings)
+
+        completed = 0
+        try:
+            cursor.execute("; ".join(queries), tuple(arguments))
+            completed += 1
+            for _ in range(len(queries) - 1):
+                cursor.nextset()
+                completed += 1
+        except Exception:
+            # A statement the server did not prepare must not be executed by name.
+            if prepare is not None and completed <= prepare:
+                statements.pop(statement)
+            raise
+
+    @staticmethod
+    def _count_statement(counter, evictions=0):
+        with STATEMENT_LOCK:
+            STATEMENT_STATS[counter] += 1
+            STATEMENT_STATS["evictions"] += evictions
+
+    @instrumented()
     def query(self, query, bindings=(), results="*"):
         """Make the actual query that will reach the database and come back with a result.
 
@@ -88,14 +404,80 @@ class MySQLConnection(BaseConnection):
         Returns:
             dict|None -- Returns a dictionary of results or None
         """
-        query = query.replace("'?'", "%s")
-        print("running query", query)
+        self.make_connection()
         try:
             with self._connection.cursor() as cursor:
-                cursor.execute(query, bindings)
+                self._execute(cursor, query, bindings)
                 if results == 1:
                     return cursor.fetchone()
                 else:
                     return cursor.fetchall()
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            if self._pool is not None:
+                self._pool.discard(self._connection)
+                self._pool = None
+            raise
+        finally:
+            self.release()
+
+    @instrumented(rows=lambda result: len(result[1]))
+    def query_tuples(self, query, bindings=()):
+        """Make a query and return the rows as tuples along with the selected column names.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Returns:
+            tuple -- A tuple of the column names and a tuple of rows.
+        """
+        self.make_connection()
+        try:
+            with self._connection.cursor(pymysql.cursors.Cursor) as cursor:
+                self._execute(cursor, query, bindings)
+                columns = tuple(column[0] for column in cursor.description or ())
+                return columns, cursor.fetchall()
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            if self._pool is not None:
+                self._pool.discard(self._connection)
+                self._pool = None
+            raise
+        finally:
+            self.release()
+
+    @instrumented_stream
+    def stream(self, query, bindings=(), chunk_size=1000):
+        """Make a query and yield the results one row at a time instead of fetching them all.
+
+        Rows are read from an unbuffered server side cursor so only 'chunk_size' rows are
+        held in memory. The connection stays checked out until the generator is exhausted.
+        A connection abandoned with unread rows is discarded instead of returned to the pool.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Keyword Arguments:
+            chunk_size {int} -- The number of rows fetched from the server at a time. (default: {1000})
+
+        Returns:
+            generator -- Yields a dictionary for each row.
+        """
+        query = compile_placeholders(query)[0]
+        self.make_connection()
+        finished = False
+        try:
+            cursor = self._connection.cursor(pymysql.cursors.SSDictCursor)
+            cursor.execute(query, bindings)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+            cursor.close()
+            finished = True
         finally:
-            pass
+            if not finished and self._pool is not None:
+                self._pool.discard(self._connection)
+                self._pool = None
+            self.release()
@@ -1,21 +1,73 @@
+import contextvars
 import sqlite3
-from ..grammar import GrammarFactory
+import threading
+
+from ..events.QueryEvents import instrumented, instrumented_stream
 from .BaseConnection import BaseConnection
 
+CONNECTIONS = threading.local()
+TRANSACTIONS = contextvars.ContextVar("masonite_sqlite_transactions", default={})
+
 
 class SQLiteConnection(BaseConnection):
     """SQLite Connection class.
+
+    SQLite handles are opened once per thread and database and are reused by every
+    query on that thread instead of reopening the database file for each statement.
+    A transaction gets a handle of its own, so tasks sharing a thread each have
+    their own transaction. In memory databases only exist on the handle of their
+    thread, which their transactions therefore use.
     """
 
     def make_connection(self):
         """This sets the connection on the connection class
         """
+        if self._connection is not None:
+            return self
+
         connection_details = self.get_connection_details()
-        self._connection = sqlite3.connect(connection_details.get("db"))
-        self._connection.row_factory = sqlite3.Row
+        database = connection_details.get("db")
+
+        transaction = TRANSACTIONS.get().get(database)
+        if transaction is not None:
+            self._connection = transaction["connection"]
+            return self
+
+        handles = self._get_thread_handles()
+        self._connection = handles.get(database)
+        if self._connection is None:
+            self._connection = self._open(database)
+            handles[database] = self._connection
 
         return self
 
+    def _open(self, database):
+        """Opens a new SQLite handle and applies the configured PRAGMAs.
+
+        Arguments:
+            database {string} -- The path to the database file.
+
+        Returns:
+            sqlite3.Connection
+        """
+        connection = sqlite3.connect(database, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+
+        for pragma, value in self.get_pragmas().items():
+            connection.execute("PRAGMA {} = {}".format(pragma, value))
+
+        return connection
+
+    def get_pragmas(self):
+        """Gets the PRAGMAs that should be set on each new handle.
+
+        These come from the 'pragmas' dictionary of the connection in 'config/database.py'.
+
+        Returns:
+            dict
+        """
+        return self.connection_details.get("pragmas", {})
+
     def get_connection_details(self):
         """This is responsible for standardizing the normal connection
         details and passing it into the connection.
@@ -24,30 +76,168 @@ class SQLiteConnection(BaseConnection):
         that should pass to your connection method
         """
         connection_details = {}
-        connection_details.setdefault("db", self.connections.get("database"))
-        connection_details.update(self.connections.get("options", {}))
+        connection_details.setdefault("db", self.connection_details.get("database"))
+        connection_details.update(self.connection_details.get("options", {}))
 
         return connection_details
 
+    @staticmethod
+    def _get_thread_handles():
+        if not hasattr(CONNECTIONS, "handles"):
+            CONNECTIONS.handles = {}
+
+        return CONNECTIONS.handles
+
+    def release(self):
+        """Stops using the handle. The handle stays open for the next query on this thread.
+        """
+        self._connection = None
+
+    def close(self):
+        """Closes the handle of the current thread for this database.
+
+        A transaction open in the current context is abandoned.
+        """
+        database = self.get_connection_details().get("db")
+        transaction = self._get_transaction()
+        if transaction is not None:
+            self._forget_transaction(transaction)
+
+        connection = self._get_thread_handles().pop(database, None)
+        if connection is not None:
+            connection.close()
+
+        self._connection = None
+
     def reconnect(self):
-        pass
+        self.close()
+        return self.make_connection()
 
-    def commit(self):
-        """Transaction
+    def _get_transaction(self):
+        """Gets the transaction open in the current context for this database.
+
+        Returns:
+            dict|None
         """
-        pass
+        return TRANSACTIONS.get().get(self._get_database())
 
     def begin_transaction(self):
-        """Transaction
+        """Starts a transaction, or a savepoint when a transaction is already open.
+
+        The first level opens a handle for the transaction and pins it to the current
+        context, the thread or asyncio task, so every query of the context runs inside
+        the transaction until it ends.
         """
-        pass
+        transaction = self._get_transaction()
+        if transaction is not None:
+            self._execute(
+                "SAVEPOINT {}".format(self.get_savepoint_name(transaction["level"]))
+            )
+            transaction["level"] += 1
+            return
+
+        database = self._get_database()
+        owned = not self._is_memory(database)
+        if owned:
+            connection = self._open(database)
+        else:
+            connection = self.make_connection()._connection
+            self.release()
+
+        try:
+            connection.execute("BEGIN")
+        except Exception:
+            if owned:
+                connection.close()
+            raise
+
+        transactions = dict(TRANSACTIONS.get())
+        transactions[database] = {"connection": connection, "level": 1, "owned": owned}
+        TRANSACTIONS.set(transactions)
+
+    def commit(self):
+        """Commits the transaction, or releases the last savepoint of a nested transaction.
+        """
+        transaction = self._get_open_transaction()
+        if transaction["level"] > 1:
+            transaction["level"] -= 1
+            self._execute(
+                "RELEASE SAVEPOINT {}".format(
+                    self.get_savepoint_name(transaction["level"])
+                )
+            )
+            return
+
+        self._end_transaction(transaction, "COMMIT")
 
     def rollback(self):
-        """Transaction
+        """Rolls back the transaction, or only the last savepoint of a nested transaction.
+        """
+        transaction = self._get_open_transaction()
+        if transaction["level"] > 1:
+            transaction["level"] -= 1
+            savepoint = self.get_savepoint_name(transaction["level"])
+            self._execute("ROLLBACK TO SAVEPOINT {}".format(savepoint))
+            self._execute("RELEASE SAVEPOINT {}".format(savepoint))
+            return
+
+        self._end_transaction(transaction, "ROLLBACK")
+
+    def transaction_level(self):
+        """Gets the number of open transaction levels in the current context.
+
+        Returns:
+            int
         """
-        pass
+        transaction = self._get_transaction()
+        return transaction["level"] if transaction else 0
+
+    def _get_open_transaction(self):
+        transaction = self._get_transaction()
+        if transaction is None:
+            raise ValueError("There is no open transaction on this connection")
+
+        return transaction
+
+    def _end_transaction(self, transaction, query):
+        """Commits or rolls back the transaction and unpins its handle.
+
+        Arguments:
+            transaction {dict} -- The open transaction.
+            query {string} -- Either 'COMMIT' or 'ROLLBACK'.
+        """
+        try:
+            transaction["connection"].execute(query)
+        finally:
+            self._forget_transaction(transaction)
+
+    def _forget_transaction(self, transaction):
+        transactions = dict(TRANSACTIONS.get())
+        del transactions[self._get_database()]
+        TRANSACTIONS.set(transactions)
+        if transaction["owned"]:
+            transaction["connection"].close()
 
-    def query(self, query, bindings, results="*"):
+        self._connection = None
+
+    @staticmethod
+    def _is_memory(database):
+        return database in (None, "", ":memory:") or database.startswith(
+            "file::memory:"
+        )
+
+    def _get_database(self):
+        return self.get_connection_details().get("db")
+
+    def _execute(self, query):
+        self.make_connection()
+        try:
+            self._connection.execute(query)
+        finally:
+            self.release()
+
+    @instrumented()
+    def query(self, query, bindings=(), results="*"):
         """Make the actual query that will reach the database and come back with a result.
 
         Arguments:
@@ -62,14 +252,68 @@ class SQLiteConnection(BaseConnection):
             dict|None -- Returns a dictionary of results or None
         """
         query = query.replace("'?'", "?")
+        self.make_connection()
+        cursor = self._connection.cursor()
         try:
-            cursor = self._connection.cursor()
             cursor.execute(query, bindings)
             if results == 1:
-                result = [dict(row) for row in cursor.fetchall()]
-                if result:
-                    return result[0]
+                row = cursor.fetchone()
+                if row:
+                    return dict(row)
             else:
                 return [dict(row) for row in cursor.fetchall()]
         finally:
-            self._connection.close()
+            cursor.close()
+            self.release()
+
+    @instrumented(rows=lambda result: len(result[1]))
+    def query_tuples(self, query, bindings=()):
+        """Make a query and return the rows as tuples along with the selected column names.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Returns:
+            tuple -- A tuple of the column names and a list of rows.
+        """
+        query = query.replace("'?'", "?")
+        self.make_connection()
+        cursor = self._connection.cursor()
+        cursor.row_factory = None
+        try:
+            cursor.execute(query, bindings)
+            columns = tuple(column[0] for column in cursor.description or ())
+            return columns, cursor.fetchall()
+        finally:
+            cursor.close()
+            self.release()
+
+    @instrumented_stream
+    def stream(self, query, bindings=(), chunk_size=1000):
+        """Make a query and yield the results one row at a time instead of fetching them all.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Keyword Arguments:
+            chunk_size {int} -- The number of rows fetched from the cursor at a time. (default: {1000})
+
+        Returns:
+            generator -- Yields a dictionary for each row.
+        """
+        query = query.replace("'?'", "?")
+        self.make_connection()
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(query, bindings)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            cursor.close()
+            self.release()
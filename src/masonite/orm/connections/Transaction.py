@@ -0,0 +1,71 @@
+import functools
+
+
+class Transaction:
+    """Runs a block of queries inside a database transaction.
+
+    The transaction is committed when the block finishes and rolled back when it
+    raises. Transactions can be nested, in which case the inner blocks use savepoints.
+    It can be used as a context manager or as a decorator:
+
+        with transaction():
+            User.create({"name": "Joe"})
+
+        @transaction("sqlite")
+        def import_users():
+            ...
+
+        @transaction
+        def import_posts():
+            ...
+    """
+
+    def __init__(self, connection="default"):
+        """Transaction initializer
+
+        Keyword Arguments:
+            connection {string} -- The name of the connection in 'config/database.py'. (default: {"default"})
+        """
+        self.connection = connection
+        self._connections = []
+
+    def __enter__(self):
+        from .ConnectionFactory import ConnectionFactory
+
+        connection = ConnectionFactory().make(self.connection)()
+        connection.begin_transaction()
+        self._connections.append(connection)
+        return connection
+
+    def __exit__(self, exception_type, exception, traceback):
+        connection = self._connections.pop()
+        if exception_type is None:
+            connection.commit()
+        else:
+            connection.rollback()
+
+        return False
+
+    def __call__(self, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with Transaction(self.connection):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+
+def transaction(connection="default"):
+    """Runs a block of queries inside a database transaction.
+
+    Keyword Arguments:
+        connection {string|callable} -- The name of the connection in 'config/database.py'.
+            A function decorated without arguments runs on the default connection. (default: {"default"})
+
+    Returns:
+        masonite.orm.connections.Transaction|callable
+    """
+    if callable(connection):
+        return Transaction()(connection)
+
+    return Transaction(connection)
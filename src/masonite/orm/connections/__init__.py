@@ -1 +1,4 @@
+from .AsyncConnection import AsyncConnection
 from .ConnectionFactory import ConnectionFactory
+from .ConnectionPool import ConnectionPool
+from .Transaction import Transaction, transaction
@@ -0,0 +1,101 @@
+import logging
+import re
+import threading
+from collections import Counter
+
+from .QueryEvents import QueryEvents
+
+LITERALS = re.compile(r"'(?:[^']|'')*'")
+
+
+class QueryCounter:
+    """Counts the queries run on the current thread and flags repeated query shapes.
+
+    A query shape is the SQL with its quoted values replaced by placeholders. A shape
+    that runs more times than the threshold is usually a relationship loaded once per
+    model instead of eager loaded, the N+1 pattern. Use it as a context manager around
+    a request:
+
+        with QueryCounter(threshold=5) as counter:
+            ...
+
+        counter.violations  # {"SELECT * FROM `users` WHERE `users`.`id` = '?'": 20}
+    """
+
+    def __init__(self, threshold=5, on_violation=None, logger=None):
+        """QueryCounter initializer
+
+        Keyword Arguments:
+            threshold {int} -- The number of times a shape may run before it is flagged. (default: {5})
+            on_violation {callable} -- Called with the shape and count when a shape is flagged.
+                    A warning is logged when omitted. (default: {None})
+            logger {logging.Logger} -- The logger written to. (default: {None})
+        """
+        self.threshold = threshold
+        self.on_violation = on_violation
+        self.logger = logger or logging.getLogger("masonite.orm.queries")
+        self.counts = Counter()
+        self.violations = {}
+        self._thread = None
+
+    @staticmethod
+    def get_shape(sql):
+        """Gets the shape of a query.
+
+        Arguments:
+            sql {string} -- A qmark or regular query.
+
+        Returns:
+            string
+        """
+        if "'" not in sql:
+            return sql
+
+        return LITERALS.sub("'?'", sql)
+
+    def count(self, event):
+        """Counts a query and flags its shape once it runs more times than the threshold.
+
+        Arguments:
+            event {masonite.orm.events.QueryEvent} -- The query being run.
+        """
+        if threading.get_ident() != self._thread:
+            return
+
+        shape = self.get_shape(event.sql)
+        self.counts[shape] += 1
+        count = self.counts[shape]
+        if count <= self.threshold:
+            return
+
+        self.violations[shape] = count
+        if count > self.threshold + 1:
+            return
+
+        if self.on_violation is not None:
+            self.on_violation(shape, count)
+        else:
+            self.logger.warning(
+                "Possible N+1 query on the '%s' connection, ran more than %s times: %s",
+                event.connection,
+                self.threshold,
+                shape,
+            )
+
+    @property
+    def total(self):
+        """Gets the number of queries counted.
+
+        Returns:
+            int
+        """
+        return sum(self.counts.values())
+
+    def __enter__(self):
+        self._thread = threading.get_ident()
+        QueryEvents.listen("before", self.count)
+        return self
+
+    def __exit__(self, *args):
+        QueryEvents.forget("before", self.count)
+        self._thread = None
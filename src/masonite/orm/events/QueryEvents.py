@@ -0,0 +1,187 @@
+import functools
+import time
+
+
+class QueryEvent:
+    """The details of a query passed to query listeners.
+
+    The duration, row count and error are only set once the query has run.
+    """
+
+    __slots__ = ("sql", "bindings", "connection", "duration", "rows", "error")
+
+    def __init__(self, sql, bindings, connection):
+        """QueryEvent initializer
+
+        Arguments:
+            sql {string} -- The query sent to the connection.
+            bindings {tuple} -- The bindings of the query.
+            connection {string} -- The name of the connection.
+        """
+        self.sql = sql
+        self.bindings = bindings
+        self.connection = connection
+        self.duration = None
+        self.rows = None
+        self.error = None
+
+
+class QueryEvents:
+    """Dispatches the queries run by the connection classes to listeners.
+
+    Listeners of the 'before' event are called with a QueryEvent before the query
+    is executed and listeners of the 'after' event once it has finished or failed.
+    Queries are not timed at all while there are no listeners.
+    """
+
+    listeners = {"before": [], "after": []}
+    enabled = False
+
+    @classmethod
+    def listen(cls, event, listener):
+        """Registers a listener for an event.
+
+        Arguments:
+            event {string} -- Either 'before' or 'after'.
+            listener {callable} -- Called with a QueryEvent.
+
+        Raises:
+            ValueError: Raised when the event does not exist.
+
+        Returns:
+            callable -- The listener.
+        """
+        if event not in cls.listeners:
+            raise ValueError("There is no '{}' query event".format(event))
+
+        cls.listeners[event] = cls.listeners[event] + [listener]
+        cls.enabled = True
+        return listener
+
+    @classmethod
+    def forget(cls, event, listener):
+        """Removes a listener from an event.
+
+        Arguments:
+            event {string} -- Either 'before' or 'after'.
+            listener {callable} -- A registered listener.
+        """
+        cls.listeners[event] = [
+            registered for registered in cls.listeners[event] if registered != listener
+        ]
+        cls.enabled = any(cls.listeners.values())
+
+    @classmethod
+    def fire(cls, event, payload):
+        """Calls the listeners of an event.
+
+        Arguments:
+            event {string} -- Either 'before' or 'after'.
+            payload {QueryEvent} -- The query being run.
+        """
+        for listener in cls.listeners[event]:
+            listener(payload)
+
+
+def count_rows(result):
+    """Counts the rows returned by a connection 'query' method.
+
+    Arguments:
+        result {list|dict|None} -- The result of the query.
+
+    Returns:
+        int
+    """
+    if result is None:
+        return 0
+
+    if isinstance(result, dict):
+        return 1
+
+    return len(result)
+
+
+def instrumented(rows=count_rows):
+    """Decorates a connection method so the queries it runs are dispatched to the query listeners.
+
+    Keyword Arguments:
+        rows {callable} -- Counts the rows of the result of the method. (default: {count_rows})
+
+    Returns:
+        callable
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, query, bindings=(), *args, **kwargs):
+            if not QueryEvents.enabled:
+                return method(self, query, bindings, *args, **kwargs)
+
+            event = QueryEvent(query, bindings, self.get_connection_name())
+            QueryEvents.fire("before", event)
+            start = time.perf_counter()
+            try:
+                result = method(self, query, bindings, *args, **kwargs)
+            except Exception as error:
+                event.duration = time.perf_counter() - start
+                event.error = error
+                QueryEvents.fire("after", event)
+                raise
+
+            event.duration = time.perf_counter() - start
+            event.rows = rows(result)
+            QueryEvents.fire("after", event)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def instrumented_stream(method):
+    """Decorates a connection method that yields rows so its query is dispatched to the query listeners.
+
+    The 'before' event is fired when the first row is requested and the 'after' event
+    once the stream is exhausted, closed or has failed. The duration only counts the
+    time spent reading rows, not the time the caller spends between them.
+
+    Arguments:
+        method {callable} -- A generator method of a connection class.
+
+    Returns:
+        callable
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, query, bindings=(), *args, **kwargs):
+        if not QueryEvents.enabled:
+            yield from method(self, query, bindings, *args, **kwargs)
+            return
+
+        event = QueryEvent(query, bindings, self.get_connection_name())
+        QueryEvents.fire("before", event)
+        stream = method(self, query, bindings, *args, **kwargs)
+        duration, rows = 0, 0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    row = next(stream)
+                except StopIteration:
+                    break
+                finally:
+                    duration += time.perf_counter() - start
+
+                rows += 1
+                yield row
+        except Exception as error:
+            event.error = error
+            raise
+        finally:
+            stream.close()
+            event.duration = duration
+            if event.error is None:
+                event.rows = rows
+            QueryEvents.fire("after", event)
+
+    return wrapper
@@ -0,0 +1,54 @@
+import logging
+
+from .QueryEvents import QueryEvents
+
+
+class SlowQueryLog:
+    """Logs the queries that take longer than a threshold.
+
+    Register it once when the application boots or use it as a context manager:
+
+        SlowQueryLog(threshold=0.5).register()
+    """
+
+    def __init__(self, threshold=1.0, logger=None):
+        """SlowQueryLog initializer
+
+        Keyword Arguments:
+            threshold {float} -- The number of seconds after which a query is logged. (default: {1.0})
+            logger {logging.Logger} -- The logger written to. (default: {None})
+        """
+        self.threshold = threshold
+        self.logger = logger or logging.getLogger("masonite.orm.queries")
+
+    def register(self):
+        """Starts logging slow queries.
+
+        Returns:
+            self
+        """
+        QueryEvents.listen("after", self)
+        return self
+
+    def unregister(self):
+        """Stops logging slow queries.
+        """
+        QueryEvents.forget("after", self)
+
+    def __call__(self, event):
+        if event.duration < self.threshold:
+            return
+
+        self.logger.warning(
+            "Slow query on the '%s' connection took %.2fms: %s %r",
+            event.connection,
+            event.duration * 1000,
+            event.sql,
+            event.bindings,
+        )
+
+    def __enter__(self):
+        return self.register()
+
+    def __exit__(self, *args):
+        self.unregister()
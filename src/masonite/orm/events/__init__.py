@@ -0,0 +1,3 @@
+from .QueryCounter import QueryCounter
+from .QueryEvents import QueryEvent, QueryEvents
+from .SlowQueryLog import SlowQueryLog
@@ -2,6 +2,16 @@ class QueryExpression:
     """A helper class to manage query expressions.
     """
 
+    __slots__ = (
+        "column",
+        "equality",
+        "value",
+        "value_type",
+        "keyword",
+        "raw",
+        "bindings",
+    )
+
     def __init__(
         self,
         column,
@@ -25,6 +35,8 @@ class HavingExpression:
     """A helper class to manage having expressions.
     """
 
+    __slots__ = ("column", "equality", "value", "value_type")
+
     def __init__(self, column, equality=None, value=None):
         self.column = column
 
@@ -41,6 +53,8 @@ class JoinExpression:
     """A helper class to manage join expressions.
     """
 
+    __slots__ = ("foreign_table", "column1", "equality", "column2", "clause")
+
     def __init__(self, foreign_table, column1, equality, column2, clause="inner"):
         self.foreign_table = foreign_table
         self.column1 = column1
@@ -53,6 +67,8 @@ class UpdateQueryExpression:
     """A helper class to manage update expressions.
     """
 
+    __slots__ = ("column", "value", "update_type")
+
     def __init__(self, column, value=None, update_type="keyvalue"):
         self.column = column
         self.value = value
@@ -63,13 +79,25 @@ class BetweenExpression:
     """A helper class to manage where between expressions.
     """
 
-    def __init__(self, column, low, high, equality="BETWEEN"):
+    __slots__ = (
+        "column",
+        "low",
+        "high",
+        "equality",
+        "value",
+        "value_type",
+        "keyword",
+        "raw",
+    )
+
+    def __init__(self, column, low, high, equality="BETWEEN", keyword=None):
         self.column = column
         self.low = low
         self.high = high
         self.equality = equality
         self.value = None
         self.value_type = "BETWEEN"
+        self.keyword = keyword
         self.raw = False
 
 
@@ -77,6 +105,8 @@ class SubSelectExpression:
     """A helper class to manage subselect expressions.
     """
 
+    __slots__ = ("builder",)
+
     def __init__(self, builder):
         self.builder = builder
 
@@ -85,6 +115,8 @@ class SubGroupExpression:
     """A helper class to manage subgroup expressions.
     """
 
+    __slots__ = ("builder",)
+
     def __init__(self, builder):
         self.builder = builder
 
@@ -93,6 +125,25 @@ class SelectExpression:
     """A helper class to manage select expressions.
     """
 
+    __slots__ = ("column", "raw")
+
     def __init__(self, column, raw=False):
         self.column = column
         self.raw = raw
+
+
+class Param:
+    """A helper class to mark a value that is bound when a query template is called.
+
+    A parameter that expands is given a list of values when the template is called
+    and gets a placeholder for each of them, like the values of a 'where_in'.
+    """
+
+    __slots__ = ("name", "expand")
+
+    def __init__(self, name, expand=False):
+        self.name = name
+        self.expand = expand
+
+    def __repr__(self):
+        return "param({!r})".format(self.name)
@@ -1,11 +1,12 @@
-import re
+import functools
 
+from ..cache import LRUCache
 from ..expressions.expressions import (
     SubGroupExpression,
     SubSelectExpression,
     SelectExpression,
-    BetweenExpression,
 )
+from .SQLWriter import SQLWriter
 
 
 class BaseGrammar:
@@ -20,6 +21,22 @@ class BaseGrammar:
 
     table = "users"
 
+    """Compiled qmark SQL keyed on the shape of the query.
+    Shared by every grammar since the grammar class is part of the key.
+    """
+    compiled_cache = LRUCache(maxsize=1024)
+
+    """Compiled column identifiers keyed on the grammar class, the table and the column.
+    Cleared when it grows past 4096 identifiers.
+    """
+    identifier_cache = {}
+
+    """The maximum number of bindings the driver accepts in one statement
+    and the maximum number of rows in one insert statement.
+    """
+    parameter_limit = 999
+    insert_row_limit = None
+
     def __init__(
         self,
         columns=(),
@@ -37,6 +54,8 @@ class BaseGrammar:
         creates=(),
         constraints=(),
         foreign_keys=(),
+        keys=(),
+        update_columns=(),
         connection_details={},
     ):
         self._columns = columns
@@ -54,10 +73,14 @@ class BaseGrammar:
         self._creates = creates
         self._constraints = constraints
         self._foreign_keys = foreign_keys
+        self._keys = keys
+        self._update_columns = update_columns
         self._connection_details = connection_details
         self._column = None
 
-        self._bindings = ()
+        self._bindings = []
+
+        self._subqueries = {}
 
         self._sql = ""
 
@@ -69,7 +92,8 @@ class BaseGrammar:
         Returns:
             self
         """
-        self._sql = self.create_format().format(
+        self._sql = self._render(
+            self.create_format(),
             table=self._compile_table(self.table),
             columns=self._compile_create_columns(),
             constraints=self._compile_create_constraints().rstrip(" "),
@@ -83,7 +107,8 @@ class BaseGrammar:
         Returns:
             self
         """
-        self._sql = self.alter_format().format(
+        self._sql = self._render(
+            self.alter_format(),
             table=self._compile_table(self.table),
             columns=self._compile_alter_columns(),
             constraints=self._compile_alter_constraints(),
@@ -269,21 +294,18 @@ class BaseGrammar:
         Returns:
             [type] -- [description]
         """
-        self._sql = (
-            self.select_format()
-            .format(
-                columns=self._compile_columns(separator=", "),
-                table=self._compile_table(self.table),
-                wheres=self._compile_wheres(qmark=qmark),
-                limit=self._compile_limit(),
-                offset=self._compile_offset(),
-                aggregates=self._compile_aggregates(),
-                order_by=self._compile_order_by(),
-                group_by=self._compile_group_by(),
-                joins=self._compile_joins(),
-                having=self._compile_having(),
-            )
-            .strip()
+        self._sql = self._render(
+            self.select_format(),
+            columns=self._compile_columns(separator=", "),
+            table=self._compile_table(self.table),
+            wheres=functools.partial(self._write_wheres, qmark=qmark),
+            limit=self._compile_limit(),
+            offset=self._compile_offset(),
+            aggregates=self._compile_aggregates(),
+            order_by=self._compile_order_by(),
+            group_by=self._compile_group_by(),
+            joins=self._compile_joins(),
+            having=functools.partial(self._write_having, qmark=qmark),
         )
 
         return self
@@ -297,10 +319,11 @@ class BaseGrammar:
         Returns:
             self
         """
-        self._sql = self.update_format().format(
+        self._sql = self._render(
+            self.update_format(),
             key_equals=self._compile_key_value_equals(qmark=qmark),
             table=self._compile_table(self.table),
-            wheres=self._compile_wheres(qmark=qmark),
+            wheres=functools.partial(self._write_wheres, qmark=qmark),
         )
 
         return self
@@ -328,31 +351,179 @@ class BaseGrammar:
 
         return sql
 
-    def _compile_insert(self):
+    def _compile_insert(self, qmark=False):
         """Compiles an insert expression.
 
+        The columns are either a dictionary for a single row or a list of
+        dictionaries which compiles to a multi row insert.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether the query should use qmark. (default: {False})
+
         Returns:
             self
         """
-        self._sql = self.insert_format().format(
+        rows = self._get_insert_rows()
+        if len(rows) > 1:
+            values = self._compile_insert_rows(rows, qmark=qmark)
+            insert_format = self.bulk_insert_format()
+        else:
+            values = self._compile_values(separator=", ", qmark=qmark)
+            insert_format = self.insert_format()
+
+        self._sql = self._render(
+            insert_format,
             key_equals=self._compile_key_value_equals(),
             table=self._compile_table(self.table),
-            columns=self._compile_columns(separator=", "),
-            values=self._compile_values(separator=", "),
+            columns=self._compile_insert_columns(separator=", "),
+            values=values,
         )
 
         return self
 
+    def _compile_insert_rows(self, rows, qmark=False):
+        """Compiles a list of dictionaries into the rows of a multi row insert.
+
+        Arguments:
+            rows {list} -- A list of dictionaries which all have the same columns.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether the values should be bound. (default: {False})
+
+        Returns:
+            string
+        """
+        columns = list(rows[0])
+        return ", ".join(
+            self.insert_row_string().format(
+                values=self._compile_values(
+                    separator=", ",
+                    qmark=qmark,
+                    row=[(column, row[column]) for column in columns],
+                )
+            )
+            for row in rows
+        )
+
+    def _compile_upsert(self, qmark=False):
+        """Compiles an insert that updates the existing rows with the same unique keys.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether the query should use qmark. (default: {False})
+
+        Returns:
+            self
+        """
+        rows = self._get_insert_rows()
+        columns = [self._compile_column(column) for column in rows[0]]
+        keys = [self._compile_column(key) for key in self._keys]
+        updates = [self._compile_column(column) for column in self._update_columns]
+
+        self._sql = self._render(
+            self.upsert_format(),
+            table=self._compile_table(self.table),
+            columns=", ".join(columns),
+            values=self._compile_insert_rows(rows, qmark=qmark),
+            keys=", ".join(keys),
+            updates=", ".join(
+                self.upsert_update_string().format(column=column) for column in updates
+            ),
+            conditions=" AND ".join(
+                self.upsert_condition_string().format(column=key) for key in keys
+            ),
+            sources=", ".join(
+                self.upsert_source_string().format(column=column) for column in columns
+            ),
+        )
+
+        return self
+
+    def _compile_bulk_update(self, qmark=False):
+        """Compiles an update that sets different values on each row matched by a key.
+
+        Every column is set with a CASE expression on the key so all of the rows
+        are updated by a single statement.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether the query should use qmark. (default: {False})
+
+        Returns:
+            self
+        """
+        rows = self._get_insert_rows()
+        key = self._keys[0]
+        key_column = self._table_column_string(key)
+
+        cases = []
+        for column in self._update_columns:
+            whens = " ".join(
+                self.case_when_string().format(
+                    key=self._compile_parameter(row[key], qmark=qmark),
+                    value=self._compile_parameter(row[column], qmark=qmark),
+                )
+                for row in rows
+            )
+            cases.append(
+                self.bulk_update_column_string().format(
+                    column=self._compile_update_column(column),
+                    reference=self._table_column_string(column),
+                    key=key_column,
+                    cases=whens,
+                )
+            )
+
+        self._sql = self._render(
+            self.bulk_update_format(),
+            table=self._compile_table(self.table),
+            cases=", ".join(cases),
+            key=key_column,
+            values=", ".join(
+                self._compile_parameter(row[key], qmark=qmark) for row in rows
+            ),
+        )
+
+        return self
+
+    def _compile_parameter(self, value, qmark=False):
+        """Compiles a single value, binding it when the query uses qmark.
+
+        Arguments:
+            value {mixed} -- The value to compile.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether the value should be bound. (default: {False})
+
+        Returns:
+            string
+        """
+        if qmark:
+            self.add_binding(value)
+            return self._compile_value("?")
+
+        return self._compile_value(value)
+
+    def _get_insert_rows(self):
+        """Gets the rows of an insert expression as a list of dictionaries.
+
+        Returns:
+            list
+        """
+        if isinstance(self._columns, dict):
+            return [self._columns]
+
+        return list(self._columns)
+
     def _compile_delete(self, qmark=False):
         """Compiles a delete expression.
 
         Returns:
             self
         """
-        self._sql = self.delete_format().format(
+        self._sql = self._render(
+            self.delete_format(),
             key_equals=self._compile_key_value_equals(qmark=qmark),
             table=self._compile_table(self.table),
-            wheres=self._compile_wheres(qmark=qmark),
+            wheres=functools.partial(self._write_wheres, qmark=qmark),
         )
 
         return self
@@ -381,20 +552,20 @@ class BaseGrammar:
             if isinstance(column, dict):
                 for key, value in column.items():
                     sql += sql_string.format(
-                        column=self._table_column_string(key),
+                        column=self._compile_update_column(key),
                         value=value if not qmark else "?",
                         separator=", ",
                     )
 
                     if qmark:
-                        self._bindings += (value,)
+                        self.add_binding(value)
             else:
                 sql += sql_string.format(
-                    column=self._table_column_string(column),
+                    column=self._compile_update_column(column),
                     value=value if not qmark else "?",
                 )
                 if qmark:
-                    self._bindings += (value,)
+                    self.add_binding(value)
 
             sql = sql.rstrip(", ")
 
@@ -429,14 +600,19 @@ class BaseGrammar:
         Returns:
             self
         """
-        sql = ""
-        for order_bys in self._order_by:
-            column, direction = order_bys
-            sql += self.order_by_string().format(
-                column=self._table_column_string(column), direction=direction.upper(),
+        if not self._order_by:
+            return ""
+
+        orders = []
+        for column, direction in self._order_by:
+            orders.append(
+                self.order_by_string().format(
+                    column=self._table_column_string(column),
+                    direction=direction.upper(),
+                )
             )
 
-        return sql
+        return "ORDER BY {orders} ".format(orders=", ".join(orders))
 
     def _compile_group_by(self):
         """Compiles a group by for a query expression.
@@ -444,12 +620,14 @@ class BaseGrammar:
         Returns:
             self
         """
-        sql = ""
-        for group_bys in self._group_by:
-            column = group_bys
-            sql += "GROUP BY {column}".format(column=self._table_column_string(column))
+        if not self._group_by:
+            return ""
 
-        return sql
+        return "GROUP BY {columns} ".format(
+            columns=", ".join(
+                self._table_column_string(column) for column in self._group_by
+            )
+        )
 
     def _compile_alias(self, column):
         """Compiles an alias for a column.
@@ -515,18 +693,30 @@ class BaseGrammar:
             value = having.value
 
             if not equality and not value:
-                sql_string = self.having_string()
-            else:
-                sql_string = self.having_equality_string()
+                sql += self.having_string().format(
+                    column=self._table_column_string(column)
+                )
+                continue
 
-            sql += sql_string.format(
+            sql += self.having_equality_string().format(
                 column=self._table_column_string(column),
                 equality=equality,
-                value=self._compile_value(value),
+                value=self._compile_parameter(value, qmark=qmark),
             )
 
         return sql
 
+    def _write_having(self, writer, qmark=False):
+        """Writes the having expression after the clauses before it have added their bindings.
+
+        Arguments:
+            writer {masonite.orm.grammar.SQLWriter} -- The writer of the statement.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether or not to use Qmark. (default: {False})
+        """
+        writer.write(self._compile_having(qmark=qmark))
+
     def _compile_wheres(self, qmark=False, strip_first_where=False):
         """Compiles the where expression.
 
@@ -536,124 +726,410 @@ class BaseGrammar:
             This is useful when using subselects (default: {False})
 
         Returns:
-            self
+            string
         """
-        sql = ""
-        loop_count = 0
-        for where in self._wheres:
-            column = where.column
-            equality = where.equality
-            value = where.value
-            value_type = where.value_type
-
-            """Need to get a specific keyword here. This keyword either needs to be
-            something like WHERE, AND, OR.
-
-            Depending on the loop depends on the placement of the AND
-            """
-            if loop_count == 0:
-                if strip_first_where:
-                    keyword = ""
-                else:
-                    keyword = self.first_where_string()
+        writer = SQLWriter()
+        self._write_wheres(writer, qmark=qmark, strip_first_where=strip_first_where)
+        return writer.to_sql()
+
+    def _write_wheres(self, writer, qmark=False, strip_first_where=False):
+        """Writes the where expression.
+
+        Each expression is written by the compiler registered for it in the
+        'where_value_compilers' or 'where_type_compilers' dictionaries.
+
+        Arguments:
+            writer {masonite.orm.grammar.SQLWriter} -- The writer of the statement.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether or not to use Qmark. (default: {False})
+            strip_first_where {bool} -- Whether or not to strip out the first where keyword. (default: {False})
+        """
+        for index, where in enumerate(self._wheres):
+            if index == 0:
+                keyword = "" if strip_first_where else self.first_where_string()
             elif where.keyword == "or":
-                keyword = self.or_where_string()
+                keyword = " " + self.or_where_string()
             else:
                 keyword = " " + self.additional_where_string()
 
-            if where.raw:
-                """If we have a raw query we just want to use the query supplied
-                and don't need to compile anything.
-                """
-                sql += self.raw_query_string().format(
-                    keyword=keyword, query=where.column
-                )
+            getattr(self, self._get_where_compiler(where))(
+                writer, where, keyword, qmark
+            )
 
-                self.add_binding(where.bindings)
+    def _get_where_compiler(self, where):
+        """Gets the name of the method that writes a where expression.
 
-                continue
+        Arguments:
+            where {masonite.orm.expressions.QueryExpression} -- The where expression.
 
-            """The column is an easy compile
-            """
-            column = self._table_column_string(column)
-
-            """Need to find which type of where string it is.
-            If it is a WHERE NULL, WHERE EXISTS, WHERE `col` = 'val' etc
-            """
-            if equality == "BETWEEN":
-                sql_string = self.between_string().format(
-                    low=self._compile_value(where.low),
-                    high=self._compile_value(where.high),
-                    column=self._table_column_string(where.column),
-                    keyword=keyword,
-                )
-            elif equality == "NOT BETWEEN":
-                sql_string = self.not_between_string().format(
-                    low=self._compile_value(where.low),
-                    high=self._compile_value(where.high),
-                    column=self._table_column_string(where.column),
-                    keyword=keyword,
-                )
-            elif value is None:
-                sql_string = self.where_null_string()
-            elif value is True:
-                sql_string = self.where_not_null_string()
-            elif equality == "EXISTS":
+        Returns:
+            string
+        """
+        if where.raw:
+            return "_write_where_raw"
+
+        if where.value_type == "BETWEEN":
+            return "_write_where_between"
+
+        value = where.value
+        if value is True:
+            return "_write_where_not_null"
+
+        return self.where_value_compilers.get(
+            type(value)
+        ) or self.where_type_compilers.get(where.value_type, "_write_where_value")
+
+    def _write_where(self, writer, where, keyword, value, sql_string=None):
+        if sql_string is None:
+            if where.equality == "EXISTS":
                 sql_string = self.where_exists_string()
             else:
                 sql_string = self.where_string()
 
-            """If the value should actually be a sub query then we need to wrap it in a query here
-            """
-            if isinstance(value, SubGroupExpression):
-                query_value = self.subquery_string().format(
-                    query=value.builder.get_grammar()._compile_wheres(
-                        strip_first_where=True
-                    )
-                )
-                sql_string = self.where_group_string()
-            elif isinstance(value, SubSelectExpression):
-                query_value = self.subquery_string().format(
-                    query=value.builder.to_sql()
-                )
-            elif isinstance(value, list):
-                query_value = "("
-                for val in value:
-                    if qmark:
-                        query_value += "'?', "
-                        self.add_binding(val)
-                    else:
-                        query_value += self.value_string().format(
-                            value=val, separator=","
+        writer.write(
+            sql_string.format(
+                keyword=keyword,
+                column=self._table_column_string(where.column),
+                equality=where.equality,
+                value=value,
+            )
+        )
+
+    def _write_where_raw(self, writer, where, keyword, qmark):
+        """If we have a raw query we just want to use the query supplied
+        and don't need to compile anything.
+        """
+        writer.write(
+            self.raw_query_string().format(keyword=keyword, query=where.column)
+        )
+        self._bindings.extend(where.bindings)
+
+    def _write_where_between(self, writer, where, keyword, qmark):
+        if where.equality == "BETWEEN":
+            sql_string = self.between_string()
+        else:
+            sql_string = self.not_between_string()
+
+        writer.write(
+            sql_string.format(
+                keyword=keyword,
+                column=self._table_column_string(where.column),
+                low=self._compile_parameter(where.low, qmark=qmark),
+                high=self._compile_parameter(where.high, qmark=qmark),
+            )
+        )
+
+    def _write_where_null(self, writer, where, keyword, qmark):
+        self._write_where(
+            writer, where, keyword, "", sql_string=self.where_null_string()
+        )
+
+    def _write_where_not_null(self, writer, where, keyword, qmark):
+        self._write_where(
+            writer, where, keyword, "", sql_string=self.where_not_null_string()
+        )
+
+    def _write_where_group(self, writer, where, keyword, qmark):
+        grammar = self._get_subquery_grammar(where)
+        writer.render(
+            self.where_group_string(),
+            {
+                "keyword": keyword,
+                "column": self._table_column_string(where.column),
+                "equality": where.equality,
+                "value": lambda writer: writer.render(
+                    self.subquery_string(),
+                    {
+                        "query": lambda writer: grammar._write_wheres(
+                            writer, qmark=qmark, strip_first_where=True
                         )
-                query_value = query_value.rstrip(",").rstrip(", ") + ")"
-            elif qmark:
-                query_value = "'?'"
+                    },
+                ),
+            },
+        )
+        self._bindings.extend(grammar._bindings)
+
+    def _write_where_subquery(self, writer, where, keyword, qmark):
+        grammar = self._get_subquery_grammar(where).compile("select", qmark=qmark)
+        query = grammar.to_qmark() if qmark else grammar.to_sql()
+        self._write_where(
+            writer, where, keyword, self.subquery_string().format(query=query)
+        )
+        self._bindings.extend(grammar._bindings)
+
+    def _get_subquery_grammar(self, where):
+        """Gets the grammar of the query nested in a where expression.
+
+        The grammar is kept for the rest of the compile so the fingerprint, the
+        bindings and the SQL all come from the same grammar.
+
+        Arguments:
+            where {masonite.orm.expressions.QueryExpression} -- A subselect or subgroup where expression.
+
+        Returns:
+            masonite.orm.grammar.Grammar
+        """
+        grammar = self._subqueries.get(where)
+        if grammar is None:
+            grammar = where.value.builder.get_subquery_grammar()
+            self._subqueries[where] = grammar
+
+        return grammar
+
+    def _write_where_list(self, writer, where, keyword, qmark):
+        query_value = "("
+        for value in where.value:
+            if qmark:
+                query_value += "'?', "
                 self.add_binding(value)
-            elif value_type == "value":
-                query_value = self.value_string().format(value=value, separator="")
-            elif value_type == "column":
-                query_value = self._table_column_string(column=value, separator="")
-            elif value_type == "having":
-                query_value = self._table_column_string(column=value, separator="")
             else:
-                query_value = ""
+                query_value += self.value_string().format(value=value, separator=",")
+
+        query_value = query_value.rstrip(",").rstrip(", ") + ")"
+        self._write_where(writer, where, keyword, query_value)
+
+    def _write_where_column(self, writer, where, keyword, qmark):
+        self._write_where(
+            writer,
+            where,
+            keyword,
+            self._table_column_string(column=where.value, separator=""),
+        )
+
+    def _write_where_value(self, writer, where, keyword, qmark):
+        if qmark:
+            query_value = "'?'"
+            self.add_binding(where.value)
+        elif where.value_type == "value":
+            query_value = self.value_string().format(value=where.value, separator="")
+        else:
+            query_value = ""
+
+        self._write_where(writer, where, keyword, query_value)
+
+    """The methods that write each kind of where expression, looked up by the
+    type of the value and then by the value type of the expression.
+    Raw, between and 'IS NOT NULL' expressions are found by '_get_where_compiler'.
+    """
+    where_value_compilers = {
+        SubGroupExpression: "_write_where_group",
+        SubSelectExpression: "_write_where_subquery",
+        list: "_write_where_list",
+        type(None): "_write_where_null",
+    }
+
+    where_type_compilers = {
+        "column": "_write_where_column",
+        "having": "_write_where_column",
+    }
+
+    def compile(self, action, qmark=False):
+        """Compiles the query for an action.
+
+        Qmark queries are looked up in the compiled cache by the shape of the query
+        so a query that was compiled before only needs its bindings extracted.
 
-            sql += sql_string.format(
-                keyword=keyword, column=column, equality=equality, value=query_value,
+        Arguments:
+            action {string} -- The action to compile like 'select' or 'update'.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether the query should use qmark. (default: {False})
+
+        Returns:
+            self
+        """
+        compiler = getattr(self, "_compile_{action}".format(action=action))
+        key = self._fingerprint(action) if qmark else None
+        sql = self.compiled_cache.get(key) if key is not None else None
+        if sql is not None:
+            self._sql = self._sql_qmark = sql
+            self._bindings = self._compile_bindings(action)
+            return self
+
+        compiler(qmark=qmark)
+        if key is not None:
+            self.compiled_cache.put(key, self.to_qmark())
+
+        self._bindings = tuple(self._bindings)
+        return self
+
+    def _fingerprint(self, action):
+        """Builds a hashable key describing everything about the query except its bound values.
+
+        Arguments:
+            action {string} -- The action being compiled.
+
+        Returns:
+            tuple|None -- The key or None when the query cannot be cached.
+        """
+        if action in ("insert", "upsert", "bulk_update"):
+            rows = self._get_insert_rows()
+            return (
+                self.__class__,
+                action,
+                self.table,
+                self._connection_details.get("prefix"),
+                self._connection_details.get("database"),
+                tuple(rows[0]) if rows else (),
+                len(rows),
+                tuple(self._keys),
+                tuple(self._update_columns),
             )
 
-            loop_count += 1
+        if action not in ("select", "update", "delete"):
+            return None
 
-        return sql
+        wheres = []
+        for where in self._wheres:
+            compiler = self._get_where_compiler(where)
+            if compiler == "_write_where_value":
+                shape = "?"
+            elif compiler == "_write_where_list":
+                shape = ("list", len(where.value))
+            elif compiler in ("_write_where_null", "_write_where_not_null"):
+                shape = where.value
+            elif compiler == "_write_where_column":
+                shape = (where.value_type, where.value)
+            elif compiler == "_write_where_between":
+                shape = "?"
+            elif compiler == "_write_where_raw":
+                shape = "raw"
+            elif compiler in ("_write_where_group", "_write_where_subquery"):
+                shape = self._get_subquery_grammar(where)._fingerprint("select")
+                if shape is None:
+                    return None
+            else:
+                return None
+
+            wheres.append(
+                (where.column, where.equality, where.keyword, where.value_type, shape)
+            )
+
+        updates = []
+        for update in self._updates:
+            column = update.column
+            if isinstance(column, dict):
+                column = tuple(column)
+            updates.append((update.update_type, column))
+
+        columns = []
+        for column in self._columns:
+            if isinstance(column, SelectExpression):
+                column = (column.column, column.raw)
+            columns.append(column)
+
+        key = (
+            self.__class__,
+            action,
+            self.table,
+            self._connection_details.get("prefix"),
+            self._connection_details.get("database"),
+            tuple(columns),
+            tuple(wheres),
+            tuple(updates),
+            tuple(self._aggregates),
+            tuple(self._order_by),
+            tuple(self._group_by),
+            tuple(
+                (
+                    join.foreign_table,
+                    join.column1,
+                    join.equality,
+                    join.column2,
+                    join.clause,
+                )
+                for join in self._joins
+            ),
+            tuple(
+                (having.column, having.equality, bool(having.equality or having.value))
+                for having in self._having
+            ),
+            self._limit,
+            self._offset,
+        )
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def _compile_bindings(self, action):
+        """Collects the bindings of a query in the order the compiled qmark SQL expects them.
+
+        Arguments:
+            action {string} -- The action being compiled.
+
+        Returns:
+            tuple
+        """
+        bindings = []
+        if action in ("insert", "upsert"):
+            rows = self._get_insert_rows()
+            columns = list(rows[0])
+            for row in rows:
+                bindings.extend([row[column] for column in columns])
+
+            return tuple(bindings)
+
+        if action == "bulk_update":
+            rows = self._get_insert_rows()
+            key = self._keys[0]
+            for column in self._update_columns:
+                for row in rows:
+                    bindings.extend((row[key], row[column]))
+
+            bindings.extend([row[key] for row in rows])
+            return tuple(bindings)
+
+        if action == "update":
+            for update in self._updates:
+                if isinstance(update.column, dict):
+                    bindings.extend(update.column.values())
+                else:
+                    bindings.append(update.value)
+
+        self._compile_where_bindings(bindings)
+
+        if action == "select":
+            for having in self._having:
+                if having.equality or having.value:
+                    bindings.append(having.value)
+
+        return tuple(bindings)
+
+    def _compile_where_bindings(self, bindings):
+        """Collects the bindings of the where expressions, including the nested queries.
+
+        Arguments:
+            bindings {list} -- The list the bindings are added to.
+        """
+        for where in self._wheres:
+            compiler = self._get_where_compiler(where)
+            if compiler == "_write_where_value":
+                bindings.append(where.value)
+            elif compiler == "_write_where_list":
+                bindings.extend(where.value)
+            elif compiler == "_write_where_between":
+                bindings.extend((where.low, where.high))
+            elif compiler == "_write_where_raw":
+                bindings.extend(where.bindings)
+            elif compiler == "_write_where_group":
+                self._get_subquery_grammar(where)._compile_where_bindings(bindings)
+            elif compiler == "_write_where_subquery":
+                bindings.extend(
+                    self._get_subquery_grammar(where)._compile_bindings("select")
+                )
 
     def add_binding(self, binding):
-        """Adds a binding to the bindings tuple.
+        """Adds a binding to the bindings list, which is frozen into a tuple once compiled.
 
         Arguments:
             binding {string} -- A value to bind.
         """
-        self._bindings += (binding,)
+        self._bindings.append(binding)
 
     def column_exists(self, column):
         """Check if a column exists
@@ -674,7 +1150,8 @@ class BaseGrammar:
         Returns:
             self
         """
-        self._sql = self.table_exists_string().format(
+        self._sql = self._render(
+            self.table_exists_string(),
             table=self._compile_table(self.table),
             database=self.database,
             clean_table=self.table,
@@ -687,27 +1164,41 @@ class BaseGrammar:
         Returns:
             self
         """
-        return self.column_exists_string().format(
+        return self._render(
+            self.column_exists_string(),
             table=self._compile_table(self.table),
             value=self._compile_value(self._column),
         )
 
     def to_sql(self):
-        """Cleans up the SQL string and returns the SQL
+        """Returns the compiled SQL.
 
         Returns:
             string
         """
-
-        return re.sub(" +", " ", self._sql.strip())
+        return self._sql
 
     def to_qmark(self):
-        """Cleans up the SQL string and returns the SQL
+        """Returns the compiled qmark SQL.
 
         Returns:
             string
         """
-        return re.sub(" +", " ", self._sql.strip())
+        return self._sql_qmark or self._sql
+
+    def _render(self, format_string, **fields):
+        """Renders a format string of the grammar into SQL in a single pass.
+
+        Arguments:
+            format_string {string} -- A format string like the one of 'select_format'.
+
+        Keyword Arguments:
+            fields {string|callable} -- The fragments of each field. Callables are given the SQLWriter.
+
+        Returns:
+            string
+        """
+        return SQLWriter().render(format_string, fields).to_sql()
 
     def _compile_columns(self, separator=""):
         """Specifies the columns in a selection expression.
@@ -736,20 +1227,60 @@ class BaseGrammar:
             return "*"
         return sql.rstrip(",").rstrip(", ")
 
-    def _compile_values(self, separator=""):
+    def _compile_insert_columns(self, separator=""):
+        """Specifies the columns in an insert expression.
+
+        Keyword Arguments:
+            separator {str} -- The separator used between columns (default: {""})
+
+        Returns:
+            self
+        """
+        sql = ""
+        rows = self._get_insert_rows()
+        for column in rows[0] if rows else ():
+            sql += self._table_column_string(
+                column, separator=separator, column_string=self.insert_column_string()
+            )
+
+        return sql.rstrip(",").rstrip(", ")
+
+    def _compile_update_column(self, column):
+        """Compiles a column on the left side of an update expression.
+
+        Arguments:
+            column {string} -- The name of the column.
+
+        Returns:
+            self
+        """
+        return self._table_column_string(
+            column, column_string=self.update_column_string()
+        )
+
+    def _compile_values(self, separator="", qmark=False, row=None):
         """Compiles column values for insert expressions.
 
         Keyword Arguments:
             separator {str} -- The separator used between columns (default: {""})
+            qmark {bool} -- Whether the values should be bound. (default: {False})
+            row {list} -- A list of (column, value) pairs to compile instead of the columns. (default: {None})
 
         Returns:
             self
         """
         sql = ""
-        if self._columns == "*":
-            return self._columns
-        for column, value in dict(self._columns).items():
-            sql += self._compile_value(value, separator=separator)
+        if row is None:
+            if self._columns == "*":
+                return self._columns
+            row = dict(self._columns).items()
+
+        for column, value in row:
+            if qmark:
+                sql += self._compile_value("?", separator=separator)
+                self.add_binding(value)
+            else:
+                sql += self._compile_value(value, separator=separator)
 
         return sql[:-2]
 
@@ -772,7 +1303,7 @@ class BaseGrammar:
             column=column, separator=separator, table=table or self.table
         )
 
-    def _table_column_string(self, column, separator=""):
+    def _table_column_string(self, column, separator="", column_string=None):
         """Compiles a column into the column syntax.
 
         Arguments:
@@ -780,18 +1311,64 @@ class BaseGrammar:
 
         Keyword Arguments:
             separator {string} -- The separator used between columns (default: {""})
+            column_string {string} -- The format string to use instead of the table column string. (default: {None})
 
         Returns:
             self
         """
+        key = (self.__class__, column_string, self.table, column, separator)
+        try:
+            return self.identifier_cache[key]
+        except (KeyError, TypeError):
+            pass
+
         table = None
         if column and "." in column:
             table, column = column.split(".")
 
-        return self.table_column_string().format(
+        identifier = (column_string or self.table_column_string()).format(
             column=column, separator=separator, table=table or self.table
         )
 
+        try:
+            if len(self.identifier_cache) >= 4096:
+                self.identifier_cache.clear()
+            self.identifier_cache[key] = identifier
+        except TypeError:
+            pass
+
+        return identifier
+
+    def insert_column_string(self):
+        """The column syntax used for the column list of insert expressions.
+        """
+        return self.table_column_string()
+
+    def update_column_string(self):
+        """The column syntax used on the left side of update expressions.
+        """
+        return self.table_column_string()
+
+    def upsert_condition_string(self):
+        """The condition matching an existing row to a new row in upsert expressions.
+        """
+        return "target.{column} = source.{column}"
+
+    def upsert_source_string(self):
+        """The syntax referencing a column of the new rows in upsert expressions.
+        """
+        return "source.{column}"
+
+    def case_when_string(self):
+        """The syntax of a single branch of a CASE expression.
+        """
+        return "WHEN {key} THEN {value}"
+
+    def bulk_update_column_string(self):
+        """The syntax setting a column from a CASE expression in bulk update expressions.
+        """
+        return "{column} = CASE {key} {cases} ELSE {reference} END"
+
     def _compile_value(self, value, separator=""):
         """Compiles a value using the value syntax.
 
@@ -815,7 +1392,9 @@ class BaseGrammar:
         Returns:
             self
         """
-        self._sql = self.drop_table_string().format(table=self._compile_column(table))
+        self._sql = self._render(
+            self.drop_table_string(), table=self._compile_column(table)
+        )
         return self
 
     def drop_table_if_exists(self, table):
@@ -827,8 +1406,8 @@ class BaseGrammar:
         Returns:
             self
         """
-        self._sql = self.drop_table_if_exists_string().format(
-            table=self._compile_column(table)
+        self._sql = self._render(
+            self.drop_table_if_exists_string(), table=self._compile_column(table)
         )
         return self
 
@@ -842,14 +1421,15 @@ class BaseGrammar:
         Returns:
             self
         """
-        self._sql = self.rename_table_string().format(
+        self._sql = self._render(
+            self.rename_table_string(),
             current_table_name=self._compile_column(current_table_name),
             new_table_name=self._compile_column(new_table_name),
         )
         return self
 
     def truncate_table(self, table):
-        self._sql = self.truncate_table_string().format(
-            table=self._compile_table(table)
+        self._sql = self._render(
+            self.truncate_table_string(), table=self._compile_table(table)
         )
         return self
@@ -89,7 +89,7 @@ class GrammarExample:
         return "`{table}`"
 
     def order_by_string(self):
-        return "ORDER BY {column} {direction}"
+        return "{column} {direction}"
 
     def column_string(self):
         return "`{column}`{separator}"
@@ -0,0 +1,140 @@
+import functools
+from string import Formatter
+
+
+@functools.lru_cache(maxsize=None)
+def parse_format(format_string):
+    """Splits a grammar format string into its literal text and fields once.
+
+    The spaces around each literal are parsed here so rendering only appends tokens.
+
+    Arguments:
+        format_string {string} -- A format string like 'SELECT {columns} FROM {table}'.
+
+    Returns:
+        tuple -- A tuple of (leading space, literal, trailing space, field, format_spec) tuples.
+    """
+    parts = []
+    for literal, field, spec, _ in Formatter().parse(format_string):
+        text = literal.strip(" ")
+        parts.append(
+            (literal[:1] == " ", text, literal[-1:] == " " and bool(text), field, spec,)
+        )
+
+    return tuple(parts)
+
+
+class SQLWriter:
+    """Writes a SQL statement as a list of tokens in a single pass.
+
+    Spaces at the edges of a fragment only separate it from its neighbours, so a
+    fragment that compiled to an empty string never leaves two spaces behind. Spaces
+    inside a fragment, like the ones in a quoted value, are written as they are.
+    """
+
+    __slots__ = ("tokens", "space")
+
+    def __init__(self):
+        self.tokens = []
+        self.space = False
+
+    def write(self, fragment):
+        """Appends a fragment of SQL.
+
+        Arguments:
+            fragment {string} -- The SQL to append.
+
+        Returns:
+            self
+        """
+        if not fragment:
+            return self
+
+        if fragment[0] == " ":
+            self.space = True
+            fragment = fragment.lstrip(" ")
+
+        trailing = fragment[-1:] == " "
+        if trailing:
+            fragment = fragment.rstrip(" ")
+
+        if fragment:
+            if self.space and self.tokens:
+                self.tokens.append(" ")
+            self.tokens.append(fragment)
+            self.space = False
+
+        if trailing:
+            self.space = True
+
+        return self
+
+    def render(self, format_string, fields):
+        """Writes a format string, writing each field as a fragment.
+
+        Fields may be callables which are given the writer so nested expressions are
+        written straight into the same tokens.
+
+        Arguments:
+            format_string {string} -- A grammar format string.
+            fields {dict} -- The values of the fields.
+
+        Returns:
+            self
+        """
+        tokens = self.tokens
+        space = self.space
+        for leading, text, trailing, field, spec in parse_format(format_string):
+            if leading:
+                space = True
+
+            if text:
+                if space and tokens:
+                    tokens.append(" ")
+                tokens.append(text)
+                space = trailing
+
+            if field is None:
+                continue
+
+            value = fields[field]
+            if value.__class__ is not str:
+                if callable(value):
+                    self.space = space
+                    value(self)
+                    space = self.space
+                    continue
+
+                value = format(value, spec)
+
+            if not value:
+                continue
+
+            # The same as 'write' without the method call for every field.
+            if value[0] == " ":
+                space = True
+                value = value.lstrip(" ")
+
+            ends_with_space = value[-1:] == " "
+            if ends_with_space:
+                value = value.rstrip(" ")
+
+            if value:
+                if space and tokens:
+                    tokens.append(" ")
+                tokens.append(value)
+                space = False
+
+            if ends_with_space:
+                space = True
+
+        self.space = space
+        return self
+
+    def to_sql(self):
+        """Joins the tokens into the SQL statement.
+
+        Returns:
+            string
+        """
+        return "".join(self.tokens)
@@ -5,6 +5,9 @@ class MSSQLGrammar(BaseGrammar):
     """Microsoft SQL Server grammar class.
     """
 
+    parameter_limit = 2099
+    insert_row_limit = 1000
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -32,6 +35,27 @@ class MSSQLGrammar(BaseGrammar):
     def insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES ({values})"
 
+    def bulk_insert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values}"
+
+    def insert_row_string(self):
+        return "({values})"
+
+    def upsert_format(self):
+        return "MERGE INTO {table} AS [target] USING (VALUES {values}) AS [source] ({columns}) ON {conditions} WHEN MATCHED THEN UPDATE SET {updates} WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({sources});"
+
+    def upsert_update_string(self):
+        return "[target].{column} = [source].{column}"
+
+    def upsert_condition_string(self):
+        return "[target].{column} = [source].{column}"
+
+    def upsert_source_string(self):
+        return "[source].{column}"
+
+    def bulk_update_format(self):
+        return "UPDATE {table} SET {cases} WHERE {key} IN ({values})"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -116,7 +140,7 @@ class MSSQLGrammar(BaseGrammar):
         return "[{prefix}{table}]"
 
     def order_by_string(self):
-        return "ORDER BY {column} {direction}"
+        return "{column} {direction}"
 
     def column_string(self):
         return "[{column}]{separator}"
@@ -7,6 +7,8 @@ class MySQLGrammar(BaseGrammar):
     """MySQL grammar class.
     """
 
+    parameter_limit = 65535
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -80,6 +82,21 @@ class MySQLGrammar(BaseGrammar):
     def insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES ({values})"
 
+    def bulk_insert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values}"
+
+    def insert_row_string(self):
+        return "({values})"
+
+    def upsert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} ON DUPLICATE KEY UPDATE {updates}"
+
+    def upsert_update_string(self):
+        return "{column} = VALUES({column})"
+
+    def bulk_update_format(self):
+        return "UPDATE {table} SET {cases} WHERE {key} IN ({values})"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -180,7 +197,7 @@ class MySQLGrammar(BaseGrammar):
         return "`{table}`"
 
     def order_by_string(self):
-        return "ORDER BY {column} {direction}"
+        return "{column} {direction}"
 
     def column_string(self):
         return "`{column}`{separator}"
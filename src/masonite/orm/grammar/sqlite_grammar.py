@@ -1,12 +1,14 @@
-import pymysql.cursors
+import sqlite3
 
 from .BaseGrammar import BaseGrammar
 
 
 class SQLiteGrammar(BaseGrammar):
-    """MySQL grammar class.
+    """SQLite grammar class.
     """
 
+    parameter_limit = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -16,6 +18,15 @@ class SQLiteGrammar(BaseGrammar):
         "AVG": "AVG",
     }
 
+    join_keywords = {
+        "inner": "INNER JOIN",
+        "outer": "OUTER JOIN",
+        "left": "LEFT JOIN",
+        "right": "RIGHT JOIN",
+        "left_inner": "LEFT INNER JOIN",
+        "right_inner": "RIGHT INNER JOIN",
+    }
+
     type_map = {
         "string": "VARCHAR",
         "char": "CHARACTER",
@@ -49,7 +60,7 @@ class SQLiteGrammar(BaseGrammar):
     }
 
     def select_format(self):
-        return "SELECT {columns} FROM {table} {wheres} {group_by}{order_by}{limit}"
+        return "SELECT {columns} FROM {table} {joins} {wheres} {group_by}{order_by}{limit} {offset} {having}"
 
     def update_format(self):
         return "UPDATE {table} SET {key_equals} {wheres}"
@@ -57,14 +68,59 @@ class SQLiteGrammar(BaseGrammar):
     def insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES ({values})"
 
+    def bulk_insert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values}"
+
+    def insert_row_string(self):
+        return "({values})"
+
+    def upsert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} ON CONFLICT ({keys}) DO UPDATE SET {updates}"
+
+    def upsert_update_string(self):
+        return "{column} = excluded.{column}"
+
+    def bulk_update_format(self):
+        return "UPDATE {table} SET {cases} WHERE {key} IN ({values})"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
     def aggregate_string(self):
         return "{aggregate_function}({column}) AS {alias}"
 
+    def aggregate_string_with_alias(self):
+        return "{aggregate_function}({column}) AS {alias}"
+
+    def aggregate_string_without_alias(self):
+        return "{aggregate_function}({column})"
+
+    def subquery_string(self):
+        return "({query})"
+
+    def raw_query_string(self):
+        return "{keyword} {query}"
+
+    def where_group_string(self):
+        return "{keyword} {value}"
+
+    def between_string(self):
+        return "{keyword} {column} BETWEEN {low} AND {high}"
+
+    def not_between_string(self):
+        return "{keyword} {column} NOT BETWEEN {low} AND {high}"
+
+    def where_exists_string(self):
+        return "{keyword} EXISTS {value}"
+
     def key_value_string(self):
-        return "{column} = '{value}'"
+        return "{column} = '{value}'{separator}"
+
+    def increment_string(self):
+        return "{column} = {column} + '{value}'"
+
+    def decrement_string(self):
+        return "{column} = {column} - '{value}'"
 
     def create_column_string(self):
         return "{column} {data_type}{length}{nullable}, "
@@ -79,19 +135,57 @@ class SQLiteGrammar(BaseGrammar):
         return "`{table}`"
 
     def order_by_string(self):
-        return "ORDER BY {column} {direction}"
+        return "{column} {direction}"
 
     def column_string(self):
         return "`{column}`{separator}"
 
+    def table_column_string(self):
+        return "`{table}`.`{column}`{separator}"
+
+    def insert_column_string(self):
+        return "`{column}`{separator}"
+
+    def update_column_string(self):
+        return "`{column}`{separator}"
+
     def value_string(self):
         return "'{value}'{separator}"
 
-    def limit_string(self):
+    def join_string(self):
+        return "{keyword} {foreign_table} ON {column1} {equality} {column2}"
+
+    def limit_string(self, offset=False):
         return "LIMIT {limit}"
 
+    def offset_string(self):
+        """SQLite only allows an offset after a limit so a negative limit is used for no limit.
+        """
+        if not self._limit:
+            return "LIMIT -1 OFFSET {offset}"
+
+        return "OFFSET {offset}"
+
     def first_where_string(self):
         return "WHERE"
 
     def additional_where_string(self):
         return "AND"
+
+    def or_where_string(self):
+        return "OR"
+
+    def where_string(self):
+        return " {keyword} {column} {equality} {value}"
+
+    def having_string(self):
+        return "HAVING {column}"
+
+    def having_equality_string(self):
+        return "HAVING {column} {equality} {value}"
+
+    def where_null_string(self):
+        return "{keyword} {column} IS NULL"
+
+    def where_not_null_string(self):
+        return " {keyword} {column} IS NOT NULL"
@@ -0,0 +1,160 @@
+from ..cache import LRUCache
+
+ROW_CLASSES = LRUCache(maxsize=256)
+
+
+class RowColumn:
+    """Reads a single column out of the values tuple of a compact row.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index):
+        self.index = index
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return instance._values[self.index]
+
+
+class CastRowColumn(RowColumn):
+    """Reads a column that has a cast registered on the model.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, index, name):
+        super().__init__(index)
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return instance.get_value(self.name)
+
+
+class CompactRow:
+    """Methods shared by the compact row classes created for a model.
+
+    A compact row keeps the values of a record in the tuple returned by the cursor
+    instead of in dictionaries. Each selected column is read through a descriptor
+    generated for the row class so reads skip '__getattr__' and the casts lookup.
+    Dirty attributes and relationships are only allocated when they are first used.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_values(cls, values):
+        """Creates a row from a tuple of values in the order of the row class columns.
+
+        Arguments:
+            values {tuple} -- The values of a single record.
+
+        Returns:
+            CompactRow
+        """
+        row = cls.__new__(cls)
+        row._values = values
+        row._dirty = None
+        row._loaded = None
+        return row
+
+    @property
+    def __attributes__(self):
+        return dict(zip(self.__columns__, self._values))
+
+    @property
+    def __dirty_attributes__(self):
+        if self._dirty is None:
+            self._dirty = {}
+
+        return self._dirty
+
+    @property
+    def _relationships(self):
+        if self._loaded is None:
+            self._loaded = {}
+
+        return self._loaded
+
+    def _sync_attributes(self, columns=None):
+        """Moves saved dirty attributes into the values of the row.
+
+        Columns the row was not selected with have no slot in the values tuple
+        and stay dirty.
+
+        Keyword Arguments:
+            columns {list} -- The columns that were saved. Every dirty attribute when omitted. (default: {None})
+        """
+        if not self._dirty:
+            return
+
+        values = list(self._values)
+        for column in list(self._dirty) if columns is None else columns:
+            index = self.__column_indexes__.get(column)
+            if index is not None and column in self._dirty:
+                values[index] = self._dirty.pop(column)
+
+        self._values = tuple(values)
+
+    def get_raw_attribute(self, attribute, default=None):
+        if self._dirty and attribute in self._dirty:
+            return self._dirty[attribute]
+
+        index = self.__column_indexes__.get(attribute)
+        if index is None:
+            return default
+
+        return self._values[index]
+
+    def __getattr__(self, attribute):
+        name = self.__class__.__name__
+        raise AttributeError(f"class '{name}' has no attribute {attribute}")
+
+    def __setattr__(self, attribute, value):
+        if attribute.startswith("_"):
+            object.__setattr__(self, attribute, value)
+        else:
+            self.__dirty_attributes__[attribute] = value
+
+
+def make_row_class(model, columns):
+    """Gets the compact row class of a model for a list of selected columns.
+
+    Row classes subclass the model so they can be used anywhere the model can.
+    They are cached per model and column list.
+
+    Arguments:
+        model {masonite.orm.models.Model} -- The model class.
+        columns {tuple} -- The names of the columns in the order the cursor returns them.
+
+    Returns:
+        CompactRow
+    """
+    key = (model, columns)
+    row_class = ROW_CLASSES.get(key)
+    if row_class is not None:
+        return row_class
+
+    namespace = {
+        "__slots__": ("_values", "_dirty", "_loaded"),
+        "__columns__": columns,
+        "__column_indexes__": {column: index for index, column in enumerate(columns)},
+        "__module__": model.__module__,
+    }
+    for index, column in enumerate(columns):
+        if hasattr(model, column) or not column.isidentifier():
+            continue
+
+        if column in model.__casts__:
+            namespace[column] = CastRowColumn(index, column)
+        else:
+            namespace[column] = RowColumn(index)
+
+    row_class = type(model.__name__, (CompactRow, model), namespace)
+    ROW_CLASSES.put(key, row_class)
+    return row_class
@@ -1,12 +1,14 @@
 import json
+import threading
 from datetime import datetime
 
 from inflection import tableize
 
-from ..builder import QueryBuilder
+from ..builder import AsyncQueryBuilder, QueryBuilder
+from ..cache import IdentityMap
 from ..collection import Collection
 from ..connections import ConnectionFactory
-from ..grammar import MySQLGrammar
+from .CompactRow import make_row_class
 
 
 class BoolCast:
@@ -19,6 +21,22 @@ class JsonCast:
         return json.dumps(value)
 
 
+BOOT_LOCK = threading.RLock()
+
+
+class ModelBuilder:
+    """Gives every access to 'Model.builder' a query builder of its own.
+
+    The builder is cloned from the prototype made when the model boots. Clones get
+    shallow copies of the clause lists of the prototype, so the expressions are shared
+    without a deep copy and queries built on different threads never see each other's
+    clauses.
+    """
+
+    def __get__(self, instance, owner):
+        return owner.get_builder()
+
+
 class Model:
 
     __fillable__ = ["*"]
@@ -26,10 +44,10 @@ class Model:
     __table__ = None
     __connection__ = "default"
     __resolved_connection__ = None
-    _eager_load = ()
-    _relationships = {}
     _registered_relationships = {}
     _booted = False
+    _builder = None
+    builder = ModelBuilder()
     __primary_key__ = "id"
     __casts__ = {}
     __timestamps__ = True
@@ -53,18 +71,23 @@ class Model:
 
     @classmethod
     def boot(cls):
-        if not cls._booted:
+        if cls._booted:
+            return
+
+        with BOOT_LOCK:
+            if cls._booted:
+                return
+
             cls.__resolved_connection__ = ConnectionFactory().make(cls.__connection__)
-            cls.builder = QueryBuilder(
-                MySQLGrammar,
+            cls._builder = QueryBuilder(
+                cls.__resolved_connection__.get_grammer(),
                 cls.__resolved_connection__,
                 table=cls.get_table_name(),
                 owner=cls,
                 global_scopes=cls._global_scopes,
             )
 
-            cls.builder.set_action("select")
-            cls._booted = True
+            cls._builder.set_action("select")
             cast_methods = [v for k, v in cls.__dict__.items() if k.startswith("get_")]
             for cast in cast_methods:
                 cls.__casts__[cast.__name__.replace("get_", "")] = cast
@@ -78,6 +101,20 @@ class Model:
             }
 
             cls._loads = ()
+            cls._booted = True
+
+    @classmethod
+    def get_builder(cls):
+        """Gets a new query builder for the model.
+
+        Every call returns a builder of its own so queries can be built on many
+        threads at once. A builder can be kept as a template and copied with 'clone'.
+
+        Returns:
+            masonite.orm.builder.QueryBuilder
+        """
+        cls.boot()
+        return cls._builder.clone()
 
     def _boot_parent_scopes(cls):
         for parent in cls.__bases__:
@@ -116,8 +153,51 @@ class Model:
 
     @classmethod
     def find(cls, record_id):
+        """Finds a record by its primary key.
+
+        When an identity map is active the instance already loaded for the primary
+        key is returned without a query. A list of primary keys loads every record
+        that is not in the identity map with a single query.
+
+        Arguments:
+            record_id {mixed|list} -- A primary key value or a list of values.
+
+        Returns:
+            Model|Collection
+        """
         cls._boot_if_not_booted()
-        return cls.builder.where("id", record_id).first()
+        if isinstance(record_id, (list, tuple)):
+            return cls._find_many(record_id)
+
+        identity_map = IdentityMap.current()
+        if identity_map is not None:
+            model = identity_map.get(cls, record_id)
+            if model is not None:
+                return model
+
+        return cls.builder.where(cls.__primary_key__, record_id).first()
+
+    @classmethod
+    def _find_many(cls, record_ids):
+        identity_map = IdentityMap.current()
+        missing = record_ids
+        if identity_map is not None:
+            missing = identity_map.missing(cls, record_ids)
+
+        found = {}
+        if missing:
+            for model in cls.builder.where_in(cls.__primary_key__, missing).get():
+                found[str(model.__attributes__.get(cls.__primary_key__))] = model
+
+        models = []
+        for record_id in record_ids:
+            model = found.get(str(record_id))
+            if model is None and identity_map is not None:
+                model = identity_map.get(cls, record_id)
+            if model is not None:
+                models.append(model)
+
+        return cls.new_collection(models)
 
     @classmethod
     def _boot_if_not_booted(cls):
@@ -145,15 +225,15 @@ class Model:
     @classmethod
     def where_in(cls, *args, **kwargs):
         cls.boot()
-        return cls.builder.where(*args, **kwargs)
+        return cls.builder.where_in(*args, **kwargs)
 
     @classmethod
     def has(cls, *has_relationships, **kwargs):
-        cls.boot()
+        builder = cls.builder
         for has_relationship in has_relationships:
             if "." in has_relationship:
                 # Get nested relationship
-                last_builder = cls.builder
+                last_builder = builder
                 for split_has_relationship in has_relationship.split("."):
                     local_key = cls._registered_relationships[last_builder.owner][
                         split_has_relationship
@@ -179,17 +259,17 @@ class Model:
                 foreign_key = cls._registered_relationships[cls][has_relationship][
                     "foreign"
                 ]
-                cls.builder.where_exists(
+                builder.where_exists(
                     relationship.where_column(
                         f"{relationship.get_table_name()}.{foreign_key}",
-                        f"{cls.builder.get_table_name()}.{local_key}",
+                        f"{builder.get_table_name()}.{local_key}",
                     )
                 )
-        return cls.builder
+        return builder
 
     @classmethod
     def where_has(cls, has_relationship, callback):
-        cls.boot()
+        builder = cls.builder
         relationship = getattr(cls, has_relationship)()
 
         local_key = cls._registered_relationships[cls][has_relationship]["local"]
@@ -198,13 +278,13 @@ class Model:
         callback(
             relationship.where_column(
                 f"{relationship.get_table_name()}.{foreign_key}",
-                f"{cls.builder.get_table_name()}.{local_key}",
+                f"{builder.get_table_name()}.{local_key}",
             )
         )
 
-        cls.builder.where_exists(relationship)
+        builder.where_exists(relationship)
 
-        return cls.builder
+        return builder
 
     @classmethod
     def limit(cls, *args, **kwargs):
@@ -216,6 +296,28 @@ class Model:
         cls.boot()
         return cls.builder.select(*args, **kwargs)
 
+    @classmethod
+    def async_query(cls):
+        """Gets a new query builder for this model whose terminal methods are coroutines.
+
+        Returns:
+            masonite.orm.builder.AsyncQueryBuilder
+        """
+        cls.boot()
+        return AsyncQueryBuilder(
+            cls._builder.grammar,
+            cls.__resolved_connection__,
+            table=cls.get_table_name(),
+            scopes=cls._builder._scopes,
+            owner=cls,
+            global_scopes=cls._global_scopes,
+        )
+
+    @classmethod
+    def compact(cls):
+        cls.boot()
+        return cls.builder.compact()
+
     @classmethod
     def hydrate(cls, dictionary):
         if isinstance(dictionary, (list, tuple)):
@@ -232,6 +334,20 @@ class Model:
             model.__attributes__.update(dictionary.__attributes__ if dictionary else {})
             return model
 
+    @classmethod
+    def hydrate_compact(cls, columns, rows):
+        """Hydrates rows straight from the cursor into compact row models.
+
+        Arguments:
+            columns {tuple} -- The names of the selected columns.
+            rows {list} -- A list of tuples in the order of the columns.
+
+        Returns:
+            Collection
+        """
+        from_values = make_row_class(cls, columns).from_values
+        return cls.new_collection([from_values(row) for row in rows])
+
     @classmethod
     def new_collection(cls, collection_data):
         return Collection(collection_data)
@@ -245,13 +361,73 @@ class Model:
         if not dictionary:
             dictionary = kwargs
 
-        if cls.__fillable__ != ["*"]:
-            dictionary = {x: dictionary[x] for x in cls.__fillable__}
+        if isinstance(dictionary, (list, tuple)):
+            rows = [cls._filter_fillable(row) for row in dictionary]
+            if query:
+                return cls.builder.insert_many(rows, query=True).to_sql()
+
+            return cls.builder.insert_many(rows)
+
+        dictionary = cls._filter_fillable(dictionary)
         if query:
             return cls.builder.create(dictionary, query=True).to_sql()
 
         return cls.builder.create(dictionary)
 
+    @classmethod
+    def upsert(cls, rows, unique_by=None, update_columns=None, query=False):
+        """Inserts a list of dictionaries, updating the records that have the same unique keys.
+
+        Arguments:
+            rows {list} -- A list of dictionaries which all have the same columns.
+
+        Keyword Arguments:
+            unique_by {string|list} -- The columns of the unique index. The primary key when omitted. (default: {None})
+            update_columns {list} -- The columns updated on existing records. (default: {None})
+            query {bool} -- Whether to return the SQL instead of executing. (default: {False})
+
+        Returns:
+            int|string
+        """
+        cls.boot()
+        rows = [cls._filter_fillable(row) for row in rows]
+        unique_by = unique_by or cls.__primary_key__
+        if query:
+            return cls.builder.upsert(
+                rows, unique_by, update_columns, query=True
+            ).to_sql()
+
+        return cls.builder.upsert(rows, unique_by, update_columns)
+
+    @classmethod
+    def bulk_update(cls, models, columns=None, query=False):
+        """Saves many models, or dictionaries with a primary key, with one update per chunk.
+
+        Arguments:
+            models {list} -- A list of models or dictionaries.
+
+        Keyword Arguments:
+            columns {list} -- The columns to update. The dirty attributes of the models when omitted. (default: {None})
+            query {bool} -- Whether to return the SQL instead of executing. (default: {False})
+
+        Returns:
+            int|string
+        """
+        cls.boot()
+        if query:
+            return cls.builder.bulk_update(
+                models, key=cls.__primary_key__, columns=columns, query=True
+            ).to_sql()
+
+        return cls.builder.bulk_update(models, key=cls.__primary_key__, columns=columns)
+
+    @classmethod
+    def _filter_fillable(cls, dictionary):
+        if cls.__fillable__ != ["*"]:
+            return {x: dictionary[x] for x in cls.__fillable__}
+
+        return dictionary
+
     def delete(self):
         pass
 
@@ -314,10 +490,41 @@ class Model:
         )
 
         if not query:
-            return builder.update(self.__dirty_attributes__)
+            result = builder.update(self.__dirty_attributes__)
+            self._sync_attributes()
+            return result
 
         return builder.update(self.__dirty_attributes__, dry=True).to_sql()
 
+    def _sync_attributes(self, columns=None):
+        """Moves saved dirty attributes into the attributes of the model.
+
+        Keyword Arguments:
+            columns {list} -- The columns that were saved. Every dirty attribute when omitted. (default: {None})
+        """
+        dirty = self.__dirty_attributes__
+        for column in list(dirty) if columns is None else columns:
+            if column in dirty:
+                self.__attributes__[column] = dirty.pop(column)
+
+    def get_raw_attribute(self, attribute, default=None):
+        """Gets the value of an attribute without casting it, including changes that are not saved.
+
+        Arguments:
+            attribute {string} -- The name of the attribute.
+
+        Keyword Arguments:
+            default {mixed} -- The value returned when the model does not have the attribute. (default: {None})
+
+        Returns:
+            mixed
+        """
+        dirty = self.__dirty_attributes__
+        if attribute in dirty:
+            return dirty[attribute]
+
+        return self.__attributes__.get(attribute, default)
+
     def get_value(self, attribute):
         if attribute in self.__casts__:
             return self._cast_attribute(attribute)
@@ -340,8 +547,27 @@ class Model:
     @classmethod
     def with_(cls, *eagers):
         cls.boot()
-        cls._eager_load += eagers
-        return cls.builder
+        return cls.builder.with_(*eagers)
+
+    @classmethod
+    def get_relationship(cls, name):
+        """Gets the relationship descriptor registered under a name on this model or its parents.
+
+        Arguments:
+            name {string} -- The name of the relationship.
+
+        Raises:
+            AttributeError: Raised when the model has no relationship with this name.
+
+        Returns:
+            masonite.orm.relationships.BaseRelationship
+        """
+        for klass in cls.__mro__:
+            relationships = cls._registered_relationships.get(klass, {})
+            if name in relationships:
+                return relationships[name]["relationship"]
+
+        raise AttributeError(f"class '{cls.__name__}' has no relationship {name}")
 
     def __getitem__(self, attribute):
         return getattr(self, attribute)
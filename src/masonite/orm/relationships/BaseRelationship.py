@@ -28,6 +28,7 @@ class BaseRelationship:
             "foreign"
         ] = self.foreign_key
         cls._registered_relationships[cls][self.fn.__name__]["local"] = self.local_key
+        cls._registered_relationships[cls][self.fn.__name__]["relationship"] = self
         self.cls = cls
 
     def __call__(self, fn=None, *args, **kwargs):
@@ -68,9 +69,7 @@ class BaseRelationship:
         """Check if the relationship is eager loaded and return that relationship instead
         """
         if self.fn.__name__ in instance._relationships:
-            return Collection(instance._relationships[self.fn.__name__]).where(
-                self.foreign_key, instance.get_primary_key_value()
-            )
+            return instance._relationships[self.fn.__name__]
 
         """Apply the query needed to make this relationship work.
         """
@@ -83,6 +82,56 @@ class BaseRelationship:
 
         return result
 
+    def eager_load(self, models, nested=()):
+        """Loads this relationship for many models with a single query.
+
+        The related records are indexed by their foreign key and attached to the
+        model they belong to so accessing the relationship does not query again.
+
+        Arguments:
+            models {list|Collection} -- The hydrated models to load the relationship for.
+
+        Keyword Arguments:
+            nested {list} -- Relationships to eager load on the related models. (default: {()})
+        """
+        keys = []
+        for model in models:
+            key = model.__attributes__.get(self.local_key)
+            if key is not None:
+                keys.append(key)
+        keys = list(dict.fromkeys(keys))
+
+        related = self.fn(self)
+        related.boot()
+        chunk_size = related.builder.grammar.parameter_limit
+
+        index = {}
+        for offset in range(0, len(keys), chunk_size):
+            for result in (
+                related.where_in(self.foreign_key, keys[offset : offset + chunk_size])
+                .with_(*nested)
+                .get()
+            ):
+                index.setdefault(
+                    result.__attributes__.get(self.foreign_key), []
+                ).append(result)
+
+        for model in models:
+            model._relationships[self.fn.__name__] = self.get_eager_result(
+                index.get(model.__attributes__.get(self.local_key), [])
+            )
+
+    def get_eager_result(self, results):
+        """Gets the value attached to a model from the related records that belong to it.
+
+        Arguments:
+            results {list} -- The related models that belong to a single model.
+
+        Returns:
+            Collection
+        """
+        return Collection(results)
+
     def apply_query(self, foreign, owner, foreign_key, local_key):
         """Apply the query and return a dictionary to be hydrated
 
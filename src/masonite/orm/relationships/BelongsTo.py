@@ -2,6 +2,17 @@ from .BaseRelationship import BaseRelationship
 
 
 class BelongsTo(BaseRelationship):
+    def get_eager_result(self, results):
+        """Gets the value attached to a model from the related records that belong to it.
+
+        Arguments:
+            results {list} -- The related models that belong to a single model.
+
+        Returns:
+            Model|None
+        """
+        return results[0] if results else None
+
     def apply_query(self, foreign, owner, foreign_key, local_key):
         """Apply the query and return a dictionary to be hydrated
 
@@ -14,4 +25,7 @@ class BelongsTo(BaseRelationship):
         Returns:
             dict -- A dictionary of data which will be hydrated.
         """
+        if foreign_key == foreign.__primary_key__:
+            return foreign.find(owner.__attributes__[local_key])
+
         return foreign.where(foreign_key, owner.__attributes__[local_key]).first()
@@ -9,4 +9,6 @@ class TimeStamps:
         owner_cls.updated_at = "now"
 
     def set_timestamp_create(owner_cls, query):
-        owner_cls.builder._creates.update({"updated_at": "now", "created_at": "now"})
+        creates = query._creates
+        for row in creates if isinstance(creates, list) else [creates]:
+            row.update({"updated_at": "now", "created_at": "now"})
@@ -7,10 +7,12 @@ class scope:
 
     def __set_name__(self, cls, name):
         cls.boot()
-        cls.builder.set_scope(cls, name)
+        cls._builder.set_scope(cls, name)
         self.cls = cls
 
     def __call__(self, *args, **kwargs):
-        # self.cls.boot()
-        self.fn(self.cls.builder, *args, **kwargs)
-        return self.cls.builder
+        return self.apply(self.cls.builder, *args, **kwargs)
+
+    def apply(self, builder, *args, **kwargs):
+        self.fn(builder, *args, **kwargs)
+        return builder
@@ -0,0 +1,456 @@
+"""Benchmarks for the query builder, model hydration, collections and SQLite round trips.
+
+Run from the root of the repository:
+
+    python -m tests.benchmarks.benchmark --output bench_results.json
+
+Every benchmark runs against an in memory SQLite database, except the MySQL ones which
+run against a stand in connection that waits a fixed latency for each round trip. The
+timings of each run are written as JSON so results from different commits can be compared.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+import types
+from contextlib import contextmanager
+from datetime import datetime
+from unittest import mock
+
+from config.database import CONNECTIONS
+from src.masonite.orm.builder import QueryBuilder, param
+from src.masonite.orm.collection import Collection
+from src.masonite.orm.connections.MySQLConnection import (
+    CONNECTION_POOLS,
+    MySQLConnection,
+)
+from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
+from src.masonite.orm.grammar import GrammarFactory
+from src.masonite.orm.models import Model
+from src.masonite.orm.relationships import has_many
+
+BENCHMARKS = []
+
+
+def benchmark(name, **params):
+    """Registers a benchmark.
+
+    The decorated function receives the params and returns the callable that is
+    timed, so setup work is kept out of the timings. It can also yield the callable,
+    the code after the yield then runs once the benchmark ends.
+
+    Arguments:
+        name {string} -- The name of the benchmark.
+
+    Keyword Arguments:
+        params {list} -- The values each parameter is run with.
+
+    Returns:
+        callable
+    """
+
+    def decorator(setup):
+        BENCHMARKS.append((name, params, setup))
+        return setup
+
+    return decorator
+
+
+class BenchPost(Model):
+    __connection__ = "sqlite"
+    __table__ = "posts"
+
+
+class BenchUser(Model):
+    __connection__ = "sqlite"
+    __table__ = "users"
+
+    @has_many("id", "user_id")
+    def posts(self):
+        return BenchPost
+
+
+@contextmanager
+def memory_database():
+    """Points the 'sqlite' connection at a new in memory database.
+    """
+    database = CONNECTIONS["sqlite"]["database"]
+    CONNECTIONS["sqlite"]["database"] = ":memory:"
+    SQLiteConnection.set_connection_settings(CONNECTIONS["sqlite"])
+    try:
+        for statement in (
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(255), email VARCHAR(255))",
+            "CREATE TABLE posts (id INTEGER PRIMARY KEY, user_id INTEGER, title VARCHAR(255))",
+        ):
+            SQLiteConnection().query(statement, ())
+        yield
+    finally:
+        SQLiteConnection().close()
+        CONNECTIONS["sqlite"]["database"] = database
+        SQLiteConnection.set_connection_settings(CONNECTIONS["sqlite"])
+
+
+class LatencyCursor:
+    """Stands in for a pymysql cursor, waiting 'latency' seconds for each round trip.
+    """
+
+    latency = 0.0002
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, query, args=None):
+        time.sleep(self.latency)
+
+    def nextset(self):
+        return True
+
+    def fetchone(self):
+        return None
+
+    def fetchall(self):
+        return ()
+
+
+class LatencyConnection:
+    def cursor(self, cursorclass=None):
+        return LatencyCursor()
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        pass
+
+
+class BenchMySQLConnection(MySQLConnection):
+    pass
+
+
+def make_builder(table="users"):
+    return QueryBuilder(GrammarFactory.make("sqlite"), SQLiteConnection, table=table)
+
+
+def make_rows(size):
+    return [
+        {"id": index, "name": "user{}".format(index % 1000), "email": "user@email.com"}
+        for index in range(size)
+    ]
+
+
+@benchmark("builder.to_qmark.simple")
+def simple_to_qmark():
+    return lambda: make_builder().where("id", 1).to_qmark()
+
+
+@benchmark("builder.to_qmark.complex")
+def complex_to_qmark():
+    def run():
+        return (
+            make_builder()
+            .select("id", "name", "email")
+            .join("posts", "users.id", "=", "posts.user_id")
+            .where("name", "Joe")
+            .where("age", ">", 18)
+            .where_in("role", ["admin", "editor", "author"])
+            .where_null("deleted_at")
+            .between("created_at", "2020-01-01", "2020-12-31")
+            .group_by("name")
+            .order_by("id", "DESC")
+            .limit(20)
+            .to_qmark()
+        )
+
+    return run
+
+
+@benchmark("builder.where", predicates=[10, 200, 2000])
+def many_wheres(predicates):
+    def run():
+        builder = make_builder()
+        for index in range(predicates):
+            builder.where("column{}".format(index % 50), ">", index)
+        return builder
+
+    return run
+
+
+@benchmark("builder.to_qmark.predicates", predicates=[10, 200, 2000])
+def many_predicates_to_qmark(predicates):
+    def run():
+        builder = make_builder()
+        for index in range(predicates):
+            if index % 3:
+                builder.where("column{}".format(index % 50), ">", index)
+            else:
+                builder.or_where("column{}".format(index % 50), index)
+        return builder.to_qmark()
+
+    return run
+
+
+@benchmark("model.hydrate", rows=[1000, 100000, 1000000])
+def hydrate(rows):
+    records = make_rows(rows)
+    return lambda: [BenchUser.hydrate(record) for record in records]
+
+
+@benchmark("model.hydrate_compact", rows=[1000, 100000, 1000000])
+def hydrate_compact(rows):
+    columns = ("id", "name", "email")
+    records = [tuple(record.values()) for record in make_rows(rows)]
+    return lambda: BenchUser.hydrate_compact(columns, records)
+
+
+@benchmark("collection.pluck.dicts", rows=[100000])
+def pluck_dicts(rows):
+    collection = Collection(make_rows(rows))
+    return lambda: collection.pluck("name")
+
+
+@benchmark("collection.pluck.models", rows=[100000])
+def pluck_models(rows):
+    collection = Collection([BenchUser.hydrate(record) for record in make_rows(rows)])
+    return lambda: collection.pluck("name")
+
+
+@benchmark("collection.where", rows=[100000])
+def collection_where(rows):
+    collection = Collection(make_rows(rows))
+    return lambda: collection.where("name", "user1")
+
+
+@benchmark("collection.where.indexed", rows=[100000])
+def collection_where_indexed(rows):
+    collection = Collection(make_rows(rows)).index("name")
+    return lambda: collection.where("name", "user1")
+
+
+@benchmark("collection.group_by", rows=[100000])
+def collection_group_by(rows):
+    collection = Collection(make_rows(rows))
+    return lambda: collection.group_by("name")
+
+
+@benchmark("collection.unique", rows=[100000])
+def collection_unique(rows):
+    collection = Collection([index % 1000 for index in range(rows)])
+    return lambda: collection.unique()
+
+
+@benchmark("collection.sort", rows=[100000])
+def collection_sort(rows):
+    values = list(range(rows))
+    random.Random(rows).shuffle(values)
+    return lambda: Collection(list(values)).sort()
+
+
+@benchmark("sqlite.insert_many", rows=[1000, 10000])
+def insert_many(rows):
+    records = [
+        {"name": record["name"], "email": record["email"]} for record in make_rows(rows)
+    ]
+
+    def run():
+        make_builder().insert_many(records)
+        SQLiteConnection().query("DELETE FROM users", ())
+
+    return run
+
+
+@benchmark("sqlite.get", rows=[1000, 10000])
+def select_models(rows):
+    SQLiteConnection().query("DELETE FROM users", ())
+    make_builder().insert_many(
+        [
+            {"name": record["name"], "email": record["email"]}
+            for record in make_rows(rows)
+        ]
+    )
+    return lambda: BenchUser.where("id", ">", 0).get()
+
+
+@benchmark("sqlite.first")
+def first():
+    SQLiteConnection().query("DELETE FROM users", ())
+    make_builder().create({"name": "Joe", "email": "joe@email.com"})
+    return lambda: BenchUser.where("email", "joe@email.com").first()
+
+
+@benchmark("sqlite.first.template")
+def first_template():
+    SQLiteConnection().query("DELETE FROM users", ())
+    make_builder().create({"name": "Joe", "email": "joe@email.com"})
+    find_by_email = BenchUser.where("email", param("email")).template("first")
+    return lambda: find_by_email(email="joe@email.com")
+
+
+@benchmark("sqlite.eager_load", parents=[100, 1000])
+def eager_load(parents):
+    SQLiteConnection().query("DELETE FROM users", ())
+    SQLiteConnection().query("DELETE FROM posts", ())
+    make_builder().insert_many(
+        [{"name": "user{}".format(index)} for index in range(parents)]
+    )
+    make_builder("posts").insert_many(
+        [
+            {"user_id": index % parents + 1, "title": "post{}".format(index)}
+            for index in range(parents * 5)
+        ]
+    )
+    return lambda: BenchUser.with_("posts").where("id", ">", 0).get()
+
+
+@benchmark("mysql.query", prepared=[False, True])
+def mysql_query(prepared):
+    BenchMySQLConnection.set_connection_settings(
+        dict(
+            CONNECTIONS["mysql"],
+            host="masonite-benchmark",
+            pool={"min": 1, "max": 1},
+            prepared_statements={"enabled": prepared},
+        )
+    )
+    connection = BenchMySQLConnection()
+    with mock.patch(
+        "pymysql.connect", side_effect=lambda **kwargs: LatencyConnection()
+    ):
+        pool = connection.get_pool()
+
+    query = "SELECT * FROM `users` WHERE `users`.`email` = '?'"
+    try:
+        yield lambda: [
+            BenchMySQLConnection().query(query, ("joe@email.com",)) for _ in range(100)
+        ]
+    finally:
+        CONNECTION_POOLS.pop(connection._get_pool_key(), None)
+        pool.close()
+
+
+def measure(run, repeat):
+    """Times a callable.
+
+    Arguments:
+        run {callable} -- The code being measured.
+        repeat {int} -- The number of timed runs.
+
+    Returns:
+        dict
+    """
+    run()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "repeat": repeat,
+        "min": min(timings),
+        "max": max(timings),
+        "mean": statistics.mean(timings),
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if repeat > 1 else 0.0,
+    }
+
+
+def get_commit():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(repeat=5, max_rows=None, only=None):
+    """Runs the registered benchmarks.
+
+    Keyword Arguments:
+        repeat {int} -- The number of timed runs of each benchmark. (default: {5})
+        max_rows {int} -- Caps the number of rows of each benchmark, for quick runs. (default: {None})
+        only {string} -- Only runs the benchmarks whose name starts with this. (default: {None})
+
+    Returns:
+        dict -- The environment and the results of each benchmark.
+    """
+    results = []
+    with memory_database():
+        for name, params, setup in BENCHMARKS:
+            if only and not name.startswith(only):
+                continue
+
+            cases = [{}]
+            for param, values in params.items():
+                if max_rows is not None:
+                    values = sorted(set(min(value, max_rows) for value in values))
+
+                cases = [
+                    dict(case, **{param: value}) for case in cases for value in values
+                ]
+
+            for case in cases:
+                run = setup(**case)
+                fixture = run if isinstance(run, types.GeneratorType) else None
+                if fixture is not None:
+                    run = next(fixture)
+
+                result = {"name": name, "params": case}
+                try:
+                    result.update(measure(run, repeat))
+                finally:
+                    if fixture is not None:
+                        fixture.close()
+                results.append(result)
+
+    return {
+        "created_at": datetime.utcnow().isoformat(),
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlite": sqlite3.sqlite_version,
+        "results": results,
+    }
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Runs the ORM benchmarks.")
+    parser.add_argument("--output", help="The JSON file the results are written to.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-rows", type=int, default=None)
+    parser.add_argument("--only", default=None)
+    options = parser.parse_args(arguments)
+
+    report = run_benchmarks(options.repeat, options.max_rows, options.only)
+    for result in report["results"]:
+        params = " ".join(
+            "{}={}".format(key, value) for key, value in result["params"].items()
+        )
+        print(
+            "{:<28} {:<16} {:>12.3f}ms".format(
+                result["name"], params, result["median"] * 1000
+            )
+        )
+
+    if options.output:
+        with open(options.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+
+    return report
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
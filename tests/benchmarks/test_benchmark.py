@@ -0,0 +1,41 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from src.masonite.orm.connections.MySQLConnection import CONNECTION_POOLS
+from tests.benchmarks.benchmark import BENCHMARKS, main
+
+
+class TestBenchmarks(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_every_benchmark_runs_and_is_written_as_json(self):
+        output = os.path.join(self.directory, "results.json")
+        main(["--repeat", "1", "--max-rows", "20", "--output", output])
+
+        with open(output) as handle:
+            report = json.load(handle)
+
+        self.assertEqual(
+            {result["name"] for result in report["results"]},
+            {name for name, _, _ in BENCHMARKS},
+        )
+        hydrate = [
+            result for result in report["results"] if result["name"] == "model.hydrate"
+        ]
+        self.assertEqual(hydrate[0]["params"], {"rows": 20})
+        for result in report["results"]:
+            self.assertGreaterEqual(result["median"], 0)
+
+    def test_mysql_benchmark_does_not_leave_its_pool_behind(self):
+        with mock.patch.dict(CONNECTION_POOLS, clear=True):
+            main(["--repeat", "1", "--only", "mysql"])
+
+            self.assertEqual(CONNECTION_POOLS, {})
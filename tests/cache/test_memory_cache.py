@@ -0,0 +1,53 @@
+import unittest
+
+from src.masonite.orm.cache import MemoryCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMemoryCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = MemoryCache(maxsize=2, clock=self.clock)
+
+    def test_get_and_put(self):
+        self.cache.put("users", [1])
+
+        self.assertEqual(self.cache.get("users"), [1])
+        self.assertEqual(self.cache.get("missing", "default"), "default")
+
+    def test_entries_expire(self):
+        self.cache.put("users", [1], ttl=10)
+        self.clock.now = 9
+        self.assertEqual(self.cache.get("users"), [1])
+
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get("users"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_forget_tags_removes_tagged_entries(self):
+        self.cache.put("users", [1], tags=("users",))
+        self.cache.put("joined", [2], tags=("users", "profiles"))
+
+        self.cache.forget_tags(("profiles",))
+
+        self.assertEqual(self.cache.get("users"), [1])
+        self.assertIsNone(self.cache.get("joined"))
+
+    def test_evicted_entries_are_untagged(self):
+        self.cache.put("first", 1, tags=("users",))
+        self.cache.put("second", 2, tags=("users",))
+        self.cache.put("third", 3, tags=("posts",))
+
+        self.assertIsNone(self.cache.get("first"))
+        self.assertEqual(self.cache._tags, {"users": {"second"}, "posts": {"third"}})
+
+    def test_falsy_values_are_cached(self):
+        self.cache.put("empty", None)
+        self.assertIsNone(self.cache.get("empty", "default"))
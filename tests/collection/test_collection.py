@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from src.masonite.orm.collection import Collection
 from src.masonite.orm.factories import Factory as factory
@@ -31,6 +32,86 @@ class TestCollection(unittest.TestCase):
         collection = factory(Model, 5).make()
         self.assertEqual(collection.pluck("batch"), [1, 1, 1, 1, 1])
 
+    def test_pluck_reads_models_without_serializing(self):
+        model = Model.hydrate({"id": 1, "name": "Joe"})
+        model.name = "Bob"
+
+        with mock.patch.object(Model, "serialize") as serialize:
+            self.assertEqual(Collection([model]).pluck("name"), ["Bob"])
+            self.assertEqual(Collection([model]).pluck("missing"), [])
+
+        serialize.assert_not_called()
+        self.assertEqual(model.__attributes__, {"id": 1, "name": "Joe"})
+
+    def test_key_by(self):
+        collection = Collection(
+            [
+                {"id": 1, "name": "Joe"},
+                {"id": 2, "name": "Bob"},
+                {"id": 3, "name": "Joe"},
+            ]
+        )
+
+        self.assertEqual(
+            collection.key_by("name"),
+            {"Joe": {"id": 3, "name": "Joe"}, "Bob": {"id": 2, "name": "Bob"}},
+        )
+        self.assertEqual(
+            list(collection.key_by(lambda item: item["id"] * 2)), [2, 4, 6]
+        )
+
+    def test_group_by(self):
+        collection = Collection(
+            [
+                {"id": 1, "name": "Joe"},
+                {"id": 2, "name": "Bob"},
+                {"id": 3, "name": "Joe"},
+            ]
+        )
+        groups = collection.group_by("name")
+
+        self.assertEqual(list(groups), ["Joe", "Bob"])
+        self.assertIsInstance(groups["Joe"], Collection)
+        self.assertEqual(groups["Joe"].pluck("id"), [1, 3])
+
+    def test_where_uses_an_index(self):
+        collection = Collection(
+            [
+                {"id": 1, "name": "Joe"},
+                {"id": 2, "name": "Bob"},
+                {"id": 3, "name": "Joe"},
+            ]
+        ).index("name")
+
+        with mock.patch.object(Collection, "_data_get", side_effect=AssertionError):
+            self.assertEqual(collection.where("name", "Joe").pluck("id"), [1, 3])
+            self.assertEqual(collection.where("name", "Bill").all(), [])
+
+        self.assertEqual(collection.where("id", ">", 1).pluck("id"), [2, 3])
+
+        collection.push({"id": 4, "name": "Joe"})
+        self.assertEqual(collection.where("name", "Joe").pluck("id"), [1, 3, 4])
+
+    def test_reverse_drops_the_indexes(self):
+        collection = Collection(
+            [
+                {"id": 1, "name": "Joe"},
+                {"id": 2, "name": "Bob"},
+                {"id": 3, "name": "Joe"},
+            ]
+        ).index("name")
+
+        collection.reverse()
+
+        self.assertEqual(collection.where("name", "Joe").pluck("id"), [3, 1])
+        self.assertIsInstance(collection.all(), list)
+
+    def test_where_with_models(self):
+        collection = Collection(
+            [Model.hydrate({"id": 1, "age": 20}), Model.hydrate({"id": 2, "age": 30})]
+        )
+        self.assertEqual(collection.where("age", ">", 25).pluck("id"), [2])
+
     def test_where(self):
         collection = Collection(
             [
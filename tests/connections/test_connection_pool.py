@@ -0,0 +1,448 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import pymysql
+from pymysql.constants import CLIENT
+
+from src.masonite.orm.connections import AsyncConnection, ConnectionPool
+from src.masonite.orm.connections.MySQLConnection import (
+    CONNECTION_POOLS,
+    MySQLConnection,
+    compile_placeholders,
+)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.alive = True
+
+    def ping(self):
+        return self.alive
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool(unittest.TestCase):
+    def get_pool(self, **kwargs):
+        self.created = []
+
+        def creator():
+            connection = FakeConnection()
+            self.created.append(connection)
+            return connection
+
+        return ConnectionPool(
+            creator,
+            ping=lambda connection: connection.ping(),
+            close=lambda connection: connection.close(),
+            **kwargs
+        )
+
+    def test_checkout_returns_different_connections(self):
+        pool = self.get_pool(max_size=2)
+        first = pool.checkout()
+        second = pool.checkout()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(pool.stats(), {"size": 2, "idle": 0, "in_use": 2})
+
+    def test_checkin_reuses_connection(self):
+        pool = self.get_pool()
+        connection = pool.checkout()
+        pool.checkin(connection)
+
+        self.assertIs(pool.checkout(), connection)
+        self.assertEqual(len(self.created), 1)
+
+    def test_checkout_times_out_when_pool_is_exhausted(self):
+        pool = self.get_pool(max_size=1)
+        pool.checkout()
+
+        with self.assertRaises(TimeoutError):
+            pool.checkout(timeout=0.05)
+
+    def test_checkout_waits_for_checkin(self):
+        pool = self.get_pool(max_size=1)
+        connection = pool.checkout()
+
+        timer = threading.Timer(0.05, pool.checkin, args=(connection,))
+        timer.start()
+
+        self.assertIs(pool.checkout(timeout=2), connection)
+        timer.join()
+
+    def test_dead_connections_are_replaced(self):
+        pool = self.get_pool(ping_interval=0)
+        connection = pool.checkout()
+        pool.checkin(connection)
+        connection.alive = False
+
+        replacement = pool.checkout()
+
+        self.assertIsNot(replacement, connection)
+        self.assertTrue(connection.closed)
+        self.assertEqual(len(pool), 1)
+
+    def test_connections_are_recycled(self):
+        pool = self.get_pool(recycle=0)
+        connection = pool.checkout()
+        time.sleep(0.001)
+        pool.checkin(connection)
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.stats()["size"], 0)
+
+    def test_idle_connections_above_minimum_are_closed(self):
+        pool = self.get_pool(min_size=1, max_size=3, idle_timeout=0)
+        first = pool.checkout()
+        second = pool.checkout()
+        pool.checkin(first)
+        time.sleep(0.001)
+        pool.checkin(second)
+
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+        self.assertEqual(pool.stats(), {"size": 1, "idle": 1, "in_use": 0})
+
+    def test_fill_opens_minimum_connections(self):
+        pool = self.get_pool(min_size=3).fill()
+        self.assertEqual(pool.stats(), {"size": 3, "idle": 3, "in_use": 0})
+
+    def test_discard_frees_a_slot(self):
+        pool = self.get_pool(max_size=1)
+        connection = pool.checkout()
+        pool.discard(connection)
+
+        self.assertTrue(connection.closed)
+        self.assertIsNot(pool.checkout(timeout=0), connection)
+
+    def test_threads_never_share_a_connection(self):
+        pool = self.get_pool(max_size=4)
+        in_use = set()
+        errors = []
+        lock = threading.Lock()
+
+        def work():
+            for _ in range(50):
+                connection = pool.checkout()
+                with lock:
+                    if id(connection) in in_use:
+                        errors.append(connection)
+                    in_use.add(id(connection))
+                with lock:
+                    in_use.discard(id(connection))
+                pool.checkin(connection)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.created), 4)
+
+    def test_from_config(self):
+        pool = ConnectionPool.from_config(
+            FakeConnection, {"min": 2, "max": 5, "timeout": 1, "recycle": 60}
+        )
+        self.assertEqual(pool.min_size, 2)
+        self.assertEqual(pool.max_size, 5)
+        self.assertEqual(pool.timeout, 1)
+        self.assertEqual(pool.recycle, 60)
+
+
+class TestMySQLConnectionPooling(unittest.TestCase):
+    def setUp(self):
+        MySQLConnection.set_connection_settings(
+            {
+                "driver": "mysql",
+                "host": "localhost",
+                "user": "root",
+                "password": "",
+                "database": "orm_pool_test",
+                "port": "3306",
+                "pool": {"max": 2},
+            }
+        )
+        self.pools = mock.patch.dict(CONNECTION_POOLS, clear=True)
+        self.pools.start()
+
+    def tearDown(self):
+        self.pools.stop()
+
+    def test_query_returns_connection_to_pool(self):
+        with mock.patch("pymysql.connect") as connect:
+            connection = MySQLConnection()
+            connection.query("SELECT 1", ())
+            connection.query("SELECT 1", ())
+
+            self.assertEqual(connect.call_count, 1)
+            self.assertIsNone(connection._connection)
+            self.assertEqual(connection.get_pool().stats()["in_use"], 0)
+
+    def test_first_connect_opens_the_minimum_connections(self):
+        MySQLConnection.set_connection_settings(
+            dict(MySQLConnection.connection_details, pool={"min": 3, "max": 5})
+        )
+        with mock.patch("pymysql.connect") as connect:
+            connect.side_effect = lambda **options: mock.MagicMock()
+            connection = MySQLConnection()
+            connection.query("SELECT 1", ())
+
+            self.assertEqual(connect.call_count, 3)
+            self.assertEqual(connection.get_pool().stats()["size"], 3)
+
+    def test_stream_uses_an_unbuffered_cursor(self):
+        with mock.patch("pymysql.connect") as connect:
+            cursor = connect.return_value.cursor.return_value
+            cursor.fetchmany.side_effect = [[{"id": 1}, {"id": 2}], [{"id": 3}], []]
+
+            connection = MySQLConnection()
+            rows = list(connection.stream("SELECT * FROM `users`", (), chunk_size=2))
+
+            self.assertEqual(rows, [{"id": 1}, {"id": 2}, {"id": 3}])
+            connect.return_value.cursor.assert_called_with(pymysql.cursors.SSDictCursor)
+            cursor.fetchmany.assert_called_with(2)
+            self.assertEqual(connection.get_pool().stats()["idle"], 1)
+
+    def test_abandoned_stream_discards_the_connection(self):
+        with mock.patch("pymysql.connect") as connect:
+            cursor = connect.return_value.cursor.return_value
+            cursor.fetchmany.return_value = [{"id": 1}]
+
+            connection = MySQLConnection()
+            rows = connection.stream("SELECT * FROM `users`", ())
+            next(rows)
+            rows.close()
+
+            self.assertTrue(connect.return_value.close.called)
+            self.assertEqual(connection.get_pool().stats()["size"], 0)
+
+    def test_query_tuples_uses_a_tuple_cursor(self):
+        with mock.patch("pymysql.connect") as connect:
+            cursor = connect.return_value.cursor.return_value.__enter__.return_value
+            cursor.description = (("id",), ("name",))
+            cursor.fetchall.return_value = ((1, "Joe"),)
+
+            columns, rows = MySQLConnection().query_tuples("SELECT * FROM `users`")
+
+            self.assertEqual(columns, ("id", "name"))
+            self.assertEqual(rows, ((1, "Joe"),))
+            connect.return_value.cursor.assert_called_with(pymysql.cursors.Cursor)
+
+    def test_transaction_pins_one_connection(self):
+        with mock.patch("pymysql.connect") as connect:
+            connect.side_effect = lambda **kwargs: mock.MagicMock()
+            connection = MySQLConnection()
+            connection.begin_transaction()
+            pinned = connection._get_transaction()["connection"]
+
+            MySQLConnection().query("UPDATE `users` SET `name` = 'Joe'", ())
+            MySQLConnection().query("UPDATE `users` SET `name` = 'Bob'", ())
+
+            self.assertEqual(connect.call_count, 1)
+            pinned.begin.assert_called_once_with()
+            self.assertEqual(connection.get_pool().stats()["in_use"], 1)
+
+            connection.commit()
+
+            pinned.commit.assert_called_once_with()
+            self.assertEqual(connection.transaction_level(), 0)
+            self.assertEqual(connection.get_pool().stats()["idle"], 1)
+
+    def test_async_queries_run_inside_the_transaction(self):
+        query = "INSERT INTO `users` (`name`) VALUES ('Joe')"
+        with mock.patch("pymysql.connect") as connect:
+            connect.side_effect = lambda **kwargs: mock.MagicMock()
+            connection = MySQLConnection()
+            connection.begin_transaction()
+            pinned = connection._get_transaction()["connection"]
+
+            loop = asyncio.new_event_loop()
+            self.addCleanup(loop.close)
+            try:
+                loop.run_until_complete(
+                    AsyncConnection(MySQLConnection).query(query, ())
+                )
+            finally:
+                connection.rollback()
+
+            cursor = pinned.cursor.return_value.__enter__.return_value
+            cursor.execute.assert_called_once_with(query, ())
+            pinned.rollback.assert_called_once_with()
+            self.assertEqual(connect.call_count, 1)
+            self.assertEqual(connection.get_pool().stats()["in_use"], 0)
+
+    def test_tasks_have_transactions_of_their_own(self):
+        query = "INSERT INTO `users` (`name`) VALUES ('Joe')"
+        pinned = {}
+
+        async def work(name, fails):
+            connection = MySQLConnection()
+            connection.begin_transaction()
+            pinned[name] = connection._get_transaction()["connection"]
+            await asyncio.sleep(0)
+            MySQLConnection().query(query, ())
+            await asyncio.sleep(0)
+            if fails:
+                connection.rollback()
+            else:
+                connection.commit()
+
+        async def both():
+            await asyncio.gather(work("failed", True), work("saved", False))
+
+        with mock.patch("pymysql.connect") as connect:
+            connect.side_effect = lambda **kwargs: mock.MagicMock()
+            loop = asyncio.new_event_loop()
+            self.addCleanup(loop.close)
+            loop.run_until_complete(both())
+
+        self.assertIsNot(pinned["failed"], pinned["saved"])
+        for connection in pinned.values():
+            cursor = connection.cursor.return_value.__enter__.return_value
+            cursor.execute.assert_called_once_with(query, ())
+        pinned["failed"].rollback.assert_called_once_with()
+        pinned["failed"].commit.assert_not_called()
+        pinned["saved"].commit.assert_called_once_with()
+        pinned["saved"].rollback.assert_not_called()
+        self.assertEqual(MySQLConnection().transaction_level(), 0)
+
+    def test_transaction_queries_cannot_run_concurrently(self):
+        with mock.patch("pymysql.connect"):
+            connection = MySQLConnection()
+            connection.begin_transaction()
+            try:
+                first = MySQLConnection().make_connection()
+                with self.assertRaises(ValueError):
+                    MySQLConnection().make_connection()
+
+                first.release()
+                MySQLConnection().query("SELECT 1", ())
+            finally:
+                connection.rollback()
+
+    def test_nested_transactions_use_savepoints(self):
+        with mock.patch("pymysql.connect"):
+            connection = MySQLConnection()
+            connection.begin_transaction()
+            connection.begin_transaction()
+            cursor = connection._get_transaction()["connection"].cursor.return_value
+            cursor = cursor.__enter__.return_value
+
+            self.assertEqual(connection.transaction_level(), 2)
+            connection.rollback()
+            connection.commit()
+
+            self.assertEqual(
+                [call[0][0] for call in cursor.execute.call_args_list],
+                [
+                    "SAVEPOINT masonite_savepoint_1",
+                    "ROLLBACK TO SAVEPOINT masonite_savepoint_1",
+                    "RELEASE SAVEPOINT masonite_savepoint_1",
+                ],
+            )
+            self.assertEqual(connection.transaction_level(), 0)
+
+    def test_prepared_statements_are_reused_per_connection(self):
+        settings = dict(MySQLConnection.connection_details)
+        settings["prepared_statements"] = {"enabled": True, "max": 1}
+        MySQLConnection.set_connection_settings(settings)
+        query = "SELECT * FROM `users` WHERE `users`.`id` = '?'"
+
+        with mock.patch("pymysql.connect") as connect:
+            cursor = connect.return_value.cursor.return_value.__enter__.return_value
+            stats = MySQLConnection.get_statement_stats()
+            MySQLConnection().query(query, (1,), results=1)
+            MySQLConnection().query(query, (2,), results=1)
+            MySQLConnection().query("SELECT * FROM `users` LIMIT '?'", (1,))
+
+            statements = [call[0] for call in cursor.execute.call_args_list]
+            name = statements[0][0].split()[1]
+            self.assertEqual(
+                statements,
+                [
+                    (
+                        "PREPARE {} FROM %s; "
+                        "SET @masonite_0 = %s; "
+                        "EXECUTE {} USING @masonite_0".format(name, name),
+                        ("SELECT * FROM `users` WHERE `users`.`id` = ?", 1),
+                    ),
+                    (
+                        "SET @masonite_0 = %s; "
+                        "EXECUTE {} USING @masonite_0".format(name),
+                        (2,),
+                    ),
+                    (mock.ANY, ("SELECT * FROM `users` LIMIT ?", 1),),
+                ],
+            )
+            self.assertTrue(
+                statements[2][0].startswith("DEALLOCATE PREPARE {}; ".format(name))
+            )
+            self.assertEqual(cursor.nextset.call_count, 2 + 1 + 3)
+            self.assertEqual(
+                connect.call_args[1]["client_flag"] & CLIENT.MULTI_STATEMENTS,
+                CLIENT.MULTI_STATEMENTS,
+            )
+
+            current = MySQLConnection.get_statement_stats()
+            self.assertEqual(current["hits"] - stats["hits"], 1)
+            self.assertEqual(current["prepares"] - stats["prepares"], 2)
+            self.assertEqual(current["evictions"] - stats["evictions"], 1)
+
+    def test_failed_prepares_are_not_reused(self):
+        settings = dict(MySQLConnection.connection_details)
+        settings["prepared_statements"] = {"enabled": True}
+        MySQLConnection.set_connection_settings(settings)
+        query = "SELECT * FROM `missing` WHERE `missing`.`id` = '?'"
+
+        with mock.patch("pymysql.connect") as connect:
+            cursor = connect.return_value.cursor.return_value.__enter__.return_value
+            cursor.execute.side_effect = [pymysql.err.ProgrammingError, None, None]
+            with self.assertRaises(pymysql.err.ProgrammingError):
+                MySQLConnection().query(query, (1,))
+
+            MySQLConnection().query(query, (1,))
+            MySQLConnection().query(query, (2,))
+
+            statements = [call[0][0] for call in cursor.execute.call_args_list]
+            self.assertEqual(connect.call_count, 1)
+            self.assertTrue(statements[0].startswith("PREPARE "))
+            self.assertTrue(statements[1].startswith("PREPARE "))
+            self.assertTrue(statements[2].startswith("SET "))
+
+    def test_executed_statements_stay_prepared_when_the_execute_fails(self):
+        settings = dict(MySQLConnection.connection_details)
+        settings["prepared_statements"] = {"enabled": True}
+        MySQLConnection.set_connection_settings(settings)
+        query = "INSERT INTO `users` (`id`) VALUES ('?')"
+
+        with mock.patch("pymysql.connect") as connect:
+            cursor = connect.return_value.cursor.return_value.__enter__.return_value
+            cursor.nextset.side_effect = [None, pymysql.err.IntegrityError, None]
+            with self.assertRaises(pymysql.err.IntegrityError):
+                MySQLConnection().query(query, (1,))
+
+            MySQLConnection().query(query, (2,))
+
+            statements = [call[0][0] for call in cursor.execute.call_args_list]
+            self.assertTrue(statements[1].startswith("SET "))
+
+    def test_queries_are_not_prepared_by_default(self):
+        with mock.patch("pymysql.connect") as connect:
+            cursor = connect.return_value.cursor.return_value.__enter__.return_value
+            MySQLConnection().query("SELECT * FROM `users` WHERE `id` = '?'", (1,))
+
+            cursor.execute.assert_called_once_with(
+                "SELECT * FROM `users` WHERE `id` = %s", (1,)
+            )
+            self.assertNotIn("client_flag", connect.call_args[1])
+            self.assertEqual(
+                compile_placeholders("SELECT * FROM `users` WHERE `id` = '?'")[2], 1
+            )
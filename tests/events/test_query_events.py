@@ -0,0 +1,131 @@
+import threading
+import unittest
+from unittest import mock
+
+from src.masonite.orm.builder import QueryBuilder
+from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
+from src.masonite.orm.events import QueryCounter, QueryEvents, SlowQueryLog
+from src.masonite.orm.grammar import GrammarFactory
+from tests.utils import use_sqlite_database
+
+
+class TestQueryEvents(unittest.TestCase):
+    def setUp(self):
+        self.listeners = mock.patch.dict(
+            QueryEvents.listeners, {"before": [], "after": []}
+        )
+        self.listeners.start()
+
+        use_sqlite_database(
+            self, ("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(255))",)
+        )
+        self.get_builder().insert_many([{"name": "Joe"}, {"name": "Bob"}])
+
+    def tearDown(self):
+        self.listeners.stop()
+        QueryEvents.enabled = any(QueryEvents.listeners.values())
+
+    def get_builder(self):
+        return QueryBuilder(
+            GrammarFactory.make("sqlite"), SQLiteConnection, table="users"
+        )
+
+    def test_listeners_receive_the_query(self):
+        before, after = [], []
+        QueryEvents.listen("before", lambda event: before.append(event.duration))
+        QueryEvents.listen("after", after.append)
+
+        self.get_builder().where("name", "Joe").get()
+
+        event = after[0]
+        self.assertEqual(before, [None])
+        self.assertEqual(
+            event.sql, "SELECT * FROM `users` WHERE `users`.`name` = '?'",
+        )
+        self.assertEqual(event.bindings, ("Joe",))
+        self.assertEqual(event.connection, "sqlite")
+        self.assertEqual(event.rows, 1)
+        self.assertGreaterEqual(event.duration, 0)
+        self.assertIsNone(event.error)
+
+    def test_failed_queries_are_dispatched(self):
+        events = []
+        QueryEvents.listen("after", events.append)
+
+        with self.assertRaises(Exception):
+            SQLiteConnection().query("SELECT * FROM missing", ())
+
+        self.assertIsNotNone(events[0].error)
+        self.assertIsNone(events[0].rows)
+
+    def test_streamed_queries_are_dispatched(self):
+        before, after = [], []
+        QueryEvents.listen("before", before.append)
+        QueryEvents.listen("after", after.append)
+
+        rows = self.get_builder().order_by("id").cursor()
+        self.assertEqual(before, [])
+        self.assertEqual(next(rows).name, "Joe")
+        self.assertEqual(len(before), 1)
+        self.assertEqual(after, [])
+        self.assertEqual([model.name for model in rows], ["Bob"])
+
+        event = after[0]
+        self.assertIs(event, before[0])
+        self.assertEqual(event.sql, "SELECT * FROM `users` ORDER BY `users`.`id` ASC")
+        self.assertEqual(event.rows, 2)
+        self.assertGreaterEqual(event.duration, 0)
+
+        rows = self.get_builder().lazy(chunk_size=1)
+        next(rows)
+        rows.close()
+        self.assertEqual(after[1].rows, 1)
+
+    def test_query_counter_counts_streamed_queries(self):
+        with QueryCounter(threshold=10) as counter:
+            list(self.get_builder().cursor())
+            list(self.get_builder().where("id", 1).lazy())
+
+        self.assertEqual(counter.total, 2)
+
+    def test_forgetting_the_last_listener_disables_the_events(self):
+        listener = QueryEvents.listen("after", mock.Mock())
+        self.assertTrue(QueryEvents.enabled)
+
+        QueryEvents.forget("after", listener)
+
+        self.assertFalse(QueryEvents.enabled)
+        with self.assertRaises(ValueError):
+            QueryEvents.listen("during", listener)
+
+    def test_slow_query_log(self):
+        with SlowQueryLog(threshold=0):
+            with self.assertLogs("masonite.orm.queries", "WARNING") as logs:
+                self.get_builder().values_list("name")
+
+        self.assertIn("SELECT `users`.`name` FROM `users`", logs.output[0])
+        self.assertFalse(QueryEvents.enabled)
+
+    def test_query_counter_flags_repeated_shapes(self):
+        violations = []
+        with QueryCounter(
+            threshold=2, on_violation=lambda *args: violations.append(args)
+        ) as counter:
+            for _ in range(4):
+                self.get_builder().where("id", 1).first()
+            self.get_builder().where("id", 2).update({"name": "Bill"})
+
+            thread = threading.Thread(
+                target=lambda: SQLiteConnection().query("SELECT 1", ())
+            )
+            thread.start()
+            thread.join()
+
+        shape = "SELECT * FROM `users` WHERE `users`.`id` = '?' LIMIT 1"
+        self.assertEqual(violations, [(shape, 3)])
+        self.assertEqual(counter.violations, {shape: 4})
+        self.assertEqual(counter.total, 5)
+        self.assertEqual(
+            counter.get_shape("UPDATE `users` SET `name` = 'Bill' WHERE `id` = '2'"),
+            "UPDATE `users` SET `name` = '?' WHERE `id` = '?'",
+        )
@@ -14,3 +14,24 @@ class TestMySQLInsertGrammar(unittest.TestCase):
 
         sql = "INSERT INTO [users] ([users].[name]) VALUES ('Joe')"
         self.assertEqual(to_sql, sql)
+
+    def test_can_compile_bulk_insert(self):
+        builder = self.builder.insert_many(
+            [{"name": "Joe"}, {"name": "Bob"}], query=True
+        )
+
+        sql = "INSERT INTO [users] ([users].[name]) VALUES ('?'), ('?')"
+        self.assertEqual(builder.to_qmark(), sql)
+        self.assertEqual(builder._bindings, ("Joe", "Bob"))
+
+    def test_can_compile_upsert(self):
+        builder = self.builder.upsert([{"id": 1, "name": "Joe"}], "id", query=True)
+
+        sql = (
+            "MERGE INTO [users] AS [target] USING (VALUES ('?', '?')) AS [source] ([id], [name]) "
+            "ON [target].[id] = [source].[id] "
+            "WHEN MATCHED THEN UPDATE SET [target].[name] = [source].[name] "
+            "WHEN NOT MATCHED THEN INSERT ([id], [name]) VALUES ([source].[id], [source].[name]);"
+        )
+        self.assertEqual(builder.to_qmark(), sql)
+        self.assertEqual(builder._bindings, (1, "Joe"))
@@ -1,5 +1,6 @@
 import inspect
 import unittest
+from unittest import mock
 
 from src.masonite.orm.builder import QueryBuilder
 from src.masonite.orm.grammar import MySQLGrammar
@@ -209,6 +210,22 @@ class BaseTestQueryBuilder:
         )()
         self.assertEqual(builder.to_sql(), sql)
 
+    def test_order_by_multiple_columns_with_limit(self):
+        builder = self.get_builder()
+        builder.order_by("email").order_by("name", "desc").limit(5)
+        self.assertEqual(
+            builder.to_sql(),
+            "SELECT * FROM `users` ORDER BY `users`.`email` ASC, `users`.`name` DESC LIMIT 5",
+        )
+
+    def test_group_by_multiple_columns(self):
+        builder = self.get_builder()
+        builder.group_by("email").group_by("name").order_by("email")
+        self.assertEqual(
+            builder.to_sql(),
+            "SELECT * FROM `users` GROUP BY `users`.`email`, `users`.`name` ORDER BY `users`.`email` ASC",
+        )
+
     def test_where_column(self):
         builder = self.get_builder()
         builder.where_column("name", "username")
@@ -348,6 +365,25 @@ class BaseTestQueryBuilder:
         )()
         self.assertEqual(builder.to_sql(), sql)
 
+    def test_insert_many_is_chunked_by_parameter_limit(self):
+        builder = self.get_builder()
+        rows = [{"name": "Joe", "age": age} for age in range(10)]
+        with mock.patch.object(self.grammar, "parameter_limit", 8):
+            with mock.patch.object(
+                builder.connection, "query", return_value=()
+            ) as query:
+                self.assertEqual(builder.insert_many(rows), 10)
+
+        self.assertEqual(query.call_count, 3)
+        sql, bindings = query.call_args_list[0][0]
+        self.assertEqual(len(bindings), 8)
+        self.assertEqual(bindings[:2], ("Joe", 0))
+        self.assertEqual(len(query.call_args_list[-1][0][1]), 4)
+
+    def test_insert_many_requires_same_columns(self):
+        with self.assertRaises(ValueError):
+            self.get_builder().insert_many([{"name": "Joe"}, {"email": "bob"}])
+
     def test_or_where(self):
         builder = self.get_builder()
         builder.where("age", "20").or_where("age", "<", 20)
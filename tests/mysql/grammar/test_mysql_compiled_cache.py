@@ -0,0 +1,127 @@
+import unittest
+
+from src.masonite.orm.builder import QueryBuilder
+from src.masonite.orm.grammar import BaseGrammar, GrammarFactory
+
+
+class TestMySQLCompiledCache(unittest.TestCase):
+    def setUp(self):
+        BaseGrammar.compiled_cache.clear()
+
+    def get_builder(self, table="users"):
+        return QueryBuilder(GrammarFactory.make("mysql"), table=table)
+
+    def test_same_shape_is_compiled_once(self):
+        first = self.get_builder().where("id", 1)
+        second = self.get_builder().where("id", 2)
+
+        self.assertEqual(first.to_qmark(), second.to_qmark())
+        self.assertEqual(first._bindings, (1,))
+        self.assertEqual(second._bindings, (2,))
+        self.assertEqual(BaseGrammar.compiled_cache.hits, 1)
+        self.assertEqual(BaseGrammar.compiled_cache.misses, 1)
+
+    def test_cached_bindings_match_a_fresh_compile(self):
+        def build():
+            return (
+                self.get_builder()
+                .select("name")
+                .where("age", ">", 18)
+                .where_in("id", [1, 2, 3])
+                .where_null("deleted_at")
+                .where_column("name", "username")
+                .or_where("email", "joe@masonite.com")
+                .order_by("name")
+                .limit(10)
+            )
+
+        fresh = build()
+        sql = fresh.to_qmark()
+        cached = build()
+
+        self.assertEqual(cached.to_qmark(), sql)
+        self.assertEqual(cached._bindings, fresh._bindings)
+        self.assertEqual(cached._bindings, (18, "1", "2", "3", "joe@masonite.com"))
+        self.assertEqual(BaseGrammar.compiled_cache.hits, 1)
+
+    def test_update_bindings_come_before_wheres(self):
+        self.get_builder().update({"name": "Bob"}, dry=True).where("id", 1).to_qmark()
+        builder = self.get_builder().update({"name": "Bill"}, dry=True).where("id", 2)
+
+        self.assertEqual(
+            builder.to_qmark(),
+            "UPDATE `users` SET `users`.`name` = '?' WHERE `users`.`id` = '?'",
+        )
+        self.assertEqual(builder._bindings, ("Bill", 2))
+        self.assertEqual(BaseGrammar.compiled_cache.hits, 1)
+
+    def test_different_shapes_are_cached_separately(self):
+        self.get_builder().where_in("id", [1, 2]).to_qmark()
+        builder = self.get_builder().where_in("id", [1, 2, 3])
+
+        self.assertEqual(
+            builder.to_qmark(),
+            "SELECT * FROM `users` WHERE `users`.`id` IN ('?', '?', '?')",
+        )
+        self.assertEqual(BaseGrammar.compiled_cache.misses, 2)
+
+    def test_null_wheres_have_no_bindings(self):
+        builder = self.get_builder().where_null("name").where_not_null("email")
+
+        self.assertEqual(
+            builder.to_qmark(),
+            "SELECT * FROM `users` WHERE `users`.`name` IS NULL AND `users`.`email` IS NOT NULL",
+        )
+        self.assertEqual(builder._bindings, ())
+
+    def test_subselects_are_cached_by_shape(self):
+        def build(votes, name):
+            return (
+                self.get_builder()
+                .where_in(
+                    "id",
+                    self.get_builder("posts")
+                    .select("user_id")
+                    .where("votes", ">", votes),
+                )
+                .where("name", name)
+            )
+
+        build(10, "Joe").to_qmark()
+        builder = build(20, "Bob")
+
+        self.assertEqual(
+            builder.to_qmark(),
+            "SELECT * FROM `users` WHERE `users`.`id` IN (SELECT `posts`.`user_id` "
+            "FROM `posts` WHERE `posts`.`votes` > '?') AND `users`.`name` = '?'",
+        )
+        self.assertEqual(builder._bindings, (20, "Bob"))
+        self.assertEqual(BaseGrammar.compiled_cache.misses, 2)
+        self.assertEqual(BaseGrammar.compiled_cache.hits, 1)
+
+    def test_nested_bindings_follow_the_sql_order(self):
+        def build():
+            return (
+                self.get_builder()
+                .where("age", ">", 18)
+                .where(lambda query: query.where("name", "Joe").or_where("name", "Bob"))
+                .where_raw("`users`.`score` > '?'", [5])
+                .between("age", 1, 9)
+                .group_by("name")
+                .having("count", 2)
+            )
+
+        fresh = build()
+        sql = fresh.to_qmark()
+        cached = build()
+
+        self.assertEqual(
+            sql,
+            "SELECT * FROM `users` WHERE `users`.`age` > '?' AND ( `users`.`name` = '?' "
+            "OR `users`.`name` = '?') AND `users`.`score` > '?' AND `users`.`age` "
+            "BETWEEN '?' AND '?' GROUP BY `users`.`name` HAVING `users`.`count` = '?'",
+        )
+        self.assertEqual(cached.to_qmark(), sql)
+        self.assertEqual(fresh._bindings, (18, "Joe", "Bob", 5, 1, 9, 2))
+        self.assertEqual(cached._bindings, fresh._bindings)
+        self.assertEqual(BaseGrammar.compiled_cache.hits, 1)
@@ -24,6 +24,36 @@ class BaseInsertGrammarTest:
         )()
         self.assertEqual(to_sql, sql)
 
+    def test_can_compile_bulk_insert(self):
+        to_sql = self.builder.insert_many(
+            [{"name": "Joe", "age": 1}, {"age": 2, "name": "Bob"}], query=True
+        ).to_sql()
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
+    def test_can_compile_bulk_insert_qmark(self):
+        builder = self.builder.create([{"name": "Joe"}, {"name": "Bob"}], query=True)
+
+        sql, bindings = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(builder.to_qmark(), sql)
+        self.assertEqual(builder._bindings, bindings)
+
+    def test_can_compile_upsert(self):
+        builder = self.builder.upsert(
+            [{"id": 1, "name": "Joe"}, {"id": 2, "name": "Bob"}], "id", query=True
+        )
+
+        sql, bindings = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(builder.to_qmark(), sql)
+        self.assertEqual(builder._bindings, bindings)
+
 
 class TestMySQLUpdateGrammar(BaseInsertGrammarTest, unittest.TestCase):
 
@@ -42,3 +72,30 @@ class TestMySQLUpdateGrammar(BaseInsertGrammarTest, unittest.TestCase):
         self.builder.create(name="Joe").to_sql()
         """
         return "INSERT INTO `users` (`users`.`name`) VALUES ('Joe')"
+
+    def can_compile_bulk_insert(self):
+        """
+        self.builder.insert_many([
+            {"name": "Joe", "age": 1}, {"age": 2, "name": "Bob"}
+        ]).to_sql()
+        """
+        return "INSERT INTO `users` (`users`.`name`, `users`.`age`) VALUES ('Joe', '1'), ('Bob', '2')"
+
+    def can_compile_bulk_insert_qmark(self):
+        """
+        self.builder.create([{"name": "Joe"}, {"name": "Bob"}]).to_qmark()
+        """
+        return (
+            "INSERT INTO `users` (`users`.`name`) VALUES ('?'), ('?')",
+            ("Joe", "Bob"),
+        )
+
+    def can_compile_upsert(self):
+        """
+        self.builder.upsert([{"id": 1, "name": "Joe"}, {"id": 2, "name": "Bob"}], "id").to_qmark()
+        """
+        return (
+            "INSERT INTO `users` (`id`, `name`) VALUES ('?', '?'), ('?', '?') "
+            "ON DUPLICATE KEY UPDATE `name` = VALUES(`name`)",
+            (1, "Joe", 2, "Bob"),
+        )
@@ -9,6 +9,18 @@ class BaseTestCaseUpdateGrammar:
     def setUp(self):
         self.builder = QueryBuilder(GrammarFactory.make(self.grammar), table="users")
 
+    def test_can_compile_bulk_update(self):
+        to_sql = self.builder.bulk_update(
+            [{"id": 1, "name": "Joe", "age": 1}, {"id": 2, "name": "Bob", "age": 2}],
+            columns=["name"],
+            query=True,
+        ).to_sql()
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
     def test_can_compile_update(self):
         to_sql = (
             self.builder.where("name", "bob").update({"name": "Joe"}, dry=True).to_sql()
@@ -96,3 +108,14 @@ class TestMySQLUpdateGrammar(BaseTestCaseUpdateGrammar, unittest.TestCase):
         builder.decrement('age', 20).to_sql()
         """
         return "UPDATE `users` SET `users`.`age` = `users`.`age` - '20'"
+
+    def can_compile_bulk_update(self):
+        """
+        self.builder.bulk_update([
+            {"id": 1, "name": "Joe", "age": 1}, {"id": 2, "name": "Bob", "age": 2}
+        ], columns=["name"]).to_sql()
+        """
+        return (
+            "UPDATE `users` SET `users`.`name` = CASE `users`.`id` WHEN '1' THEN 'Joe' "
+            "WHEN '2' THEN 'Bob' ELSE `users`.`name` END WHERE `users`.`id` IN ('1', '2')"
+        )
@@ -50,3 +50,34 @@ class TestMySQLScopes(unittest.TestCase):
         self.assertEqual(
             sql, User.apply_scope(TimeStamps).create({"name": "Joe"}, query=True)
         )
+
+    def test_can_use_global_scopes_on_bulk_create(self):
+        sql = "INSERT INTO `users` (`users`.`name`, `users`.`updated_at`, `users`.`created_at`) VALUES ('Joe', 'now', 'now'), ('Bob', 'now', 'now')"
+        self.assertEqual(
+            sql,
+            User.apply_scope(TimeStamps).create(
+                [{"name": "Joe"}, {"name": "Bob"}], query=True
+            ),
+        )
+
+    def test_scopes_apply_to_the_builder_they_are_chained_on(self):
+        active = User.active(1)
+        women = User.where("name", "joe").gender("W")
+
+        self.assertEqual(active.to_sql(), User.where("active", 1).to_sql())
+        self.assertEqual(
+            women.to_sql(), User.where("name", "joe").where("gender", "W").to_sql()
+        )
+
+    def test_scopes_are_registered_on_the_model_builder(self):
+        first, second = User.builder, User.builder
+
+        self.assertIn("active", User._builder._scopes)
+        self.assertIsNot(first._scopes, second._scopes)
+        self.assertIsNot(first._updates, second._updates)
+
+        first._scopes["inactive"] = User
+        first._updates["name"] = "Joe"
+        self.assertNotIn("inactive", User.builder._scopes)
+        self.assertEqual(second._updates, {})
+        self.assertEqual(User.async_query().active(1).to_sql(), User.active(1).to_sql())
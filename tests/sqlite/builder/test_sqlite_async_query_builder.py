@@ -0,0 +1,211 @@
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+from src.masonite.orm.builder import AsyncQueryBuilder, QueryBuilder
+from src.masonite.orm.connections import transaction
+from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
+from src.masonite.orm.grammar import GrammarFactory
+from src.masonite.orm.models import Model
+from src.masonite.orm.relationships import has_many
+from tests.utils import use_sqlite_database
+
+
+class Task(Model):
+    __connection__ = "sqlite"
+    __table__ = "tasks"
+
+
+class Project(Model):
+    __connection__ = "sqlite"
+    __table__ = "projects"
+
+    @has_many("id", "project_id")
+    def tasks(self):
+        return Task
+
+
+class TestSQLiteAsyncQueryBuilder(unittest.TestCase):
+    def setUp(self):
+        use_sqlite_database(
+            self,
+            (
+                "CREATE TABLE projects (id INTEGER PRIMARY KEY, name VARCHAR(255))",
+                "CREATE TABLE tasks (id INTEGER PRIMARY KEY, project_id INTEGER)",
+                "INSERT INTO tasks (project_id) VALUES (1), (1), (2)",
+            ),
+            database="file",
+            pool={"max": 2},
+        )
+
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def get_builder(self):
+        return AsyncQueryBuilder(
+            GrammarFactory.make("sqlite"), SQLiteConnection, table="projects"
+        )
+
+    def names(self):
+        return QueryBuilder(
+            GrammarFactory.make("sqlite"), SQLiteConnection, table="projects"
+        ).pluck_column("name")
+
+    def test_queries_are_awaitable(self):
+        async def work():
+            await self.get_builder().create({"name": "Joe"})
+            await self.get_builder().create([{"name": "Bob"}, {"name": "Bill"}])
+            await self.get_builder().where("name", "Bob").update({"name": "Rob"})
+            await self.get_builder().where("name", "Bill").delete()
+
+            first = await self.get_builder().where("id", 2).first()
+            names = await self.get_builder().order_by("id").pluck_column("name")
+            models = await self.get_builder().get()
+            return first, names, models
+
+        first, names, models = self.run_async(work())
+
+        self.assertEqual(first.name, "Rob")
+        self.assertEqual(names, ["Joe", "Rob"])
+        self.assertEqual(models.count(), 2)
+
+    def test_queries_do_not_run_on_the_event_loop_thread(self):
+        threads = []
+        query = SQLiteConnection.query
+
+        def record(connection, *args, **kwargs):
+            threads.append(threading.current_thread())
+            return query(connection, *args, **kwargs)
+
+        with mock.patch.object(SQLiteConnection, "query", autospec=True) as patched:
+            patched.side_effect = record
+            self.run_async(self.get_builder().get())
+
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_async_iteration_streams_models(self):
+        async def work():
+            await self.get_builder().create([{"name": "Joe"}, {"name": "Bob"}])
+            return [project.name async for project in self.get_builder().order_by("id")]
+
+        self.assertEqual(self.run_async(work()), ["Joe", "Bob"])
+
+    def test_chunk(self):
+        seen = []
+
+        async def callback(projects):
+            seen.append(projects.pluck("id"))
+
+        async def work():
+            await self.get_builder().create([{"name": str(i)} for i in range(5)])
+            return await self.get_builder().chunk(2, callback)
+
+        self.assertTrue(self.run_async(work()))
+        self.assertEqual(seen, [[1, 2], [3, 4], [5]])
+
+    def test_model_async_query_eager_loads(self):
+        async def work():
+            await Project.async_query().create([{"name": "Joe"}, {"name": "Bob"}])
+            return await Project.async_query().with_("tasks").order_by("id").get()
+
+        projects = self.run_async(work())
+        self.assertEqual([len(project.tasks) for project in projects], [2, 1])
+
+    def test_model_async_query_streams_eager_loaded_models(self):
+        async def work():
+            await Project.async_query().create([{"name": "Joe"}, {"name": "Bob"}])
+            query = Project.async_query().with_("tasks").order_by("id").compact()
+            return [project async for project in query.lazy(chunk_size=1)]
+
+        projects = self.run_async(work())
+        self.assertEqual([project.name for project in projects], ["Joe", "Bob"])
+        self.assertEqual([len(project.tasks) for project in projects], [2, 1])
+        self.assertIsNone(projects[0]._dirty)
+
+    def test_update_and_delete_bind_their_values(self):
+        async def work():
+            await self.get_builder().create(
+                [{"name": "name{}".format(index)} for index in range(6)]
+            )
+            await self.get_builder().where_raw("`name` = '?'", ["name0"]).update(
+                {"name": "O'Brien"}
+            )
+            await self.get_builder().where_in(
+                "id", Project.select("id").where("name", "name1")
+            ).update({"name": "renamed"})
+            await self.get_builder().where(
+                lambda query: query.where("name", "name2").or_where("name", "name3")
+            ).where("id", "!=", 3).update({"name": "grouped"})
+            updated = await self.get_builder().order_by("id").pluck_column("name")
+
+            await self.get_builder().where_raw("`name` = '?'", ["O'Brien"]).delete()
+            await self.get_builder().where_in(
+                "id", Project.select("id").where("name", "renamed")
+            ).delete()
+            await self.get_builder().where(
+                lambda query: query.where("name", "name4").or_where("name", "name5")
+            ).where("id", "!=", 5).delete()
+            deleted = await self.get_builder().order_by("id").pluck_column("name")
+            return updated, deleted
+
+        updated, deleted = self.run_async(work())
+
+        self.assertEqual(
+            updated, ["O'Brien", "renamed", "name2", "grouped", "name4", "name5"]
+        )
+        self.assertEqual(deleted, ["name2", "grouped", "name4"])
+
+    def test_queries_are_refused_inside_a_transaction(self):
+        with self.assertRaises(ValueError):
+            with transaction("sqlite"):
+                Project.create({"name": "Joe"})
+                self.run_async(Project.async_query().create({"name": "Bob"}))
+
+        with self.assertRaises(RuntimeError):
+            with transaction("sqlite"):
+                Project.create({"name": "Bill"})
+                with self.assertRaises(ValueError):
+                    self.run_async(self.get_builder().pluck_column("name"))
+                raise RuntimeError
+
+        self.assertEqual(self.run_async(self.get_builder().pluck_column("name")), [])
+
+    def test_tasks_have_transactions_of_their_own(self):
+        seen = {}
+
+        async def write():
+            with self.assertRaises(RuntimeError):
+                with transaction("sqlite"):
+                    Project.create({"name": "Joe"})
+                    await asyncio.sleep(0)
+                    await asyncio.sleep(0)
+                    seen["write"] = self.names()
+                    raise RuntimeError
+
+        async def read():
+            with transaction("sqlite") as connection:
+                await asyncio.sleep(0)
+                seen["read"] = self.names()
+                seen["level"] = connection.transaction_level()
+
+        async def both():
+            await asyncio.gather(write(), read())
+
+        self.run_async(both())
+
+        self.assertEqual(seen, {"write": ["Joe"], "read": [], "level": 1})
+        self.assertEqual(self.names(), [])
+        self.assertEqual(SQLiteConnection().transaction_level(), 0)
+
+    def test_builds_the_same_sql_as_the_query_builder(self):
+        builder = QueryBuilder(GrammarFactory.make("sqlite"), table="projects")
+        self.assertEqual(
+            self.get_builder().where("id", 1).to_sql(), builder.where("id", 1).to_sql(),
+        )
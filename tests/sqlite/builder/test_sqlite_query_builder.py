@@ -0,0 +1,312 @@
+import threading
+import unittest
+from unittest import mock
+
+from src.masonite.orm.builder import QueryBuilder
+from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
+from src.masonite.orm.grammar import GrammarFactory
+from src.masonite.orm.models import QueryResult
+from tests.utils import use_sqlite_database
+
+
+class TestSQLiteQueryBuilder(unittest.TestCase):
+    def setUp(self):
+        use_sqlite_database(
+            self,
+            ("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(255))",),
+            database="file",
+        )
+
+    def get_builder(self):
+        return QueryBuilder(
+            GrammarFactory.make("sqlite"), SQLiteConnection, table="users"
+        )
+
+    def test_chunk_by_id_pages_by_key(self):
+        self.get_builder().insert_many(
+            [{"name": "user{}".format(index)} for index in range(25)]
+        )
+
+        with mock.patch.object(
+            SQLiteConnection,
+            "query",
+            autospec=True,
+            side_effect=SQLiteConnection.query,
+        ) as query:
+            chunks = list(
+                self.get_builder().where("id", ">", 3).order_by("name").chunk_by_id(10)
+            )
+
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 2])
+        self.assertEqual(chunks[1].first().id, 14)
+        statements = [call[0][1] for call in query.call_args_list]
+        self.assertEqual(len(set(statements)), 2)
+        self.assertEqual(
+            statements[1],
+            "SELECT * FROM `users` WHERE ( `users`.`id` > '?') AND `users`.`id` > '?' "
+            "ORDER BY `users`.`id` ASC LIMIT 10",
+        )
+        self.assertEqual(query.call_args_list[2][0][2], (3, 23))
+
+    def test_chunk_by_id_groups_or_wheres(self):
+        self.get_builder().insert_many(
+            [{"name": "user{}".format(index % 3)} for index in range(9)]
+        )
+
+        chunks = self.get_builder().where("name", "user0").or_where("name", "user1")
+        ids = [chunk.first().id for chunk in chunks.chunk_by_id(1)]
+
+        self.assertEqual(ids, [1, 2, 4, 5, 7, 8])
+
+    def test_chunk_by_id_binds_the_key_in_place(self):
+        self.get_builder().insert_many(
+            [{"name": "user{}".format(index % 3)} for index in range(9)]
+        )
+        builder = QueryBuilder(
+            GrammarFactory.make("sqlite"),
+            SQLiteConnection,
+            table="users",
+            global_scopes={
+                QueryResult: {
+                    "select": [lambda owner, query: query.where("name", "!=", "user2")]
+                }
+            },
+        )
+
+        ids = [chunk.first().id for chunk in builder.chunk_by_id(1)]
+
+        self.assertEqual(ids, [1, 2, 4, 5, 7, 8])
+
+    def test_chunk_stops_when_callback_returns_false(self):
+        self.get_builder().insert_many(
+            [{"name": "user{}".format(index)} for index in range(25)]
+        )
+        seen = []
+
+        def callback(models):
+            seen.extend(models.pluck("id"))
+            return False
+
+        self.assertFalse(self.get_builder().chunk(10, callback))
+        self.assertEqual(seen, list(range(1, 11)))
+
+    def test_values_fast_paths(self):
+        self.get_builder().insert_many([{"name": "Joe"}, {"name": "Bob"}])
+
+        self.assertEqual(
+            self.get_builder().order_by("id").values(),
+            [{"id": 1, "name": "Joe"}, {"id": 2, "name": "Bob"}],
+        )
+        self.assertEqual(
+            self.get_builder().where("id", 2).values_list("name", "id"), [("Bob", 2)]
+        )
+        self.assertEqual(
+            self.get_builder().order_by("id").pluck_column("name"), ["Joe", "Bob"]
+        )
+
+    def test_values_list_selects_only_the_requested_columns(self):
+        with mock.patch.object(
+            SQLiteConnection,
+            "query_tuples",
+            autospec=True,
+            return_value=(("name",), [("Joe",)]),
+        ) as query:
+            names = self.get_builder().values_list("name", flat=True)
+
+        self.assertEqual(names, ["Joe"])
+        self.assertEqual(query.call_args[0][1], "SELECT `users`.`name` FROM `users`")
+
+    def test_values_list_flat_requires_a_single_column(self):
+        with self.assertRaises(ValueError):
+            self.get_builder().values_list("id", "name", flat=True)
+
+    def test_remember_caches_results_until_the_table_is_written(self):
+        self.get_builder().create({"name": "Joe"})
+        self.addCleanup(QueryBuilder.result_cache.clear)
+
+        with mock.patch.object(
+            SQLiteConnection,
+            "query",
+            autospec=True,
+            side_effect=SQLiteConnection.query,
+        ) as query:
+            first = self.get_builder().remember(60).get()
+            second = self.get_builder().remember(60).get()
+            self.assertEqual(query.call_count, 1)
+            self.assertEqual(first.pluck("name"), second.pluck("name"))
+
+            self.get_builder().where("id", 1).update({"name": "Bob"})
+            third = self.get_builder().remember(60).get()
+
+        self.assertEqual(query.call_count, 3)
+        self.assertEqual(third.pluck("name"), ["Bob"])
+
+    def test_remember_is_forgotten_when_a_subquery_table_is_written(self):
+        SQLiteConnection().query(
+            "CREATE TABLE posts (id INTEGER PRIMARY KEY, user_id INTEGER)", ()
+        )
+        self.get_builder().insert_many([{"name": "Joe"}, {"name": "Bob"}])
+        self.addCleanup(QueryBuilder.result_cache.clear)
+
+        def authors():
+            posts = self.get_builder().table("posts").select("user_id")
+            return (
+                self.get_builder()
+                .where_in("id", posts)
+                .remember(60)
+                .pluck_column("name")
+            )
+
+        self.assertEqual(authors(), [])
+        self.get_builder().table("posts").create({"user_id": 2})
+        self.assertEqual(authors(), ["Bob"])
+
+    def test_remember_with_a_key(self):
+        self.get_builder().create({"name": "Joe"})
+        self.addCleanup(QueryBuilder.result_cache.clear)
+
+        self.get_builder().remember(60, key="names").pluck_column("name")
+        self.get_builder().create({"name": "Bob"})
+        self.assertEqual(
+            self.get_builder().remember(60, key="names").pluck_column("name"),
+            ["Joe", "Bob"],
+        )
+
+        QueryBuilder.result_cache.put("names", (("name",), [("cached",)]))
+        self.assertEqual(
+            self.get_builder().remember(60, key="names").pluck_column("name"),
+            ["cached"],
+        )
+
+    def test_submit_runs_on_a_worker_thread(self):
+        self.get_builder().insert_many([{"name": "Joe"}, {"name": "Bob"}])
+        builder = self.get_builder()
+
+        future = builder.where("name", "Bob").submit()
+        self.assertEqual(builder.to_sql(), "SELECT * FROM `users`")
+        self.assertEqual(future.result().pluck("name"), ["Bob"])
+
+    def test_gather_runs_queries_concurrently(self):
+        self.get_builder().insert_many(
+            [{"name": "user{}".format(index)} for index in range(5)]
+        )
+        started = threading.Barrier(2, timeout=5)
+        query = SQLiteConnection.query
+
+        def wait_for_each_other(connection, *args, **kwargs):
+            started.wait()
+            return query(connection, *args, **kwargs)
+
+        with mock.patch.object(SQLiteConnection, "query", autospec=True) as patched:
+            patched.side_effect = wait_for_each_other
+            largest, users = QueryBuilder.gather(
+                self.get_builder().max("id"), self.get_builder().where("id", "<", 3)
+            )
+
+        self.assertEqual(largest.pluck("id"), [5])
+        self.assertEqual(users.count(), 2)
+
+    def test_submit_is_refused_inside_a_transaction(self):
+        connection = SQLiteConnection()
+        connection.begin_transaction()
+        self.get_builder().create({"name": "Joe"})
+
+        with self.assertRaises(ValueError):
+            self.get_builder().submit("create", {"name": "Bob"})
+        with self.assertRaises(ValueError):
+            QueryBuilder.gather(self.get_builder(), self.get_builder())
+
+        connection.rollback()
+
+        self.assertEqual(self.get_builder().pluck_column("name"), [])
+        self.assertEqual(self.get_builder().submit("pluck_column", "name").result(), [])
+
+    def test_submit_first(self):
+        self.get_builder().create({"name": "Joe"})
+        future = self.get_builder().where("name", "Joe").submit("first")
+        self.assertEqual(future.result().id, 1)
+
+    def test_bulk_update_round_trip(self):
+        self.get_builder().insert_many(
+            [{"name": "user{}".format(index)} for index in range(5)]
+        )
+
+        with mock.patch.object(
+            SQLiteConnection,
+            "query",
+            autospec=True,
+            side_effect=SQLiteConnection.query,
+        ) as query:
+            updated = self.get_builder().bulk_update(
+                [{"id": index, "name": "renamed{}".format(index)} for index in (2, 4)]
+                + [{"id": 5, "name": "renamed5"}],
+                chunk_size=2,
+            )
+
+        self.assertEqual(updated, 3)
+        self.assertEqual(query.call_count, 2)
+        self.assertEqual(
+            self.get_builder().order_by("id").pluck_column("name"),
+            ["user0", "renamed2", "user2", "renamed4", "renamed5"],
+        )
+
+    def test_upsert_round_trip(self):
+        self.get_builder().insert_many([{"name": "Joe"}, {"name": "Bob"}])
+
+        upserted = self.get_builder().upsert(
+            [{"id": 2, "name": "Bill"}, {"id": 3, "name": "Jane"}], "id"
+        )
+
+        self.assertEqual(upserted, 2)
+        self.assertEqual(
+            self.get_builder().order_by("id").values_list("id", "name"),
+            [(1, "Joe"), (2, "Bill"), (3, "Jane")],
+        )
+
+    def test_update_and_delete_bind_their_values(self):
+        self.get_builder().insert_many(
+            [{"name": "user{}".format(index)} for index in range(6)]
+        )
+
+        with mock.patch.object(
+            SQLiteConnection,
+            "query",
+            autospec=True,
+            side_effect=SQLiteConnection.query,
+        ) as query:
+            self.get_builder().where_raw("`name` = '?'", ["user0"]).update(
+                {"name": "O'Brien"}
+            )
+            self.get_builder().where_in(
+                "id", self.get_builder().select("id").where("name", "user1")
+            ).update({"name": "renamed"})
+            self.get_builder().where(
+                lambda query: query.where("name", "user2").or_where("name", "user3")
+            ).where("id", "!=", 3).update({"name": "grouped"})
+
+            self.assertEqual(
+                [call[0][2] for call in query.call_args_list],
+                [
+                    ("O'Brien", "user0"),
+                    ("renamed", "user1"),
+                    ("grouped", "user2", "user3", 3),
+                ],
+            )
+
+        self.assertEqual(
+            self.get_builder().order_by("id").pluck_column("name"),
+            ["O'Brien", "renamed", "user2", "grouped", "user4", "user5"],
+        )
+
+        self.get_builder().where_raw("`name` = '?'", ["O'Brien"]).delete()
+        self.get_builder().where_in(
+            "id", self.get_builder().select("id").where("name", "renamed")
+        ).delete()
+        self.get_builder().where(
+            lambda query: query.where("name", "user4").or_where("name", "user5")
+        ).where("id", "!=", 5).delete()
+
+        self.assertEqual(
+            self.get_builder().order_by("id").pluck_column("name"),
+            ["user2", "grouped", "user4"],
+        )
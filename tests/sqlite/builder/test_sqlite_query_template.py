@@ -0,0 +1,131 @@
+import unittest
+from unittest import mock
+
+from src.masonite.orm.builder import QueryBuilder, param
+from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
+from src.masonite.orm.grammar import GrammarFactory
+from src.masonite.orm.models import Model
+from src.masonite.orm.relationships import has_many
+from tests.utils import use_sqlite_database
+
+
+class Article(Model):
+    __connection__ = "sqlite"
+    __table__ = "articles"
+
+
+class User(Model):
+    __connection__ = "sqlite"
+    __table__ = "users"
+
+    @has_many("id", "user_id")
+    def articles(self):
+        return Article
+
+
+class TestSQLiteQueryTemplate(unittest.TestCase):
+    def setUp(self):
+        use_sqlite_database(
+            self,
+            (
+                "CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(255), email VARCHAR(255), is_admin INTEGER)",
+                "CREATE TABLE articles (id INTEGER PRIMARY KEY, user_id INTEGER)",
+                "INSERT INTO users (name, email, is_admin) VALUES ('Joe', 'joe@email.com', 1), ('Bob', 'bob@email.com', 0), ('Bill', 'bill@email.com', 1)",
+                "INSERT INTO articles (user_id) VALUES (1), (1), (2)",
+            ),
+        )
+
+    def test_first_binds_named_parameters(self):
+        find_by_email = User.where("email", param("email")).template("first")
+
+        self.assertEqual(find_by_email(email="bob@email.com").name, "Bob")
+        self.assertEqual(find_by_email(email="joe@email.com").id, 1)
+        self.assertEqual(
+            find_by_email.to_qmark(),
+            "SELECT * FROM `users` WHERE `users`.`email` = '?' LIMIT 1",
+        )
+
+    def test_calls_skip_building_and_compiling(self):
+        admins = (
+            User.where("is_admin", 1).where("id", ">", param("after")).order_by("id")
+        ).template()
+
+        with mock.patch.object(
+            QueryBuilder, "to_qmark", side_effect=AssertionError
+        ), mock.patch.object(
+            SQLiteConnection,
+            "query",
+            autospec=True,
+            side_effect=SQLiteConnection.query,
+        ) as query:
+            self.assertEqual(admins(after=0).pluck("name"), ["Joe", "Bill"])
+            self.assertEqual(admins(after=1).pluck("name"), ["Bill"])
+
+        self.assertEqual(query.call_args_list[1][0][2], (1, 1))
+
+    def test_parameters_must_match(self):
+        template = User.where("name", param("name")).template()
+
+        with self.assertRaises(TypeError):
+            template()
+        with self.assertRaises(TypeError):
+            template(name="Joe", email="joe@email.com")
+
+    def test_values_and_eager_loads(self):
+        names = User.where("is_admin", param("admin")).template("pluck_column", "name")
+        self.assertEqual(names(admin=0), ["Bob"])
+
+        rows = User.where("id", param("id")).template("values", "id", "name")
+        self.assertEqual(rows(id=3), [{"id": 3, "name": "Bill"}])
+
+        with_articles = (
+            User.with_("articles").where("id", param("id")).template("first")
+        )
+        self.assertEqual(len(with_articles(id=1).articles), 2)
+
+    def test_compact_templates(self):
+        users = User.where("is_admin", param("admin")).compact().template()
+        self.assertEqual(users(admin=1).pluck("id"), [1, 3])
+
+        first = User.where("name", param("name")).compact().template("first")
+        self.assertEqual(first(name="Bob")._values, (2, "Bob", "bob@email.com", 0))
+
+    def test_parameters_in_between_clauses_and_subqueries(self):
+        def builder(table):
+            return QueryBuilder(GrammarFactory.make("sqlite"), SQLiteConnection, table)
+
+        articles = (
+            builder("articles").select("user_id").where("id", ">", param("after"))
+        )
+        names = (
+            builder("users")
+            .between("id", param("low"), param("high"))
+            .where_in("id", articles)
+            .order_by("id")
+            .template("pluck_column", "name")
+        )
+
+        self.assertEqual(names(low=1, high=3, after=2), ["Bob"])
+        self.assertEqual(names(low=1, high=3, after=0), ["Joe", "Bob"])
+
+    def test_list_parameters(self):
+        by_ids = User.where_in("id", param("ids")).order_by("id").template()
+        not_admins = (
+            User.where("is_admin", 0)
+            .where_not_in("id", [param("first"), 3])
+            .order_by("id")
+            .template("pluck_column", "name")
+        )
+
+        self.assertEqual(by_ids(ids=[1, 3]).pluck("name"), ["Joe", "Bill"])
+        self.assertEqual(by_ids(ids=(2,)).pluck("name"), ["Bob"])
+        self.assertEqual(
+            by_ids.expand(ids=[1, 2, 3]),
+            "SELECT * FROM `users` WHERE `users`.`id` IN ('?', '?', '?') ORDER BY `users`.`id` ASC",
+        )
+        self.assertEqual(not_admins(first=1), ["Bob"])
+        self.assertEqual(not_admins(first=2), [])
+        with self.assertRaises(ValueError):
+            by_ids(ids=[])
+        with self.assertRaises(ValueError):
+            by_ids(ids=1)
@@ -0,0 +1,135 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from src.masonite.orm.builder import QueryBuilder
+from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
+from src.masonite.orm.grammar import GrammarFactory
+
+
+class FileSQLiteConnection(SQLiteConnection):
+    pass
+
+
+class TestSQLiteConnection(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        FileSQLiteConnection.set_connection_settings(
+            {
+                "driver": "sqlite",
+                "database": os.path.join(self.directory, "orm.db"),
+                "pragmas": {
+                    "journal_mode": "WAL",
+                    "synchronous": "NORMAL",
+                    "cache_size": -2000,
+                },
+            }
+        )
+        FileSQLiteConnection().query(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(255))", ()
+        )
+
+    def tearDown(self):
+        FileSQLiteConnection().close()
+        shutil.rmtree(self.directory)
+
+    def get_builder(self):
+        return QueryBuilder(
+            GrammarFactory.make("sqlite"), FileSQLiteConnection, table="users"
+        )
+
+    def test_handle_is_reused_across_queries(self):
+        first = FileSQLiteConnection().make_connection()._connection
+        second = FileSQLiteConnection().make_connection()._connection
+
+        self.assertIs(first, second)
+
+    def test_query_does_not_close_the_handle(self):
+        connection = FileSQLiteConnection().make_connection()._connection
+        FileSQLiteConnection().query("SELECT 1", ())
+
+        self.assertEqual(connection.execute("SELECT 1").fetchone()[0], 1)
+
+    def test_pragmas_are_applied(self):
+        connection = FileSQLiteConnection()
+        self.assertEqual(
+            connection.query("PRAGMA journal_mode", (), results=1),
+            {"journal_mode": "wal"},
+        )
+        self.assertEqual(
+            connection.query("PRAGMA cache_size", (), results=1), {"cache_size": -2000}
+        )
+
+    def test_threads_get_their_own_handle(self):
+        handles = []
+
+        def work():
+            connection = FileSQLiteConnection()
+            handles.append(connection.make_connection()._connection)
+            connection.close()
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(
+            handles[0], FileSQLiteConnection().make_connection()._connection
+        )
+
+    def test_builder_round_trip(self):
+        self.get_builder().create({"name": "Joe"})
+        self.get_builder().create({"name": "Bob"})
+        self.get_builder().where("name", "Bob").update({"name": "Bill"})
+
+        self.assertEqual(self.get_builder().where("name", "Joe").first().id, 1)
+        self.assertEqual(
+            self.get_builder().order_by("id").get().pluck("name"), ["Joe", "Bill"]
+        )
+
+        self.get_builder().delete("name", "Joe")
+        self.assertEqual(self.get_builder().get().count(), 1)
+
+    def test_nested_queries_are_bound(self):
+        self.get_builder().insert_many([{"name": "Joe"}, {"name": "Bob"}])
+        builder = (
+            self.get_builder()
+            .where_in("id", self.get_builder().select("id").where("name", "Bob"))
+            .where_raw("`users`.`id` > '?'", [1])
+        )
+
+        self.assertEqual(builder.get().pluck("name"), ["Bob"])
+
+    def test_insert_many_round_trip(self):
+        inserted = self.get_builder().insert_many(
+            [{"name": "user{}".format(index)} for index in range(2500)], chunk_size=1000
+        )
+
+        self.assertEqual(inserted, 2500)
+        self.assertEqual(self.get_builder().get().count(), 2500)
+
+    def test_stream_yields_rows(self):
+        self.get_builder().insert_many([{"name": "Joe"}, {"name": "Bob"}])
+        rows = FileSQLiteConnection().stream(
+            "SELECT * FROM users ORDER BY id", (), chunk_size=1
+        )
+
+        self.assertEqual(next(rows), {"id": 1, "name": "Joe"})
+        self.assertEqual(list(rows), [{"id": 2, "name": "Bob"}])
+
+    def test_builder_cursor_hydrates_models(self):
+        self.get_builder().insert_many(
+            [{"name": "user{}".format(index)} for index in range(25)]
+        )
+        models = self.get_builder().where("id", ">", 20).cursor()
+
+        self.assertEqual([model.id for model in models], [21, 22, 23, 24, 25])
+
+    def test_builder_lazy_compiles_before_iterating(self):
+        self.get_builder().insert_many([{"name": "Joe"}, {"name": "Bob"}])
+        builder = self.get_builder()
+        models = builder.where("name", "Bob").lazy(chunk_size=1)
+        builder.where("name", "Joe")
+
+        self.assertEqual([model.name for model in models], ["Bob"])
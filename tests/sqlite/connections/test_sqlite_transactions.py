@@ -0,0 +1,84 @@
+import unittest
+from unittest import mock
+
+from config.database import CONNECTIONS
+from src.masonite.orm.builder import QueryBuilder
+from src.masonite.orm.connections import transaction
+from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
+from src.masonite.orm.grammar import GrammarFactory
+from tests.utils import use_sqlite_database
+
+
+class TestSQLiteTransactions(unittest.TestCase):
+    def setUp(self):
+        use_sqlite_database(
+            self, ("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(255))",)
+        )
+
+    def get_builder(self):
+        return QueryBuilder(
+            GrammarFactory.make("sqlite"), SQLiteConnection, table="users"
+        )
+
+    def names(self):
+        return self.get_builder().order_by("id").pluck_column("name")
+
+    def test_commits_when_the_block_finishes(self):
+        with transaction("sqlite") as connection:
+            self.get_builder().create({"name": "Joe"})
+            self.assertEqual(connection.transaction_level(), 1)
+
+        self.assertEqual(self.names(), ["Joe"])
+        self.assertEqual(SQLiteConnection().transaction_level(), 0)
+
+    def test_rolls_back_when_the_block_raises(self):
+        with self.assertRaises(RuntimeError):
+            with transaction("sqlite"):
+                self.get_builder().create({"name": "Joe"})
+                raise RuntimeError
+
+        self.assertEqual(self.names(), [])
+
+    def test_nested_transactions_use_savepoints(self):
+        with transaction("sqlite") as connection:
+            self.get_builder().create({"name": "Joe"})
+            with self.assertRaises(RuntimeError):
+                with transaction("sqlite"):
+                    self.assertEqual(connection.transaction_level(), 2)
+                    self.get_builder().create({"name": "Bob"})
+                    raise RuntimeError
+
+            with transaction("sqlite"):
+                self.get_builder().create({"name": "Bill"})
+
+        self.assertEqual(self.names(), ["Joe", "Bill"])
+
+    def test_can_be_used_as_a_decorator(self):
+        @transaction("sqlite")
+        def create_users():
+            self.get_builder().create({"name": "Joe"})
+            self.get_builder().create({"name": "Bob"})
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            create_users()
+
+        self.assertEqual(self.names(), [])
+
+    def test_can_be_used_as_a_decorator_without_arguments(self):
+        @transaction
+        def create_users():
+            self.get_builder().create({"name": "Joe"})
+            self.assertEqual(SQLiteConnection().transaction_level(), 1)
+            raise RuntimeError
+
+        with mock.patch.dict(CONNECTIONS, {"default": "sqlite"}):
+            with self.assertRaises(RuntimeError):
+                create_users()
+
+        self.assertEqual(create_users.__name__, "create_users")
+        self.assertEqual(self.names(), [])
+
+    def test_commit_without_a_transaction_raises(self):
+        with self.assertRaises(ValueError):
+            SQLiteConnection().commit()
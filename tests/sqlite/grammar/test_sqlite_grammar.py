@@ -0,0 +1,113 @@
+import unittest
+
+from src.masonite.orm.builder import QueryBuilder
+from src.masonite.orm.grammar import GrammarFactory
+
+
+class TestSQLiteGrammar(unittest.TestCase):
+    def setUp(self):
+        self.builder = QueryBuilder(GrammarFactory.make("sqlite"), table="users")
+
+    def test_can_compile_select_with_where(self):
+        to_sql = self.builder.select("username").where("id", 1).to_sql()
+        self.assertEqual(
+            to_sql, "SELECT `users`.`username` FROM `users` WHERE `users`.`id` = '1'"
+        )
+
+    def test_can_compile_between_after_a_where(self):
+        to_sql = self.builder.where("name", "Joe").between("age", 18, 30).to_sql()
+        self.assertEqual(
+            to_sql,
+            "SELECT * FROM `users` WHERE `users`.`name` = 'Joe' AND `users`.`age` BETWEEN '18' AND '30'",
+        )
+
+    def test_spaces_inside_values_are_kept(self):
+        to_sql = self.builder.where("name", "Joe  Smith ").to_sql()
+        self.assertEqual(
+            to_sql, "SELECT * FROM `users` WHERE `users`.`name` = 'Joe  Smith '"
+        )
+
+    def test_can_compile_or_where_null(self):
+        to_sql = self.builder.where("name", "Joe").or_where("email", None).to_sql()
+        self.assertEqual(
+            to_sql,
+            "SELECT * FROM `users` WHERE `users`.`name` = 'Joe' OR `users`.`email` IS NULL",
+        )
+
+    def test_can_compile_where_after_a_raw_where(self):
+        to_sql = self.builder.where_raw("`age` > 18").where("name", "Joe").to_sql()
+        self.assertEqual(
+            to_sql, "SELECT * FROM `users` WHERE `age` > 18 AND `users`.`name` = 'Joe'"
+        )
+
+    def test_can_compile_insert(self):
+        to_sql = self.builder.create({"name": "Joe"}, query=True).to_sql()
+        self.assertEqual(to_sql, "INSERT INTO `users` (`name`) VALUES ('Joe')")
+
+    def test_can_compile_bulk_insert(self):
+        to_sql = self.builder.insert_many(
+            [{"name": "Joe"}, {"name": "Bob"}], query=True
+        ).to_sql()
+        self.assertEqual(to_sql, "INSERT INTO `users` (`name`) VALUES ('Joe'), ('Bob')")
+
+    def test_can_compile_update(self):
+        to_sql = (
+            self.builder.update({"name": "Joe", "age": 1}, dry=True)
+            .where("id", 1)
+            .to_sql()
+        )
+        self.assertEqual(
+            to_sql,
+            "UPDATE `users` SET `name` = 'Joe', `age` = '1' WHERE `users`.`id` = '1'",
+        )
+
+    def test_can_compile_offset_without_limit(self):
+        to_sql = self.builder.offset(5).to_sql()
+        self.assertEqual(to_sql, "SELECT * FROM `users` LIMIT -1 OFFSET 5")
+
+    def test_can_compile_join(self):
+        to_sql = self.builder.join(
+            "profiles", "users.id", "=", "profiles.user_id"
+        ).to_sql()
+        self.assertEqual(
+            to_sql,
+            "SELECT * FROM `users` INNER JOIN `profiles` ON `users`.`id` = `profiles`.`user_id`",
+        )
+
+    def test_can_compile_upsert(self):
+        to_sql = self.builder.upsert(
+            [{"email": "joe@email.com", "name": "Joe"}], "email", query=True
+        ).to_sql()
+        self.assertEqual(
+            to_sql,
+            "INSERT INTO `users` (`email`, `name`) VALUES ('joe@email.com', 'Joe') "
+            "ON CONFLICT (`email`) DO UPDATE SET `name` = excluded.`name`",
+        )
+
+    def test_can_compile_bulk_update(self):
+        builder = self.builder.bulk_update(
+            [{"id": 1, "name": "Joe"}, {"id": 2, "name": "Bob"}], query=True
+        )
+        self.assertEqual(
+            builder.to_qmark(),
+            "UPDATE `users` SET `name` = CASE `users`.`id` WHEN '?' THEN '?' "
+            "WHEN '?' THEN '?' ELSE `users`.`name` END WHERE `users`.`id` IN ('?', '?')",
+        )
+        self.assertEqual(builder._bindings, (1, "Joe", 2, "Bob", 1, 2))
+
+    def test_bulk_update_requires_the_key(self):
+        with self.assertRaises(ValueError):
+            self.builder.bulk_update([{"name": "Joe"}], query=True)
+
+    def test_can_compile_many_predicates(self):
+        for index in range(250):
+            self.builder.where("age", ">", index)
+
+        grammar = self.builder.get_grammar()
+        self.assertIsInstance(grammar._wheres, tuple)
+        self.assertEqual(
+            self.builder.to_qmark(),
+            "SELECT * FROM `users` WHERE "
+            + " AND ".join(["`users`.`age` > '?'"] * 250),
+        )
+        self.assertEqual(self.builder._bindings, tuple(range(250)))
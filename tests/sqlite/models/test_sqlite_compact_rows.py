@@ -0,0 +1,120 @@
+import unittest
+
+from src.masonite.orm.models import Model
+from src.masonite.orm.models.CompactRow import CompactRow
+from src.masonite.orm.relationships import has_many
+from tests.utils import use_sqlite_database
+
+
+class Post(Model):
+    __connection__ = "sqlite"
+    __table__ = "posts"
+
+
+class Author(Model):
+    __connection__ = "sqlite"
+    __table__ = "authors"
+
+    @has_many("id", "author_id")
+    def posts(self):
+        return Post
+
+    def get_is_admin(self):
+        return "You are an admin"
+
+
+class TestSQLiteCompactRows(unittest.TestCase):
+    def setUp(self):
+        use_sqlite_database(
+            self,
+            (
+                "CREATE TABLE authors (id INTEGER PRIMARY KEY, name VARCHAR(255), is_admin INTEGER)",
+                "CREATE TABLE posts (id INTEGER PRIMARY KEY, author_id INTEGER)",
+                "INSERT INTO authors (name, is_admin) VALUES ('Joe', 1), ('Bob', 0)",
+                "INSERT INTO posts (author_id) VALUES (1), (1), (2)",
+            ),
+        )
+
+    def test_rows_are_slotted_model_instances(self):
+        authors = Author.order_by("id").compact().get()
+        author = authors.first()
+
+        self.assertIsInstance(author, Author)
+        self.assertEqual(author._values, (1, "Joe", 1))
+        self.assertEqual(author.name, "Joe")
+        self.assertEqual(authors.pluck("id"), [1, 2])
+        self.assertIs(type(author), type(authors.last()))
+
+    def test_row_classes_follow_the_selected_columns(self):
+        author = Author.select("name").compact().first()
+
+        self.assertEqual(author.__attributes__, {"name": "Joe"})
+        with self.assertRaises(AttributeError):
+            author.id
+
+    def test_dirty_attributes_are_tracked_after_the_first_write(self):
+        author = Author.where("id", 2).compact().first()
+        self.assertIsNone(author._dirty)
+
+        author.name = "Bill"
+
+        self.assertEqual(author.__dirty_attributes__, {"name": "Bill"})
+        self.assertEqual(author.serialize(), {"id": 2, "name": "Bill", "is_admin": 0})
+        self.assertEqual(
+            author.save(query=True),
+            "UPDATE `authors` SET `name` = 'Bill' WHERE `authors`.`id` = '2'",
+        )
+
+    def test_dirty_rows_are_saved_by_bulk_update(self):
+        authors = Author.order_by("id").compact().get()
+        authors.first().name = "Bill"
+        authors.last().is_admin = 1
+
+        self.assertEqual(Author.bulk_update(authors), 2)
+        self.assertEqual(
+            Author.order_by("id").values("name", "is_admin"),
+            [{"name": "Bill", "is_admin": 1}, {"name": "Bob", "is_admin": 1}],
+        )
+        self.assertEqual([author._dirty for author in authors], [{}, {}])
+        self.assertEqual(authors.first()._values, (1, "Bill", 1))
+        self.assertEqual(authors.last()._values, (2, "Bob", 1))
+
+    def test_bulk_updated_models_are_no_longer_dirty(self):
+        authors = Author.order_by("id").get()
+        authors.first().name = "Bill"
+        authors.first().is_admin = 0
+        authors.last().name = "Jane"
+
+        self.assertEqual(Author.bulk_update(authors, columns=["name"]), 2)
+        self.assertEqual(authors.first().__dirty_attributes__, {"is_admin": 0})
+        self.assertEqual(authors.first().__attributes__["name"], "Bill")
+        self.assertEqual(authors.last().__dirty_attributes__, {})
+        self.assertEqual(authors.last().__attributes__["name"], "Jane")
+
+    def test_saved_rows_are_no_longer_dirty(self):
+        author = Author.where("id", 2).compact().first()
+        author.name = "Bill"
+        author.save()
+
+        self.assertEqual(author._dirty, {})
+        self.assertEqual(author.name, "Bill")
+        self.assertEqual(Author.where("id", 2).values("name"), [{"name": "Bill"}])
+
+    def test_streamed_rows_are_compact(self):
+        authors = list(Author.order_by("id").compact().cursor())
+        with_posts = list(Author.with_("posts").order_by("id").compact().lazy(1))
+
+        self.assertEqual(
+            [author._values for author in authors], [(1, "Joe", 1), (2, "Bob", 0)]
+        )
+        self.assertIs(type(authors[0]), type(Author.compact().first()))
+        self.assertEqual([len(author.posts) for author in with_posts], [2, 1])
+        self.assertIsInstance(with_posts[0], CompactRow)
+
+    def test_casts_are_applied(self):
+        author = Author.compact().first()
+        self.assertEqual(author.is_admin, "You are an admin")
+
+    def test_relationships_can_be_eager_loaded(self):
+        authors = Author.with_("posts").order_by("id").compact().get()
+        self.assertEqual([len(author.posts) for author in authors], [2, 1])
@@ -0,0 +1,121 @@
+import threading
+import unittest
+from unittest import mock
+
+from src.masonite.orm.cache import IdentityMap
+from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
+from src.masonite.orm.models import Model
+from src.masonite.orm.relationships import belongs_to
+from tests.utils import use_sqlite_database
+
+
+class Member(Model):
+    __connection__ = "sqlite"
+    __table__ = "members"
+
+
+class Note(Model):
+    __connection__ = "sqlite"
+    __table__ = "notes"
+
+    @belongs_to("member_id", "id")
+    def member(self):
+        return Member
+
+
+class TestSQLiteIdentityMap(unittest.TestCase):
+    def setUp(self):
+        use_sqlite_database(
+            self,
+            (
+                "CREATE TABLE members (id INTEGER PRIMARY KEY, name VARCHAR(255))",
+                "CREATE TABLE notes (id INTEGER PRIMARY KEY, member_id INTEGER)",
+                "INSERT INTO members (name) VALUES ('Joe'), ('Bob'), ('Bill')",
+                "INSERT INTO notes (member_id) VALUES (1), (1), (2), (1)",
+            ),
+        )
+
+    def count_queries(self):
+        return mock.patch.object(
+            SQLiteConnection, "query", autospec=True, side_effect=SQLiteConnection.query
+        )
+
+    def test_find_returns_the_loaded_instance(self):
+        with IdentityMap(), self.count_queries() as query:
+            first = Member.find(1)
+            second = Member.find("1")
+
+        self.assertIs(first, second)
+        self.assertEqual(query.call_count, 1)
+
+    def test_find_without_an_identity_map_queries_every_time(self):
+        with self.count_queries() as query:
+            first = Member.find(1)
+            second = Member.find(1)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(query.call_count, 2)
+
+    def test_find_many_only_fetches_missing_keys(self):
+        with IdentityMap() as identity_map, self.count_queries() as query:
+            joe = Member.find(1)
+            members = Member.find([3, 1, 2, 4])
+
+        self.assertEqual(members.pluck("name"), ["Bill", "Joe", "Bob"])
+        self.assertIs(members.all()[1], joe)
+        self.assertEqual(query.call_count, 2)
+        self.assertEqual(query.call_args[0][2], ("3", "2", "4"))
+        self.assertEqual(len(identity_map), 0)
+
+    def test_models_loaded_by_queries_are_added(self):
+        with IdentityMap(), self.count_queries() as query:
+            members = Member.where("id", "<", 3).get()
+            self.assertIs(Member.find(2), members.last())
+
+        self.assertEqual(query.call_count, 1)
+
+    def test_queries_return_the_instances_in_the_map(self):
+        with IdentityMap():
+            joe = Member.find(1)
+            first = Member.where("id", 1).first()
+            again = Member.where("name", "Joe").first()
+            members = Member.order_by("id").get()
+
+        self.assertIs(first, joe)
+        self.assertIs(again, joe)
+        self.assertIs(members.first(), joe)
+        self.assertEqual(members.pluck("name"), ["Joe", "Bob", "Bill"])
+
+    def test_streamed_models_are_the_instances_in_the_map(self):
+        with IdentityMap():
+            joe = Member.find(1)
+            streamed = list(Member.order_by("id").cursor())
+            chunked = list(Member.order_by("id").lazy(chunk_size=2))
+
+        self.assertIs(streamed[0], joe)
+        self.assertEqual([member.name for member in streamed], ["Joe", "Bob", "Bill"])
+        for member, same in zip(chunked, streamed):
+            self.assertIs(member, same)
+
+    def test_belongs_to_lookups_reuse_instances(self):
+        notes = Note.order_by("id").get()
+
+        with IdentityMap(), self.count_queries() as query:
+            members = [note.member for note in notes]
+
+        self.assertEqual(query.call_count, 2)
+        self.assertIs(members[0], members[3])
+        self.assertEqual(members[2].name, "Bob")
+
+    def test_identity_maps_are_scoped_to_the_thread(self):
+        maps = []
+
+        with IdentityMap() as identity_map:
+            thread = threading.Thread(target=lambda: maps.append(IdentityMap.current()))
+            thread.start()
+            thread.join()
+
+            self.assertIs(IdentityMap.current(), identity_map)
+
+        self.assertEqual(maps, [None])
+        self.assertIsNone(IdentityMap.current())
@@ -0,0 +1,55 @@
+import threading
+import unittest
+
+from src.masonite.orm.models import Model
+
+
+class User(Model):
+    __connection__ = "sqlite"
+
+
+class TestSQLiteModelBuilder(unittest.TestCase):
+    def test_each_query_gets_its_own_builder(self):
+        joe = User.where("name", "Joe")
+        bob = User.where("name", "Bob")
+
+        self.assertIsNot(joe, bob)
+        self.assertEqual(
+            joe.to_sql(), "SELECT * FROM `users` WHERE `users`.`name` = 'Joe'"
+        )
+        self.assertEqual(User.get_builder().to_sql(), "SELECT * FROM `users`")
+
+    def test_templates_can_be_reused_with_clone(self):
+        admins = User.where("is_admin", 1)
+
+        self.assertEqual(
+            admins.clone().where("name", "Joe").to_sql(),
+            "SELECT * FROM `users` WHERE `users`.`is_admin` = '1' AND `users`.`name` = 'Joe'",
+        )
+        self.assertEqual(
+            admins.clone().where("name", "Bob").to_sql(),
+            "SELECT * FROM `users` WHERE `users`.`is_admin` = '1' AND `users`.`name` = 'Bob'",
+        )
+
+    def test_threads_do_not_share_where_clauses(self):
+        started = threading.Barrier(8, timeout=5)
+        queries = {}
+
+        def build(index):
+            builder = User.where("id", index)
+            started.wait()
+            builder.where("name", "user{}".format(index))
+            queries[index] = builder.to_sql()
+
+        threads = [threading.Thread(target=build, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for index, query in queries.items():
+            self.assertEqual(
+                query,
+                "SELECT * FROM `users` WHERE `users`.`id` = '{0}' "
+                "AND `users`.`name` = 'user{0}'".format(index),
+            )
@@ -0,0 +1,138 @@
+import unittest
+from unittest import mock
+
+from src.masonite.orm.collection import Collection
+from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
+from src.masonite.orm.models import Model
+from src.masonite.orm.relationships import belongs_to, has_many
+from tests.utils import use_sqlite_database
+
+
+class Profile(Model):
+    __connection__ = "sqlite"
+    __table__ = "profiles"
+
+
+class Comment(Model):
+    __connection__ = "sqlite"
+    __table__ = "comments"
+
+    @belongs_to("author_id", "id")
+    def author(self):
+        return User
+
+
+class Article(Model):
+    __connection__ = "sqlite"
+    __table__ = "articles"
+
+    @has_many("id", "article_id")
+    def comments(self):
+        return Comment
+
+
+class User(Model):
+    __connection__ = "sqlite"
+    __table__ = "users"
+
+    @belongs_to("id", "user_id")
+    def profile(self):
+        return Profile
+
+    @has_many("id", "user_id")
+    def articles(self):
+        return Article
+
+
+class TestSQLiteEagerLoading(unittest.TestCase):
+    def setUp(self):
+        use_sqlite_database(
+            self,
+            (
+                "CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(255))",
+                "CREATE TABLE profiles (id INTEGER PRIMARY KEY, user_id INTEGER)",
+                "CREATE TABLE articles (id INTEGER PRIMARY KEY, user_id INTEGER, title VARCHAR(255))",
+                "INSERT INTO users (name) VALUES ('Joe'), ('Bob'), ('Bill')",
+                "INSERT INTO profiles (user_id) VALUES (1), (2)",
+                "CREATE TABLE comments (id INTEGER PRIMARY KEY, article_id INTEGER, author_id INTEGER)",
+                "INSERT INTO articles (user_id, title) VALUES (1, 'a'), (1, 'b'), (2, 'c')",
+                "INSERT INTO comments (article_id, author_id) VALUES (1, 2), (1, 3), (3, 1)",
+            ),
+        )
+
+    def count_queries(self):
+        return mock.patch.object(
+            SQLiteConnection, "query", autospec=True, side_effect=SQLiteConnection.query
+        )
+
+    def test_has_many_runs_one_query_per_relationship(self):
+        with self.count_queries() as query:
+            users = User.with_("articles").order_by("id").get()
+            titles = [user.articles.pluck("title") for user in users]
+
+        self.assertEqual(query.call_count, 2)
+        self.assertEqual(titles, [["a", "b"], ["c"], []])
+        self.assertIsInstance(users.first().articles, Collection)
+
+    def test_belongs_to_attaches_a_single_model(self):
+        with self.count_queries() as query:
+            users = User.with_("profile", "articles").order_by("id").get()
+            profiles = [user.profile for user in users]
+
+        self.assertEqual(query.call_count, 3)
+        self.assertIsInstance(profiles[0], Profile)
+        self.assertEqual(profiles[1].user_id, 2)
+        self.assertIsNone(profiles[2])
+
+    def test_first_eager_loads(self):
+        with self.count_queries() as query:
+            user = User.with_("articles").where("name", "Bob").first()
+            user.articles
+
+        self.assertEqual(query.call_count, 2)
+        self.assertEqual(user.articles.pluck("title"), ["c"])
+
+    def test_eager_loads_do_not_leak_into_the_next_query(self):
+        User.with_("articles").get()
+        users = User.order_by("id").get()
+
+        self.assertEqual(users.first()._relationships, {})
+
+    def test_eager_loads_are_chunked_by_the_parameter_limit(self):
+        with mock.patch.object(
+            User.get_relationship("articles").fn(None).builder.grammar,
+            "parameter_limit",
+            2,
+        ):
+            with self.count_queries() as query:
+                users = User.with_("articles").get()
+
+        self.assertEqual(query.call_count, 3)
+        self.assertEqual(sum(len(user.articles) for user in users), 3)
+
+    def test_nested_eager_loads_run_one_query_per_level(self):
+        with self.count_queries() as query:
+            users = User.with_("articles.comments.author").order_by("id").get()
+            authors = [
+                [comment.author.name for comment in article.comments]
+                for user in users
+                for article in user.articles
+            ]
+
+        self.assertEqual(query.call_count, 4)
+        self.assertEqual(authors, [["Bob", "Bill"], [], ["Joe"]])
+
+    def test_nested_paths_share_their_parent_query(self):
+        with self.count_queries() as query:
+            users = User.with_("articles", "articles.comments", "profile").get()
+
+        self.assertEqual(query.call_count, 4)
+        self.assertEqual(len(users.first().articles.first().comments), 2)
+
+    def test_lazy_eager_loads_once_per_chunk(self):
+        with self.count_queries() as query:
+            users = User.with_("articles").order_by("id").lazy(chunk_size=2)
+            titles = [user.articles.pluck("title") for user in users]
+
+        self.assertEqual(query.call_count, 2)
+        self.assertEqual(titles, [["a", "b"], ["c"], []])
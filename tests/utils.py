@@ -1,5 +1,9 @@
+import os
+import shutil
+import tempfile
 from unittest import mock
 
+from config.database import CONNECTIONS
 from src.masonite.orm.connections.ConnectionFactory import ConnectionFactory
 from src.masonite.orm.connections.MySQLConnection import MySQLConnection
 from src.masonite.orm.connections.SQLiteConnection import SQLiteConnection
@@ -27,3 +31,30 @@ class MockConnectionFactory(ConnectionFactory):
         "sqlite": MockSQLiteConnection,
         "oracle": "",
     }
+
+
+def use_sqlite_database(test, statements=(), database=":memory:", **settings):
+    """Points the sqlite connection of a test at a fresh database and runs the statements on it.
+
+    The connection is closed and its settings restored when the test is cleaned up.
+
+    Arguments:
+        test {unittest.TestCase} -- The test using the database.
+
+    Keyword Arguments:
+        statements {tuple} -- Statements creating and seeding the tables. (default: {()})
+        database {string} -- The database, or "file" for a file in a temporary directory. (default: {":memory:"})
+    """
+    if database == "file":
+        directory = tempfile.mkdtemp()
+        test.addCleanup(shutil.rmtree, directory)
+        database = os.path.join(directory, "orm.db")
+
+    patched = mock.patch.dict(CONNECTIONS["sqlite"], dict(settings, database=database))
+    patched.start()
+    test.addCleanup(patched.stop)
+
+    SQLiteConnection.set_connection_settings(CONNECTIONS["sqlite"])
+    test.addCleanup(lambda: SQLiteConnection().close())
+    for statement in statements:
+        SQLiteConnection().query(statement, ())